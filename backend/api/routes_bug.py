@@ -94,13 +94,13 @@ async def create_bug(
         raise HTTPException(status_code=400, detail=str(e))
 
     credentials = decode_jira_auth(x_jira_auth, x_jira_base_url)
-    jira = get_issue_tracker("jira", skip_env_validation=True) if credentials else get_issue_tracker("jira")
+    jira = get_issue_tracker("jira", skip_env_validation=True, async_mode=True) if credentials else get_issue_tracker("jira", async_mode=True)
 
     # Step 1: Validar parent_key se for Sub-Bug (senão marcar como skipped)
     if request.issue_type == "sub_bug":
         try:
             # Validar se a issue pai existe
-            parent_issue = jira.get_issue(request.parent_key, ["summary"], credentials=credentials) if credentials else jira.get_issue(request.parent_key, ["summary"])
+            parent_issue = await jira.get_issue(request.parent_key, ["summary"], credentials=credentials) if credentials else await jira.get_issue(request.parent_key, ["summary"])
             result["steps"]["parent_validation"] = {
                 "success": True,
                 "data": {
@@ -162,7 +162,7 @@ async def create_bug(
     
     try:
         # Step 3: Criar issue no Jira
-        issue_data = jira.create_bug(
+        issue_data = await jira.create_bug(
             project_key=request.project_key,
             summary=organized_data["summary"],
             description=organized_data["description"],
@@ -198,7 +198,7 @@ async def create_bug(
                     file.content_type or "application/octet-stream"
                 ))
             
-            attachments = jira.upload_attachments(
+            attachments = await jira.upload_attachments(
                 issue_key=issue_data["key"],
                 files=files_data,
                 credentials=credentials,
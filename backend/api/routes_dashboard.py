@@ -1,12 +1,18 @@
 # backend/api/routes_dashboard.py
 
+import json
 from typing import Optional, Literal
 
 from fastapi import APIRouter, Header
-from fastapi.responses import JSONResponse
+from fastapi.responses import JSONResponse, StreamingResponse
 from pydantic import BaseModel, Field, validator
 
-from backend.services.dashboard_service import DashboardService
+from backend.services.dashboard_service import (
+    DashboardService,
+    GROUP_BY_TOP_N_MAX,
+    STATUS_TIME_PAGE_SIZE_MAX,
+    TREND_SPRINTS_MAX,
+)
 from backend.utils.jira_utils import decode_jira_auth
 
 router = APIRouter(prefix="/dashboard", tags=["Dashboard QA"])
@@ -38,11 +44,32 @@ class PeriodPayload(BaseModel):
         return v
 
 
+class DashboardFilters(BaseModel):
+    """Filtros do dashboard (action=dashboard): OR entre os valores de um campo, AND entre campos."""
+    components: Optional[list[str]] = Field(None, max_length=50, description="Componentes")
+    labels: Optional[list[str]] = Field(None, max_length=50, description="Labels")
+    assignees: Optional[list[str]] = Field(None, max_length=50, description="Responsáveis (nome de exibição; \"\" = sem responsável)")
+    priorities: Optional[list[str]] = Field(None, max_length=50, description="Prioridades")
+    statuses: Optional[list[str]] = Field(None, max_length=50, description="Status")
+
+
 class DashboardRequest(BaseModel):
     """Request do endpoint POST /dashboard."""
-    action: Literal["projects", "dashboard"] = Field(..., description="Ação: projects ou dashboard")
+    action: Literal["projects", "dashboard", "multi"] = Field(..., description="Ação: projects, dashboard ou multi")
     projectKey: Optional[str] = Field(None, description="Chave do projeto (obrigatório se action=dashboard)")
-    period: Optional[PeriodPayload] = Field(None, description="Período (obrigatório se action=dashboard)")
+    projectKeys: Optional[list[str]] = Field(
+        None, max_length=100, description="Chaves dos projetos (action=multi; omitido = todos os projetos visíveis)"
+    )
+    period: Optional[PeriodPayload] = Field(None, description="Período (obrigatório se action=dashboard ou multi)")
+    filters: Optional[DashboardFilters] = Field(
+        None, description="Filtros locais do dashboard (action=dashboard), sem nova busca no Jira por combinação"
+    )
+    groupBy: Optional[Literal["component", "label", "assignee", "priority", "status", "issuetype", "sprint"]] = Field(
+        None, description="Agrupamento (action=dashboard): métricas por grupo em data.breakdown"
+    )
+    topN: Optional[int] = Field(
+        None, ge=1, le=GROUP_BY_TOP_N_MAX, description="Grupos mantidos no breakdown (padrão 10); o restante vira other"
+    )
 
     @validator("projectKey", always=True)
     def validate_project_key_for_dashboard(cls, v, values):
@@ -52,8 +79,8 @@ class DashboardRequest(BaseModel):
 
     @validator("period", always=True)
     def validate_period_for_dashboard(cls, v, values):
-        if values.get("action") == "dashboard" and not v:
-            raise ValueError("period é obrigatório quando action=dashboard")
+        if values.get("action") in ("dashboard", "multi") and not v:
+            raise ValueError("period é obrigatório quando action=dashboard ou multi")
         return v
 
 
@@ -84,7 +111,13 @@ async def dashboard_post(
     """
     POST /dashboard — Endpoint único.
     - action=projects: retorna lista de projetos para dropdown (ordenada por name).
-    - action=dashboard: retorna métricas e séries do dashboard (implementado em fase posterior).
+    - action=dashboard: retorna métricas e séries do dashboard; filters (components, labels,
+      assignees, priorities, statuses) restringe as issues sem alterar o formato da resposta;
+      groupBy (component, label, assignee, priority, status, issuetype, sprint) acrescenta
+      data.breakdown com as métricas dos topN grupos e o agregado other dos demais.
+    - action=multi: dashboard de vários projetos (projectKeys, ou todos os visíveis se omitido),
+      calculados em paralelo; cada projeto com seu envelope {success, data} ou erro, e rollup
+      com métricas e séries somadas dos projetos que deram certo.
     
     Headers opcionais para autenticação por usuário:
     - X-Jira-Auth: Base64(email:token)
@@ -95,7 +128,7 @@ async def dashboard_post(
     if request.action == "projects":
         try:
             service = DashboardService()
-            projects = service.get_projects(credentials=credentials)
+            projects = await service.get_projects(credentials=credentials)
             return {
                 "success": True,
                 "data": {"projects": projects}
@@ -123,12 +156,15 @@ async def dashboard_post(
         period = request.period
         try:
             service = DashboardService()
-            payload = service.get_dashboard(
+            payload = await service.get_dashboard(
                 project_key=request.projectKey or "",
                 period_type=period.type,
                 custom_start=period.startDate,
                 custom_end=period.endDate,
                 credentials=credentials,
+                filters=request.filters.model_dump(exclude_none=True) if request.filters else None,
+                group_by=request.groupBy,
+                top_n=request.topN,
             )
             return {
                 "success": True,
@@ -159,7 +195,43 @@ async def dashboard_post(
                 status_code=500,
             )
 
-    return _error_response("INVALID_ACTION", "action deve ser 'projects' ou 'dashboard'", status_code=400)
+    if request.action == "multi":
+        period = request.period
+        try:
+            service = DashboardService()
+            multi = await service.get_multi_dashboard(
+                project_keys=request.projectKeys,
+                period_type=period.type,
+                custom_start=period.startDate,
+                custom_end=period.endDate,
+                credentials=credentials,
+            )
+        except ValueError as e:
+            return _error_response("INVALID_PERIOD", str(e), status_code=422)
+        except PermissionError as e:
+            return _error_response("PROJECT_NOT_ACCESSIBLE", str(e), status_code=401)
+        except RuntimeError as e:
+            return _error_response("JIRA_CONFIG_ERROR", str(e), status_code=500)
+        except Exception as e:
+            return _error_response(
+                "UNEXPECTED_ERROR",
+                f"Erro no dashboard multi-projeto: {str(e)}",
+                status_code=500,
+            )
+
+        result = {
+            "success": True,
+            "data": {"period": multi["period"], "projects": [], "rollup": multi["rollup"]},
+        }
+        for key, value in multi["projects"]:
+            if isinstance(value, BaseException):
+                result["data"]["projects"].append({"key": key, **_section_error(value, f"dashboard de {key}")})
+                result["success"] = False
+            else:
+                result["data"]["projects"].append({"key": key, "success": True, "data": value})
+        return result
+
+    return _error_response("INVALID_ACTION", "action deve ser 'projects', 'dashboard' ou 'multi'", status_code=400)
 
 
 # ============================================
@@ -171,6 +243,17 @@ class StatusTimeRequest(BaseModel):
     """Request do endpoint POST /dashboard/status-time."""
     projectKey: str = Field(..., description="Chave do projeto")
     period: PeriodPayload = Field(..., description="Período (month_current, sprint_current, sprint_previous ou custom)")
+    pageSize: Optional[int] = Field(
+        None, ge=1, le=STATUS_TIME_PAGE_SIZE_MAX, description="Issues por página (padrão 100)"
+    )
+    sortBy: Optional[Literal["created", "key", "readyToTestHours", "inTestHours", "totalHours"]] = Field(
+        None, description="Ordenação (padrão created)"
+    )
+    sortDir: Optional[Literal["asc", "desc"]] = Field(None, description="Sentido da ordenação (padrão asc)")
+    cursor: Optional[str] = Field(None, description="page.nextCursor da resposta anterior")
+    statuses: Optional[list[str]] = Field(
+        None, max_length=50, description="Status a detalhar (horas e entradas por issue); padrão Ready to test e In Test"
+    )
 
 
 @router.post("/status-time")
@@ -183,6 +266,8 @@ async def dashboard_status_time(
     """
     POST /dashboard/status-time — Dados para tabela e resumo Status Time.
     Issues que já passaram por QA; tempo em Ready to test e In Test (changelog).
+    Paginado por cursor (pageSize, sortBy, sortDir, cursor); summary cobre todas as issues
+    do período e page.nextCursor é null na última página.
     Chamar apenas quando o usuário abrir a seção Status Time (pode ser lento).
     
     Headers opcionais para autenticação por usuário:
@@ -193,17 +278,89 @@ async def dashboard_status_time(
     
     try:
         service = DashboardService()
-        payload = service.get_status_time(
+        payload = await service.get_status_time(
             project_key=request.projectKey,
             period_type=request.period.type,
             custom_start=request.period.startDate,
             custom_end=request.period.endDate,
+            page_size=request.pageSize,
+            sort_by=request.sortBy,
+            sort_dir=request.sortDir,
+            cursor=request.cursor,
+            statuses=request.statuses,
             credentials=credentials,
         )
         return {
             "success": True,
             "data": payload,
         }
+    except ValueError as e:
+        msg = str(e)
+        if "cursor" in msg:
+            return _error_response("INVALID_CURSOR", msg, status_code=422)
+        if "Sprint" in msg or "sprint" in msg:
+            return _error_response(
+                "SPRINT_NOT_AVAILABLE",
+                "Sprint atual indisponível para o projeto informado.",
+                status_code=422,
+                details={"detail": msg},
+            )
+        return _error_response("INVALID_PERIOD", msg, status_code=422)
+    except PermissionError as e:
+        return _error_response("PROJECT_NOT_ACCESSIBLE", str(e), status_code=401)
+    except RuntimeError as e:
+        return _error_response("JIRA_CONFIG_ERROR", str(e), status_code=500)
+    except Exception as e:
+        return _error_response(
+            "UNEXPECTED_ERROR",
+            f"Erro no Status Time: {str(e)}",
+            status_code=500,
+        )
+
+
+class StatusTimeStreamRequest(BaseModel):
+    """Request do endpoint POST /dashboard/status-time/stream."""
+    projectKey: str = Field(..., description="Chave do projeto")
+    period: PeriodPayload = Field(..., description="Período (mesmos tipos do Status Time)")
+    statuses: Optional[list[str]] = Field(
+        None, max_length=50, description="Status a detalhar (horas e entradas por issue); padrão Ready to test e In Test"
+    )
+
+
+def _ndjson(event: dict) -> bytes:
+    return (json.dumps(event, ensure_ascii=False) + "\n").encode("utf-8")
+
+
+@router.post("/status-time/stream")
+async def dashboard_status_time_stream(
+    request: StatusTimeStreamRequest,
+    x_jira_auth: Optional[str] = Header(None, alias="X-Jira-Auth"),
+    x_jira_base_url: Optional[str] = Header(None, alias="X-Jira-Base-Url"),
+):
+    """
+    POST /dashboard/status-time/stream — Status Time em NDJSON (application/x-ndjson), uma linha por evento:
+    meta (project, period), uma linha "issue" por issue assim que seu changelog é processado
+    (mesmo schema das linhas de /dashboard/status-time) e summary ao final.
+    Erros antes do primeiro evento (período, credenciais) voltam como JSON com os códigos de
+    /dashboard/status-time; depois disso, como evento {"type": "error", "code", "error", "detail"}.
+    
+    Headers opcionais para autenticação por usuário:
+    - X-Jira-Auth: Base64(email:token)
+    - X-Jira-Base-Url: URL base do Jira
+    """
+    credentials = decode_jira_auth(x_jira_auth, x_jira_base_url)
+
+    try:
+        service = DashboardService()
+        events = service.stream_status_time(
+            project_key=request.projectKey,
+            period_type=request.period.type,
+            custom_start=request.period.startDate,
+            custom_end=request.period.endDate,
+            statuses=request.statuses,
+            credentials=credentials,
+        )
+        first = await events.__anext__()
     except ValueError as e:
         msg = str(e)
         if "Sprint" in msg or "sprint" in msg:
@@ -224,3 +381,219 @@ async def dashboard_status_time(
             f"Erro no Status Time: {str(e)}",
             status_code=500,
         )
+
+    async def body():
+        yield _ndjson(first)
+        try:
+            async for event in events:
+                yield _ndjson(event)
+        except Exception as e:
+            yield _ndjson({"type": "error", **_section_error(e, "Status Time")})
+        finally:
+            await events.aclose()
+
+    return StreamingResponse(body(), media_type="application/x-ndjson")
+
+
+# ============================================
+# POST /dashboard/bundle — dashboard + Status Time em paralelo
+# ============================================
+
+
+class BundleRequest(BaseModel):
+    """Request do endpoint POST /dashboard/bundle."""
+    projectKey: str = Field(..., description="Chave do projeto")
+    period: PeriodPayload = Field(..., description="Período (mesmos tipos do dashboard)")
+    sections: Optional[list[Literal["dashboard", "statusTime"]]] = Field(
+        None, description="Seções a calcular (todas se omitido)"
+    )
+
+
+def _section_error(e: BaseException, label: str) -> dict:
+    """Envelope de erro de uma seção do bundle (mesmos códigos dos endpoints individuais)."""
+    msg = str(e)
+    if isinstance(e, ValueError):
+        code = "SPRINT_NOT_AVAILABLE" if ("Sprint" in msg or "sprint" in msg) else "INVALID_PERIOD"
+        return {"success": False, "code": code, "error": msg, "detail": msg}
+    if isinstance(e, PermissionError):
+        return {"success": False, "code": "PROJECT_NOT_ACCESSIBLE", "error": msg, "detail": msg}
+    if isinstance(e, RuntimeError):
+        return {"success": False, "code": "JIRA_CONFIG_ERROR", "error": msg, "detail": msg}
+    return {"success": False, "code": "UNEXPECTED_ERROR", "error": f"Erro no {label}", "detail": msg}
+
+
+@router.post("/bundle")
+async def dashboard_bundle(
+    request: BundleRequest,
+    x_jira_auth: Optional[str] = Header(None, alias="X-Jira-Auth"),
+    x_jira_base_url: Optional[str] = Header(None, alias="X-Jira-Base-Url"),
+):
+    """
+    POST /dashboard/bundle — Dashboard e Status Time numa única chamada.
+    Período e projeto resolvidos uma vez; as seções são calculadas em paralelo e cada uma
+    traz seu próprio envelope ({success, data} ou {success: false, code, error, detail}).
+    success geral é false se alguma seção falhar; erro de período falha a requisição inteira.
+
+    Headers opcionais para autenticação por usuário:
+    - X-Jira-Auth: Base64(email:token)
+    - X-Jira-Base-Url: URL base do Jira
+    """
+    credentials = decode_jira_auth(x_jira_auth, x_jira_base_url)
+    labels = {"dashboard": "dashboard", "statusTime": "Status Time"}
+
+    try:
+        service = DashboardService()
+        bundle = await service.get_bundle(
+            project_key=request.projectKey,
+            period_type=request.period.type,
+            custom_start=request.period.startDate,
+            custom_end=request.period.endDate,
+            sections=request.sections,
+            credentials=credentials,
+        )
+    except ValueError as e:
+        msg = str(e)
+        if "Sprint" in msg or "sprint" in msg:
+            return _error_response(
+                "SPRINT_NOT_AVAILABLE",
+                "Sprint atual indisponível para o projeto informado.",
+                status_code=422,
+                details={"detail": msg},
+            )
+        return _error_response("INVALID_PERIOD", msg, status_code=422)
+    except PermissionError as e:
+        return _error_response("PROJECT_NOT_ACCESSIBLE", str(e), status_code=401)
+    except RuntimeError as e:
+        return _error_response("JIRA_CONFIG_ERROR", str(e), status_code=500)
+    except Exception as e:
+        return _error_response(
+            "UNEXPECTED_ERROR",
+            f"Erro no bundle do dashboard: {str(e)}",
+            status_code=500,
+        )
+
+    result = {
+        "success": True,
+        "data": {"project": bundle["project"], "period": bundle["period"], "sections": {}},
+    }
+    for name, value in bundle["sections"].items():
+        if isinstance(value, BaseException):
+            result["data"]["sections"][name] = _section_error(value, labels[name])
+            result["success"] = False
+        else:
+            result["data"]["sections"][name] = {"success": True, "data": value}
+    return result
+
+
+# ============================================
+# POST /dashboard/trend — métricas por sprint / período anterior com uma única busca
+# ============================================
+
+
+class TrendRequest(BaseModel):
+    """Request do endpoint POST /dashboard/trend."""
+    projectKey: str = Field(..., description="Chave do projeto")
+    mode: Literal["sprints", "period"] = Field(
+        ..., description="sprints: últimas N sprints; period: período informado contra o anterior"
+    )
+    sprints: Optional[int] = Field(
+        None, ge=1, le=TREND_SPRINTS_MAX, description="Quantidade de sprints (mode=sprints; padrão 6)"
+    )
+    period: Optional[PeriodPayload] = Field(None, description="Período atual (obrigatório se mode=period)")
+
+    @validator("period", always=True)
+    def validate_period_for_mode(cls, v, values):
+        if values.get("mode") == "period" and not v:
+            raise ValueError("period é obrigatório quando mode=period")
+        return v
+
+
+@router.post("/trend")
+async def dashboard_trend(
+    request: TrendRequest,
+    x_jira_auth: Optional[str] = Header(None, alias="X-Jira-Auth"),
+    x_jira_base_url: Optional[str] = Header(None, alias="X-Jira-Base-Url"),
+):
+    """
+    POST /dashboard/trend — Tendência das métricas do dashboard.
+    - mode=sprints: métricas das últimas N sprints (ativa + fechadas), da mais antiga para a mais recente.
+    - mode=period: período informado (current) contra a janela anterior comparável (previous),
+      com a variação dos principais indicadores em change.
+    Sprints resolvidas de uma leitura do índice e issues de todas as janelas numa única busca
+    (ou do cache colunar), separadas localmente por janela.
+
+    Headers opcionais para autenticação por usuário:
+    - X-Jira-Auth: Base64(email:token)
+    - X-Jira-Base-Url: URL base do Jira
+    """
+    credentials = decode_jira_auth(x_jira_auth, x_jira_base_url)
+    period = request.period
+    try:
+        service = DashboardService()
+        trend = await service.get_trend(
+            project_key=request.projectKey,
+            mode=request.mode,
+            sprint_count=request.sprints,
+            period_type=period.type if period else None,
+            custom_start=period.startDate if period else None,
+            custom_end=period.endDate if period else None,
+            credentials=credentials,
+        )
+    except ValueError as e:
+        msg = str(e)
+        if "Sprint" in msg or "sprint" in msg:
+            return _error_response(
+                "SPRINT_NOT_AVAILABLE",
+                "Sprints indisponíveis para o projeto informado.",
+                status_code=422,
+                details={"detail": msg},
+            )
+        return _error_response("INVALID_PERIOD", msg, status_code=422)
+    except PermissionError as e:
+        return _error_response("PROJECT_NOT_ACCESSIBLE", str(e), status_code=401)
+    except RuntimeError as e:
+        return _error_response("JIRA_CONFIG_ERROR", str(e), status_code=500)
+    except Exception as e:
+        return _error_response(
+            "UNEXPECTED_ERROR",
+            f"Erro na tendência do dashboard: {str(e)}",
+            status_code=500,
+        )
+    return {"success": True, "data": trend}
+
+
+# ============================================
+# Cache de metadados do Jira (projetos, boards, sprints)
+# ============================================
+
+
+class CacheInvalidateRequest(BaseModel):
+    """Request do endpoint POST /dashboard/cache/invalidate."""
+    kind: Optional[Literal["projects", "project", "boards", "sprints", "results"]] = Field(
+        None, description="Tipo de metadado a invalidar, ou 'results' para resultados do dashboard (todos se omitido)"
+    )
+
+
+@router.post("/cache/invalidate")
+async def dashboard_cache_invalidate(
+    request: CacheInvalidateRequest,
+    x_jira_auth: Optional[str] = Header(None, alias="X-Jira-Auth"),
+    x_jira_base_url: Optional[str] = Header(None, alias="X-Jira-Base-Url"),
+):
+    """
+    POST /dashboard/cache/invalidate — Invalida o cache de metadados do Jira e os resultados
+    do dashboard em cache do tenant (credenciais via headers ou .env). Útil após criar
+    projetos/boards/sprints ou para forçar o recálculo de um período.
+    """
+    credentials = decode_jira_auth(x_jira_auth, x_jira_base_url)
+    try:
+        service = DashboardService()
+        return {"success": True, "data": service.invalidate_metadata_cache(kind=request.kind, credentials=credentials)}
+    except RuntimeError as e:
+        return _error_response("JIRA_CONFIG_ERROR", str(e), status_code=500)
+
+
+@router.get("/cache/stats")
+async def dashboard_cache_stats():
+    """GET /dashboard/cache/stats — Contadores de hit/miss dos caches e fila de requisições ao Jira."""
+    return {"success": True, "data": DashboardService().get_cache_stats()}
@@ -86,11 +86,11 @@ async def query_card(
     credentials = decode_jira_auth(x_jira_auth, x_jira_base_url)
     try:
         if credentials:
-            jira = get_issue_tracker("jira", skip_env_validation=True)
-            data = jira.get_issue(request.card_number, request.fields, credentials=credentials)
+            jira = get_issue_tracker("jira", skip_env_validation=True, async_mode=True)
+            data = await jira.get_issue(request.card_number, request.fields, credentials=credentials)
         else:
-            jira = get_issue_tracker("jira")
-            data = jira.get_issue(request.card_number, request.fields)
+            jira = get_issue_tracker("jira", async_mode=True)
+            data = await jira.get_issue(request.card_number, request.fields)
         return {"success": True, "data": data}
     except ValueError as e:
         raise HTTPException(status_code=404, detail=str(e))
@@ -109,7 +109,7 @@ async def query_card_with_ai(
 ):
     """Consulta card, envia para IA, e cria subtask automaticamente. Credenciais via headers ou .env."""
     credentials = decode_jira_auth(x_jira_auth, x_jira_base_url)
-    jira = get_issue_tracker("jira", skip_env_validation=True) if credentials else get_issue_tracker("jira")
+    jira = get_issue_tracker("jira", skip_env_validation=True, async_mode=True) if credentials else get_issue_tracker("jira", async_mode=True)
 
     result = {
         "success": True,
@@ -122,7 +122,7 @@ async def query_card_with_ai(
 
     try:
         # Step 1: Consultar card no Jira
-        card_data = jira.get_issue(request.card_number, request.fields, credentials=credentials) if credentials else jira.get_issue(request.card_number, request.fields)
+        card_data = await jira.get_issue(request.card_number, request.fields, credentials=credentials) if credentials else await jira.get_issue(request.card_number, request.fields)
         result["steps"]["jira_query"] = {"success": True, "data": card_data}
 
     except Exception as e:
@@ -179,7 +179,7 @@ Descrição:
     # Step 3: Criar subtask (se solicitado)
     if request.create_subtask:
         try:
-            subtask_data = jira.create_subtask(
+            subtask_data = await jira.create_subtask(
                 parent_key=request.card_number,
                 summary=title,
                 description=description,
@@ -213,15 +213,15 @@ async def search_subtasks(
     credentials = decode_jira_auth(x_jira_auth, x_jira_base_url)
     try:
         if credentials:
-            jira = get_issue_tracker("jira", skip_env_validation=True)
-            data = jira.search_subtasks(
+            jira = get_issue_tracker("jira", skip_env_validation=True, async_mode=True)
+            data = await jira.search_subtasks(
                 parent_key=request.parent_key,
                 max_results=request.max_results,
                 credentials=credentials,
             )
         else:
-            jira = get_issue_tracker("jira")
-            data = jira.search_subtasks(
+            jira = get_issue_tracker("jira", async_mode=True)
+            data = await jira.search_subtasks(
                 parent_key=request.parent_key,
                 max_results=request.max_results
             )
@@ -251,12 +251,12 @@ async def test_jira_connection(
     try:
         if credentials:
             # Usar credenciais dinâmicas
-            jira = get_issue_tracker("jira", skip_env_validation=True)
-            return jira.test_connection(credentials=credentials)
+            jira = get_issue_tracker("jira", skip_env_validation=True, async_mode=True)
+            return await jira.test_connection(credentials=credentials)
         else:
             # Usar credenciais do .env
-            jira = get_issue_tracker("jira")
-            return jira.test_connection()
+            jira = get_issue_tracker("jira", async_mode=True)
+            return await jira.test_connection()
     except RuntimeError as e:
         return {
             "success": False,
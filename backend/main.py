@@ -7,7 +7,11 @@ from backend.api.routes_config import router as config_router
 from backend.api.routes_jira import router as jira_router
 from backend.api.routes_bug import router as bug_router
 from backend.api.routes_dashboard import router as dashboard_router
+from backend.services.jira_client_registry import get_client_registry, prewarm_env_tenant
+from backend.services.dashboard_result_cache import get_result_cache
+from backend.services.issue_mirror import get_issue_mirror
 from dotenv import load_dotenv
+import asyncio
 import os
 import sys
 
@@ -26,6 +30,24 @@ else:
 
 app = FastAPI(title="BSQA Card Writer API", version="1.1.0")
 
+# Pré-aquecimento opcional do pool de conexões do Jira (.env) em background, no loop da aplicação
+@app.on_event("startup")
+async def prewarm_jira_pool():
+    app.state.jira_prewarm = asyncio.create_task(prewarm_env_tenant())
+
+# Fechar conexões keep-alive do Jira ao encerrar
+@app.on_event("shutdown")
+async def close_jira_pool():
+    await get_client_registry().aclose()
+
+# Cancelar sincronizações do espelho local e atualizações de cache em andamento ao encerrar
+@app.on_event("shutdown")
+async def stop_background_tasks():
+    get_result_cache().cancel_refreshes()
+    mirror = get_issue_mirror()
+    if mirror is not None:
+        mirror.cancel_syncs()
+
 # Health check endpoint
 @app.get("/health")
 async def health_check():
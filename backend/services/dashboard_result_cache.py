@@ -0,0 +1,172 @@
+# backend/services/dashboard_result_cache.py
+
+"""
+Cache de resultados do dashboard (dashboard, status time) por (tenant, projeto, período, endpoint),
+com stale-while-revalidate: dentro do TTL o resultado é servido direto; após o TTL e dentro da
+janela de stale, é servido imediatamente e recalculado em segundo plano.
+Períodos encerrados (fim antes de hoje) usam um TTL bem maior.
+Além do limite de entradas, há um orçamento de memória: cada entrada conta pelo seu tamanho
+estimado (estimated_nbytes) e as menos usadas são descartadas até caber.
+"""
+
+import asyncio
+import logging
+import os
+import threading
+import time
+from typing import Awaitable, Callable, Hashable, Optional
+
+from backend.utils.ttl_cache import TTLCache
+
+logger = logging.getLogger(__name__)
+
+RESULT_TTL_DEFAULT = 300
+RESULT_STALE_TTL_DEFAULT = 3600
+RESULT_TTL_CLOSED_DEFAULT = 86400
+RESULT_MAX_ENTRIES_DEFAULT = 256
+RESULT_MAX_MB_DEFAULT = 128
+
+
+def estimated_nbytes(value) -> int:
+    """
+    Tamanho estimado em memória (bytes) de um resultado: nbytes() / nbytes quando o objeto o
+    define (índices, arrays NumPy); senão soma aproximada de dicts, listas e escalares.
+    """
+    nbytes = getattr(value, "nbytes", None)
+    if callable(nbytes):
+        return int(nbytes())
+    if isinstance(nbytes, int):
+        return nbytes
+    if isinstance(value, dict):
+        return 64 + sum(estimated_nbytes(k) + estimated_nbytes(v) + 16 for k, v in value.items())
+    if isinstance(value, (list, tuple)):
+        return 56 + sum(estimated_nbytes(v) + 8 for v in value)
+    if isinstance(value, str):
+        return 49 + len(value)
+    return 32
+
+
+class DashboardResultCache:
+    """
+    Cache LRU (limite de entradas e de bytes) de resultados com stale-while-revalidate.
+    Cada entrada guarda o resultado, o instante de cálculo e o TTL de frescor; a entrada
+    expira do TTLCache em TTL + janela de stale.
+    """
+
+    def __init__(self, max_entries: int = RESULT_MAX_ENTRIES_DEFAULT, max_bytes: int = RESULT_MAX_MB_DEFAULT * 1024 * 1024):
+        self._cache = TTLCache(max_entries=max_entries, max_bytes=max_bytes)
+        self._refreshing: dict[Hashable, asyncio.Task] = {}
+        self.stale_served = 0
+        self.refreshes = 0
+        self.refresh_failures = 0
+
+    @staticmethod
+    def _ttls(closed_period: bool) -> tuple[int, int]:
+        """(TTL de frescor, janela de stale) em segundos, lidos do ambiente a cada chamada."""
+        if closed_period:
+            ttl = int(os.getenv("DASHBOARD_CACHE_TTL_CLOSED", str(RESULT_TTL_CLOSED_DEFAULT)))
+        else:
+            ttl = int(os.getenv("DASHBOARD_CACHE_TTL", str(RESULT_TTL_DEFAULT)))
+        stale = int(os.getenv("DASHBOARD_CACHE_STALE_TTL", str(RESULT_STALE_TTL_DEFAULT)))
+        return ttl, stale
+
+    def _store(self, key: Hashable, value, ttl: int, stale: int, immutable: bool = False) -> None:
+        if ttl <= 0:
+            return
+        self._cache.set(
+            key, {"value": value, "storedAt": time.time(), "ttl": ttl}, ttl + max(0, stale),
+            copy_value=not immutable, size=estimated_nbytes(value),
+        )
+
+    async def get_or_compute(
+        self,
+        key: Hashable,
+        compute: Callable[[], Awaitable[dict]],
+        closed_period: bool = False,
+        immutable: bool = False,
+    ) -> tuple[dict, bool, float]:
+        """
+        Retorna (resultado, veio_do_cache, idade_em_segundos).
+        Entrada vencida dentro da janela de stale: devolvida na hora e recalculada em segundo plano.
+        O resultado devolvido é uma cópia (pode ser alterado pelo chamador), exceto com
+        immutable=True: resultado somente leitura, guardado e devolvido sem cópia.
+        """
+        ttl, stale = self._ttls(closed_period)
+        hit, entry = self._cache.get(key)
+        if hit:
+            age = max(0.0, time.time() - entry["storedAt"])
+            if age >= entry["ttl"]:
+                self.stale_served += 1
+                self._schedule_refresh(key, compute, ttl, stale, immutable)
+            return entry["value"], True, age
+
+        value = await compute()
+        self._store(key, value, ttl, stale, immutable)
+        return value, False, 0.0
+
+    def peek(self, key: Hashable) -> tuple[bool, Optional[dict], float]:
+        """(encontrado, resultado, idade em segundos) sem calcular nem disparar atualização."""
+        hit, entry = self._cache.get(key)
+        if not hit:
+            return False, None, 0.0
+        return True, entry["value"], max(0.0, time.time() - entry["storedAt"])
+
+    def put(self, key: Hashable, value, closed_period: bool = False, immutable: bool = False) -> None:
+        """Guarda um resultado calculado fora de get_or_compute (ex.: ao final de um streaming)."""
+        ttl, stale = self._ttls(closed_period)
+        self._store(key, value, ttl, stale, immutable)
+
+    def _schedule_refresh(
+        self, key: Hashable, compute: Callable[[], Awaitable[dict]], ttl: int, stale: int, immutable: bool = False
+    ) -> None:
+        """Recalcula a entrada em segundo plano (uma tarefa por chave)."""
+        if key in self._refreshing:
+            return
+
+        async def refresh() -> None:
+            try:
+                self._store(key, await compute(), ttl, stale, immutable)
+                self.refreshes += 1
+            except Exception as e:
+                self.refresh_failures += 1
+                logger.warning("[resultCache] falha ao atualizar em segundo plano: %s", e)
+
+        task = asyncio.get_running_loop().create_task(refresh())
+        self._refreshing[key] = task
+        task.add_done_callback(lambda _: self._refreshing.pop(key, None))
+
+    def cancel_refreshes(self) -> None:
+        """Cancela as atualizações em segundo plano em andamento (encerramento do app)."""
+        for task in list(self._refreshing.values()):
+            task.cancel()
+
+    def invalidate(self, tenant: Optional[tuple] = None) -> int:
+        """Remove resultados do tenant (todos se None). Retorna quantos foram removidos."""
+        return self._cache.invalidate(None if tenant is None else (lambda key: key[0] == tenant))
+
+    def stats(self) -> dict:
+        stats = self._cache.stats()
+        stats.update({
+            "staleServed": self.stale_served,
+            "refreshes": self.refreshes,
+            "refreshFailures": self.refresh_failures,
+            "refreshing": len(self._refreshing),
+        })
+        return stats
+
+
+_cache: Optional[DashboardResultCache] = None
+_cache_lock = threading.Lock()
+
+
+def get_result_cache() -> DashboardResultCache:
+    """Cache global de resultados (limites via DASHBOARD_CACHE_MAX_ENTRIES e DASHBOARD_CACHE_MAX_MB)."""
+    global _cache
+    if _cache is None:
+        with _cache_lock:
+            if _cache is None:
+                _cache = DashboardResultCache(
+                    max_entries=int(os.getenv("DASHBOARD_CACHE_MAX_ENTRIES", str(RESULT_MAX_ENTRIES_DEFAULT))),
+                    max_bytes=int(float(os.getenv("DASHBOARD_CACHE_MAX_MB", str(RESULT_MAX_MB_DEFAULT))) * 1024 * 1024),
+                )
+    return _cache
@@ -1,19 +1,56 @@
 # backend/services/dashboard_service.py
 
+import asyncio
+import base64
+import copy
+import json
 import logging
+import math
+import os
+import threading
 import time as time_module
-from collections import defaultdict
-from datetime import date, datetime
-from typing import List, Optional
+from bisect import bisect_left, bisect_right
+from collections import OrderedDict
+from datetime import date, datetime, timedelta
+from typing import Any, AsyncIterator, Awaitable, Callable, List, Optional
 
+import numpy as np
+from dateutil.relativedelta import relativedelta
+
+from backend.services.dashboard_result_cache import estimated_nbytes, get_result_cache
+from backend.services.issue_column_cache import (
+    COLUMN_CACHE_SPAN_DAYS_DEFAULT,
+    COLUMN_CACHE_SPAN_MAX_DAYS_DEFAULT,
+    COLUMN_CACHE_TTL_DEFAULT,
+    IssueColumnCache,
+    IssueColumns,
+    day_start_ms,
+    get_issue_column_cache,
+)
+from backend.services.issue_mirror import get_issue_mirror
 from backend.services.issue_tracker_factory import get_issue_tracker
-from dateutil.parser import parse as dateutil_parse
+from backend.services.jira_client_registry import get_client_registry
+from backend.services.jira_metadata_cache import invalidate_metadata, metadata_cache_stats
+from backend.services.sprint_index import get_sprint_index_store, sprint_info
+from backend.services.status_time_engine import NO_TIME, StatusTimeline
 
-from backend.utils.date_range_utils import resolve_period, list_days, TIMEZONE
+from backend.utils.date_range_utils import (
+    CUSTOM_RANGE_MONTHS_DEFAULT,
+    TIMEZONE,
+    list_days,
+    previous_period_window,
+    resolve_period,
+)
+from backend.utils.jira_dates import get_day_bucketer, jira_day_br, jira_epoch_ms_array, jira_to_epoch_ms
 from backend.utils.jql_builder import build_defects_base_jql, build_status_time_jql
+from backend.utils.quantile_sketch import QuantileSketch
+from backend.utils.single_flight import SingleFlight
 
 logger = logging.getLogger(__name__)
 
+# Coalescência de cálculos idênticos simultâneos (dashboard, status time)
+_flights = SingleFlight()
+
 # Nomes exatos do Jira para classificação
 ISSUE_TYPE_BUG = "Bug"
 ISSUE_TYPE_SUB_BUG = "Sub-Bug"
@@ -30,33 +67,219 @@ STATUS_CLOSED = [
 
 # Status Time: statuses em que acumulamos tempo (Ready to test, In Test)
 STATUS_TIME_TARGET = ["Ready to test", "In Test"]
-MAX_ISSUES_STATUS_TIME = 100
+# Paginação do Status Time (cursor); o resumo sempre cobre todas as issues do período
+STATUS_TIME_PAGE_SIZE_DEFAULT = 100
+STATUS_TIME_PAGE_SIZE_MAX = 500
+STATUS_TIME_SEARCH_PAGE_SIZE = 100
+STATUS_TIME_SORT_KEYS = ("created", "key", "readyToTestHours", "inTestHours", "totalHours")
+# Conjuntos de status (matrizes + summary) memorizados por índice do Status Time
+STATUS_TIME_INDEX_VIEWS_MAX = 8
+# Distribuição do tempo em status: percentis (sketch combinável) e faixas do histograma (horas)
+STATUS_TIME_PERCENTILES = (50, 75, 90, 99)
+STATUS_TIME_HISTOGRAM_HOURS = (1, 4, 8, 24, 48, 72, 120, 168, 336)
+# Defaults da busca de changelog em paralelo (sobrescritos por env, lidos a cada chamada)
+STATUS_TIME_CONCURRENCY_DEFAULT = 8
+STATUS_TIME_ISSUE_TIMEOUT_DEFAULT = 30.0
 
+# Campos das issues do dashboard carregados no cache colunar
+DASHBOARD_ISSUE_FIELDS = ["issuetype", "status", "created", "components", "labels", "assignee", "priority"]
+# Filtros do dashboard (campo da requisição -> coluna do cache colunar)
+DASHBOARD_FILTERS = {
+    "components": "components",
+    "labels": "labels",
+    "assignees": "assignee",
+    "priorities": "priority",
+    "statuses": "status",
+}
+# Agrupamentos do dashboard (groupBy): campo da requisição -> coluna do cache colunar; sprint usa as
+# janelas de datas das sprints do índice
+DASHBOARD_GROUP_BY = {
+    "component": "components",
+    "label": "labels",
+    "assignee": "assignee",
+    "priority": "priority",
+    "status": "status",
+    "issuetype": "issuetype",
+    "sprint": None,
+}
+GROUP_BY_TOP_N_DEFAULT = 10
+GROUP_BY_TOP_N_MAX = 100
 
-def _created_to_day_br(created_iso: str) -> Optional[str]:
-    """Converte created (ISO do Jira) para data YYYY-MM-DD no timezone America/Sao_Paulo."""
-    if not created_iso or not created_iso.strip():
+# Tendência (POST /dashboard/trend): modos e quantidade de sprints (padrão / máximo)
+TREND_MODES = ("sprints", "period")
+TREND_SPRINTS_DEFAULT = 6
+TREND_SPRINTS_MAX = 20
+
+# Seções do bundle (POST /dashboard/bundle), na ordem da resposta
+BUNDLE_SECTIONS = ("dashboard", "statusTime")
+
+# Limite (meses) de período custom quando os rollups diários do espelho local cobrem o período
+# (custo do dashboard proporcional a dias); fora disso vale DASHBOARD_CUSTOM_RANGE_MONTHS
+ROLLUP_RANGE_MONTHS_DEFAULT = 12
+
+# Dashboard multi-projeto: projetos calculados ao mesmo tempo (global, todas as requisições)
+# e máximo de projetos por requisição (defaults sobrescritos por env)
+MULTI_PROJECT_CONCURRENCY_DEFAULT = 4
+MULTI_PROJECT_MAX_DEFAULT = 50
+_multi_semaphore: Optional[asyncio.Semaphore] = None
+_multi_semaphore_loop: Optional[asyncio.AbstractEventLoop] = None
+
+# Busca do dashboard particionada por data (defaults sobrescritos por env)
+SEARCH_ISSUES_PER_SHARD_DEFAULT = 500
+SEARCH_MAX_SHARDS_DEFAULT = 8
+SEARCH_VOLUME_MAX_ENTRIES = 1024
+# (tenant, projectKey) -> issues por dia observadas na última busca
+_search_volume: dict = {}
+
+
+def _plan_search_shards(volume_key: tuple, start_d: date, end_d: date) -> int:
+    """
+    Escolhe o número de fatias da busca a partir do volume da execução anterior
+    (issues/dia * dias do período / DASHBOARD_SEARCH_ISSUES_PER_SHARD).
+    Sem histórico, usa uma fatia por mês do período. Limitado a DASHBOARD_SEARCH_MAX_SHARDS.
+    """
+    max_shards = int(os.getenv("DASHBOARD_SEARCH_MAX_SHARDS", str(SEARCH_MAX_SHARDS_DEFAULT)))
+    per_shard = int(os.getenv("DASHBOARD_SEARCH_ISSUES_PER_SHARD", str(SEARCH_ISSUES_PER_SHARD_DEFAULT)))
+    days = (end_d - start_d).days + 1
+    density = _search_volume.get(volume_key)
+    if density is None:
+        wanted = math.ceil(days / 31)
+    else:
+        wanted = math.ceil(density * days / max(1, per_shard))
+    return max(1, min(max_shards, wanted))
+
+
+def _record_search_volume(volume_key: tuple, issue_count: int, start_d: date, end_d: date) -> None:
+    """Guarda issues/dia da busca para o planejamento da próxima execução."""
+    days = (end_d - start_d).days + 1
+    _search_volume.pop(volume_key, None)
+    _search_volume[volume_key] = issue_count / max(1, days)
+    while len(_search_volume) > SEARCH_VOLUME_MAX_ENTRIES:
+        _search_volume.pop(next(iter(_search_volume)))
+
+
+def _column_cache_span(
+    cache: Optional[IssueColumnCache], key: tuple, start_d: date, end_d: date
+) -> Optional[tuple[date, date]]:
+    """
+    Span a carregar no cache colunar para servir [start_d, end_d]: de DASHBOARD_COLUMN_CACHE_SPAN_DAYS
+    antes de hoje (ou start_d, se anterior) até hoje, para que as próximas trocas de período sejam
+    respondidas localmente. None se o período não passa pelo cache: cache desativado, período
+    que não cruza essa janela recente (não substitui o span recente do projeto), span maior que
+    DASHBOARD_COLUMN_CACHE_SPAN_MAX_DAYS ou que não cabe no orçamento pela densidade já vista.
+    """
+    if cache is None:
         return None
-    try:
-        dt = dateutil_parse(created_iso.strip())
-        if dt.tzinfo is None:
-            dt = dt.replace(tzinfo=TIMEZONE)
-        else:
-            dt = dt.astimezone(TIMEZONE)
-        return dt.date().isoformat()
-    except Exception:
+    today = datetime.now(TIMEZONE).date()
+    span_days = int(os.getenv("DASHBOARD_COLUMN_CACHE_SPAN_DAYS", str(COLUMN_CACHE_SPAN_DAYS_DEFAULT)))
+    max_days = int(os.getenv("DASHBOARD_COLUMN_CACHE_SPAN_MAX_DAYS", str(COLUMN_CACHE_SPAN_MAX_DAYS_DEFAULT)))
+    recent_start = today - timedelta(days=span_days)
+    if end_d < recent_start:
+        return None
+    span_start, span_end = min(start_d, recent_start), max(end_d, today)
+    if (span_end - span_start).days + 1 > max_days or not cache.fits(key, span_start, span_end):
         return None
+    return span_start, span_end
 
 
-def _parse_iso_to_ms(iso_str: str) -> Optional[int]:
-    """Converte string ISO do Jira para timestamp em ms; retorna None se inválido."""
-    if not iso_str or not str(iso_str).strip():
+def _column_cache_meta(key: tuple, columns: IssueColumns) -> Optional[dict]:
+    """meta.columnCache (span e idade) se columns é o span em cache do projeto; None se carregado fora dele."""
+    cache = get_issue_column_cache()
+    if cache is None or not cache.contains(key, columns):
         return None
+    return {
+        "spanStart": columns.span_start,
+        "spanEnd": columns.span_end,
+        "ageSeconds": int(max(0.0, time_module.time() - columns.loaded_at)),
+    }
+
+
+def _base_range_limit_months() -> int:
+    """Limite de período custom sem os rollups do espelho (DASHBOARD_CUSTOM_RANGE_MONTHS)."""
+    return int(os.getenv("DASHBOARD_CUSTOM_RANGE_MONTHS", str(CUSTOM_RANGE_MONTHS_DEFAULT)))
+
+
+async def _custom_range_limit_months(
+    jira,
+    project_key: str,
+    custom_start: Optional[str],
+    custom_end: Optional[str],
+    credentials: Optional[dict],
+) -> int:
+    """
+    Limite de período custom: DASHBOARD_CUSTOM_RANGE_MONTHS, ou DASHBOARD_ROLLUP_RANGE_MONTHS quando o
+    espelho do projeto está sincronizado e sua janela cobre o período e a janela anterior comparável
+    (o dashboard lê então os rollups diários). Sem project_key (pré-validação do multi-projeto) vale o
+    limite dos rollups: cada projeto é validado de novo em get_dashboard.
+    """
+    base_limit = _base_range_limit_months()
+    mirror = get_issue_mirror()
+    if mirror is None or not custom_start or not custom_end:
+        return base_limit
+    rollup_limit = int(os.getenv("DASHBOARD_ROLLUP_RANGE_MONTHS", str(ROLLUP_RANGE_MONTHS_DEFAULT)))
+    if not project_key:
+        return max(base_limit, rollup_limit)
     try:
-        dt = dateutil_parse(iso_str.strip())
-        return int(dt.timestamp() * 1000)
-    except Exception:
-        return None
+        start_d = date.fromisoformat(custom_start[:10])
+        end_d = date.fromisoformat(custom_end[:10])
+    except ValueError:
+        # Formato inválido: resolve_period reporta o erro
+        return base_limit
+    if start_d > end_d or end_d < start_d + relativedelta(months=base_limit):
+        return base_limit
+    previous_start, _ = previous_period_window("custom", start_d, end_d)
+    mirror_info = await mirror.ensure_fresh(jira, project_key, previous_start.isoformat(), credentials)
+    return max(base_limit, rollup_limit) if mirror_info is not None else base_limit
+
+
+def _multi_project_semaphore() -> asyncio.Semaphore:
+    """Semáforo global do fan-out multi-projeto no event loop atual (recriado se o loop mudar)."""
+    global _multi_semaphore, _multi_semaphore_loop
+    loop = asyncio.get_running_loop()
+    if _multi_semaphore is None or _multi_semaphore_loop is not loop:
+        concurrency = int(os.getenv("DASHBOARD_MULTI_CONCURRENCY", str(MULTI_PROJECT_CONCURRENCY_DEFAULT)))
+        _multi_semaphore = asyncio.Semaphore(max(1, concurrency))
+        _multi_semaphore_loop = loop
+    return _multi_semaphore
+
+
+async def _gather_bounded(
+    items: list,
+    fetch: Callable[[Any], Awaitable[Any]],
+    concurrency: int,
+    timeout: Optional[float] = None,
+    label: str = "fetch",
+) -> list:
+    """
+    Executa fetch(item) para cada item com no máximo `concurrency` chamadas simultâneas.
+    Retorna resultados na mesma ordem de `items`; falhas (exceção ou timeout por item)
+    viram None e são logadas, sem interromper os demais.
+    """
+    semaphore = asyncio.Semaphore(max(1, concurrency))
+
+    async def _run(item):
+        async with semaphore:
+            try:
+                if timeout and timeout > 0:
+                    return await asyncio.wait_for(fetch(item), timeout=timeout)
+                return await fetch(item)
+            except asyncio.TimeoutError:
+                logger.warning("[%s] timeout após %ss: %s", label, timeout, item)
+            except Exception as e:
+                logger.warning("[%s] skip %s: %s", label, item, e)
+            return None
+
+    return await asyncio.gather(*(_run(item) for item in items))
+
+
+def _created_to_day_br(created_iso: str) -> Optional[str]:
+    """Converte created (ISO do Jira) para data YYYY-MM-DD no timezone America/Sao_Paulo."""
+    return jira_day_br(created_iso)
+
+
+def _parse_iso_to_ms(iso_str: str) -> Optional[int]:
+    """Converte string ISO do Jira para timestamp em ms; retorna None se inválido."""
+    return jira_to_epoch_ms(iso_str)
 
 
 def _calc_time_in_statuses(
@@ -68,45 +291,789 @@ def _calc_time_in_statuses(
     Calcula tempo (em ms) que a issue passou em cada status alvo, com base no changelog.
     changelog_parsed: lista de { "created", "items" } (items com field, from, to).
     Retorna dict status_name -> ms (apenas para status em target_statuses).
+    Para lotes de issues, usar StatusTimeline diretamente.
+    """
+    timeline = StatusTimeline()
+    timeline.add_issue("", created_iso, changelog_parsed)
+    durations = timeline.durations_ms(target_statuses)[0].tolist()
+    return dict(zip(target_statuses, durations))
+
+
+def _generated_at() -> str:
+    """Agora (America/Sao_Paulo) em ISO 8601 com offset HH:MM (meta.generatedAt)."""
+    generated_at = datetime.now(TIMEZONE).strftime("%Y-%m-%dT%H:%M:%S%z")
+    if len(generated_at) == 22 and generated_at[-5] in "+-":
+        generated_at = generated_at[:-2] + ":" + generated_at[-2:]
+    return generated_at
+
+
+def _period_payload(period_type: str, start_date: str, end_date: str, meta: dict) -> dict:
+    """Bloco period das respostas (timezone, datas resolvidas, origem, sprint se houver)."""
+    payload = {
+        "type": period_type,
+        "timezone": meta.get("timezone", "America/Sao_Paulo"),
+        "startDate": start_date,
+        "endDate": end_date,
+        "source": meta.get("source", period_type),
+    }
+    if "sprint" in meta:
+        payload["sprint"] = meta["sprint"]
+    return payload
+
+
+def _result_key(
+    endpoint: str,
+    jira,
+    project_key: str,
+    start_date: str,
+    end_date: str,
+    credentials: Optional[dict],
+    variant: tuple = (),
+) -> tuple:
+    """Chave do cache de resultados: (tenant, projeto, início, fim, endpoint[, variante, ex.: filtros])."""
+    key = (jira.tenant_key(credentials), project_key.strip().upper(), start_date, end_date, endpoint)
+    return key + (variant,) if variant else key
+
+
+def _normalize_dashboard_filters(filters: Optional[dict]) -> dict:
+    """
+    Filtros do dashboard ({campo: valores}, campos de DASHBOARD_FILTERS) -> {coluna: tupla ordenada
+    de valores}; campos vazios são ignorados. Raises ValueError para campo desconhecido.
+    """
+    normalized = {}
+    for field, values in (filters or {}).items():
+        if field not in DASHBOARD_FILTERS:
+            raise ValueError(f"Filtro inválido: {field}. Use {', '.join(DASHBOARD_FILTERS)}.")
+        if values:
+            normalized[DASHBOARD_FILTERS[field]] = tuple(sorted({str(v).strip() for v in values}))
+    return normalized
+
+
+def _is_closed_period(end_date: str) -> bool:
+    """Período encerrado (fim antes de hoje): resultado não muda mais, TTL longo no cache."""
+    return date.fromisoformat(end_date[:10]) < datetime.now(TIMEZONE).date()
+
+
+def _issue_key_order(key: str) -> list:
+    """Ordem natural de issue keys (PRJ-9 antes de PRJ-10)."""
+    prefix, _, number = key.rpartition("-")
+    return [prefix, int(number)] if number.isdigit() else [key, -1]
+
+
+def _status_time_sort_value(entry: dict, sort_by: str) -> list:
+    """Chave de ordenação (valor, key) de uma issue do índice do Status Time; serializável no cursor."""
+    if sort_by == "key":
+        return _issue_key_order(entry["key"])
+    if sort_by == "readyToTestHours":
+        value = entry["readyMs"]
+    elif sort_by == "inTestHours":
+        value = entry["inTestMs"]
+    elif sort_by == "totalHours":
+        value = entry["readyMs"] + entry["inTestMs"]
+    else:
+        value = entry["createdMs"]
+    return [value, *_issue_key_order(entry["key"])]
+
+
+def _status_time_row(entry: dict) -> dict:
+    """Linha da tabela Status Time a partir da issue do índice (com os tempos da página)."""
+    ready_ms, in_test_ms = entry["readyMs"], entry["inTestMs"]
+    row = {
+        "key": entry["key"],
+        "issueType": entry["issueType"],
+        "summary": entry["summary"],
+        "currentStatus": entry["currentStatus"],
+        "readyToTestHours": round(ready_ms / (1000 * 60 * 60), 2),
+        "inTestHours": round(in_test_ms / (1000 * 60 * 60), 2),
+        "totalHours": round((ready_ms + in_test_ms) / (1000 * 60 * 60), 2),
+    }
+    if "statuses" in entry:
+        row["statuses"] = entry["statuses"]
+    return row
+
+
+def _status_time_process_filter(issues: List[dict]) -> List[dict]:
+    """Issues do Status Time a processar: com key e não canceladas (não passaram pelo fluxo de testes)."""
+    return [
+        item for item in issues
+        if item.get("key") and (item.get("status") or "-") != STATUS_CANCELED
+    ]
+
+
+def _add_status_time_issues(timeline: StatusTimeline, issues: List[dict], changelogs: dict) -> List[dict]:
+    """
+    Adiciona à timeline as issues com changelog e retorna as entradas do índice (mesma ordem).
+    Issues sem changelog (falha na busca, já logada) ficam de fora.
     """
-    totals = {s: 0 for s in target_statuses}
-    created_ms = _parse_iso_to_ms(created_iso)
-    if created_ms is None:
-        return totals
-
-    # Extrair transições de status em ordem cronológica
-    status_changes = []
-    for history in changelog_parsed or []:
-        created_at = history.get("created") or ""
-        at_ms = _parse_iso_to_ms(created_at)
-        if at_ms is None:
+    entries = []
+    for item in issues:
+        key = item["key"]
+        changelog = changelogs.pop(key, None)
+        if changelog is None:
             continue
-        for item in history.get("items") or []:
-            if (item.get("field") or "").strip().lower() != "status":
+        created_ms = _parse_iso_to_ms(item.get("created") or "")
+        timeline.add_issue(key, created_ms, changelog)
+        entries.append({
+            "key": key,
+            "issueType": item.get("issuetype") or "-",
+            "summary": (item.get("summary") or "").strip() or "-",
+            "currentStatus": item.get("status") or "-",
+            "createdMs": created_ms or 0,
+        })
+    return entries
+
+
+def _status_time_index_meta() -> dict:
+    """meta do índice do Status Time (generatedAt, notas)."""
+    generated_at = _generated_at()
+    return {
+        "generatedAt": generated_at,
+        "notes": [
+            "Tempo em 'Ready to test' e 'In Test' calculado a partir do changelog.",
+            "Cycle time: da primeira entrada em 'Ready to test' à última entrada em status fechado.",
+            "Issues com status 'Cancelado' são excluídas do cálculo.",
+            "Resumo calculado sobre todas as issues do período; lista paginada por cursor.",
+        ],
+    }
+
+
+def _status_time_matrices(
+    timeline: StatusTimeline,
+    statuses: Optional[List[str]] = None,
+) -> tuple[np.ndarray, np.ndarray, list, list]:
+    """
+    (durações, entradas, status reportados, colunas dos reportados) da timeline; as matrizes
+    têm STATUS_TIME_TARGET nas duas primeiras colunas, seguidas dos status pedidos.
+    """
+    reported = list(dict.fromkeys(statuses)) if statuses else list(STATUS_TIME_TARGET)
+    columns = list(dict.fromkeys([*STATUS_TIME_TARGET, *reported]))
+    reported_columns = [columns.index(name) for name in reported]
+    return timeline.durations_ms(columns), timeline.entries(columns), reported, reported_columns
+
+
+def _status_time_items(
+    issues: List[dict],
+    timeline: StatusTimeline,
+    statuses: Optional[List[str]] = None,
+) -> tuple[list, np.ndarray, np.ndarray, list, list]:
+    """
+    Junta às issues do índice (mesma ordem da timeline) os tempos em Ready to test / In Test e,
+    se statuses foi informado, horas e entradas de cada status pedido.
+    Retorna (itens, durações, entradas, status reportados, colunas dos reportados), como em
+    _status_time_matrices.
+    """
+    durations, entries, reported, reported_columns = _status_time_matrices(timeline, statuses)
+    durations_list = durations.tolist()
+    entries_list = entries.tolist()
+    items = []
+    for i, entry in enumerate(issues):
+        item = dict(entry, readyMs=durations_list[i][0], inTestMs=durations_list[i][1])
+        if statuses:
+            item["statuses"] = {
+                name: {
+                    "hours": round(durations_list[i][c] / (1000 * 60 * 60), 2),
+                    "entries": entries_list[i][c],
+                }
+                for name, c in zip(reported, reported_columns)
+            }
+        items.append(item)
+    return items, durations, entries, reported, reported_columns
+
+
+def _new_status_time_sketch() -> QuantileSketch:
+    return QuantileSketch(edges=[hours * 1000 * 60 * 60 for hours in STATUS_TIME_HISTOGRAM_HOURS])
+
+
+def _status_time_sketches(timeline: StatusTimeline) -> dict:
+    """
+    Sketches do tempo (ms) em cada status da timeline, do total Ready to test + In Test e do
+    cycle time (primeira entrada em Ready to test até a última entrada em STATUS_CLOSED):
+    {"statuses": {nome: sketch}, "total": sketch, "cycle": sketch}. Cada sketch considera só as
+    issues com tempo > 0 no status (issues que nunca passaram por ele não entram nos percentis) ou,
+    no cycle time, as que chegaram aos dois extremos.
+    """
+    durations = timeline.durations_ms()
+    by_status = {}
+    for column, name in enumerate(timeline.statuses):
+        values = durations[:, column]
+        by_status[name] = _new_status_time_sketch()
+        by_status[name].update_many(values[values > 0])
+    totals = timeline.durations_ms(STATUS_TIME_TARGET).sum(axis=1)
+    total = _new_status_time_sketch()
+    total.update_many(totals[totals > 0])
+    cycle_times = timeline.cycle_time_ms(STATUS_TIME_TARGET[:1], STATUS_CLOSED)
+    cycle = _new_status_time_sketch()
+    cycle.update_many(cycle_times[cycle_times != NO_TIME])
+    return {"statuses": by_status, "total": total, "cycle": cycle}
+
+
+def _merge_status_time_sketches(into: dict, other: dict) -> dict:
+    """Mescla os sketches de other (outra página, projeto ou sprint) em into. Retorna into."""
+    for name, sketch in other["statuses"].items():
+        into["statuses"].setdefault(name, _new_status_time_sketch()).merge(sketch)
+    into["total"].merge(other["total"])
+    into["cycle"].merge(other["cycle"])
+    return into
+
+
+def _status_time_distribution(sketch: Optional[QuantileSketch]) -> dict:
+    """Percentis (horas) e histograma de um sketch de tempo em status; vazio se None."""
+    sketch = sketch or _new_status_time_sketch()
+    hours = 1000 * 60 * 60
+    values = sketch.quantiles([p / 100 for p in STATUS_TIME_PERCENTILES])
+    distribution = {"count": sketch.count}
+    for p, value in zip(STATUS_TIME_PERCENTILES, values):
+        distribution[f"p{p}Hours"] = None if value is None else round(value / hours, 2)
+    distribution["maxHours"] = None if sketch.max is None else round(sketch.max / hours, 2)
+    distribution["histogram"] = [
+        {
+            "fromHours": round(bucket["from"] / hours, 2),
+            "toHours": None if bucket["to"] is None else round(bucket["to"] / hours, 2),
+            "count": bucket["count"],
+        }
+        for bucket in sketch.histogram()
+    ]
+    return distribution
+
+
+def _status_time_summary(
+    durations: np.ndarray,
+    entries: np.ndarray,
+    reported: List[str],
+    reported_columns: List[int],
+    sketches: dict,
+) -> dict:
+    """
+    Summary do Status Time sobre todas as issues. durations/entries: matrizes issues x status
+    cujas duas primeiras colunas são STATUS_TIME_TARGET; reported: status detalhados em "statuses";
+    sketches: de _status_time_sketches (percentis e histogramas, sem ordenar as issues).
+    """
+    count = int(durations.shape[0])
+    totals_ready = int(durations[:, 0].sum())
+    totals_in_test = int(durations[:, 1].sum())
+    total_ready_h = round(totals_ready / (1000 * 60 * 60), 2)
+    total_in_test_h = round(totals_in_test / (1000 * 60 * 60), 2)
+    by_status = {}
+    for name, column in zip(reported, reported_columns):
+        total_h = round(int(durations[:, column].sum()) / (1000 * 60 * 60), 2)
+        by_status[name] = {
+            "totalHours": total_h,
+            "avgHours": round(total_h / count, 2) if count else 0,
+            "entries": int(entries[:, column].sum()),
+            # Issues que voltaram ao status (retrabalho/reabertura)
+            "reworkIssues": int((entries[:, column] > 1).sum()),
+            "distribution": _status_time_distribution(sketches["statuses"].get(name)),
+        }
+    ready_status, in_test_status = STATUS_TIME_TARGET
+    return {
+        "count": count,
+        "totalReadyToTestHours": total_ready_h,
+        "totalInTestHours": total_in_test_h,
+        "totalHours": round((totals_ready + totals_in_test) / (1000 * 60 * 60), 2),
+        "avgReadyToTestHours": round(total_ready_h / count, 2) if count else 0,
+        "avgInTestHours": round(total_in_test_h / count, 2) if count else 0,
+        "readyToTestDistribution": _status_time_distribution(sketches["statuses"].get(ready_status)),
+        "inTestDistribution": _status_time_distribution(sketches["statuses"].get(in_test_status)),
+        "totalDistribution": _status_time_distribution(sketches["total"]),
+        "cycleTimeDistribution": _status_time_distribution(sketches["cycle"]),
+        "statuses": by_status,
+    }
+
+
+def _encode_status_time_cursor(sort_by: str, sort_dir: str, after: list) -> str:
+    """Cursor opaco (base64url de JSON) com a ordenação e a última posição devolvida."""
+    raw = json.dumps({"s": sort_by, "d": sort_dir, "a": after}, separators=(",", ":"))
+    return base64.urlsafe_b64encode(raw.encode("utf-8")).decode("ascii").rstrip("=")
+
+
+def _decode_status_time_cursor(cursor: str) -> tuple[str, str, list]:
+    """Decodifica o cursor; raises ValueError se inválido."""
+    try:
+        raw = base64.urlsafe_b64decode(cursor + "=" * (-len(cursor) % 4))
+        data = json.loads(raw)
+        sort_by, sort_dir, after = data["s"], data["d"], data["a"]
+    except Exception:
+        raise ValueError("cursor inválido.")
+    if sort_by not in STATUS_TIME_SORT_KEYS or sort_dir not in ("asc", "desc") or not isinstance(after, list):
+        raise ValueError("cursor inválido.")
+    # Mesmo formato de _status_time_sort_value: ([valor], prefixo, número)
+    shape = (str, int) if sort_by == "key" else ((int, float), str, int)
+    if len(after) != len(shape) or not all(
+        isinstance(v, t) and not isinstance(v, bool) for v, t in zip(after, shape)
+    ):
+        raise ValueError("cursor inválido.")
+    return sort_by, sort_dir, after
+
+
+class StatusTimeIndex:
+    """
+    Índice do Status Time de um período (ver _compute_status_time_index): issues na ordem da
+    timeline, StatusTimeline, sketches e meta.
+    Somente leitura depois de montado: fica no cache de resultados sem cópia e é compartilhado
+    entre as páginas. Matrizes e summary de cada conjunto de status (até
+    STATUS_TIME_INDEX_VIEWS_MAX, LRU) e a ordem de cada sortBy são calculados na primeira
+    página que os pede; as seguintes só fatiam.
+    """
+
+    def __init__(self, issues: List[dict], timeline: StatusTimeline, sketches: dict, meta: dict):
+        self.issues = issues
+        self.timeline = timeline
+        self.sketches = sketches
+        self.meta = meta
+        self._views: "OrderedDict[tuple, dict]" = OrderedDict()
+        self._orders: dict = {}
+        self._lock = threading.Lock()
+
+    def __len__(self) -> int:
+        return len(self.issues)
+
+    def nbytes(self) -> int:
+        """
+        Tamanho estimado em memória, para o orçamento do cache de resultados: issues, timeline e
+        sketches, mais as views (STATUS_TIME_INDEX_VIEWS_MAX, estimadas com as colunas de
+        STATUS_TIME_TARGET) e as ordens de cada sortBy, que são montadas depois de o índice
+        entrar no cache.
+        """
+        rows = len(self.issues)
+        # Listas de durações e entradas por issue (inteiros do Python)
+        view_bytes = 2 * rows * (64 + 40 * len(STATUS_TIME_TARGET))
+        order_bytes = 2 * rows * 48
+        sketches = [self.sketches["total"], self.sketches["cycle"], *self.sketches["statuses"].values()]
+        return (
+            estimated_nbytes(self.issues)
+            + self.timeline.nbytes()
+            + sum(sketch.nbytes() for sketch in sketches)
+            + STATUS_TIME_INDEX_VIEWS_MAX * view_bytes
+            + len(STATUS_TIME_SORT_KEYS) * order_bytes
+        )
+
+    def _view(self, statuses: Optional[List[str]]) -> dict:
+        """Durações/entradas (listas issues x status) e summary do conjunto de status, memorizados."""
+        key = tuple(dict.fromkeys(statuses)) if statuses else ()
+        with self._lock:
+            view = self._views.get(key)
+            if view is not None:
+                self._views.move_to_end(key)
+                return view
+        durations, entries, reported, reported_columns = _status_time_matrices(self.timeline, list(key) or None)
+        view = {
+            "detailed": bool(key),
+            "durations": durations.tolist(),
+            "entries": entries.tolist(),
+            "reported": reported,
+            "reportedColumns": reported_columns,
+            "summary": _status_time_summary(durations, entries, reported, reported_columns, self.sketches),
+        }
+        with self._lock:
+            self._views[key] = view
+            while len(self._views) > STATUS_TIME_INDEX_VIEWS_MAX:
+                self._views.popitem(last=False)
+        return view
+
+    def _item(self, i: int, view: dict) -> dict:
+        """Issue i com os tempos da view (mesmo formato de _status_time_items)."""
+        durations = view["durations"][i]
+        item = dict(self.issues[i], readyMs=durations[0], inTestMs=durations[1])
+        if view["detailed"]:
+            entries = view["entries"][i]
+            item["statuses"] = {
+                name: {"hours": round(durations[c] / (1000 * 60 * 60), 2), "entries": entries[c]}
+                for name, c in zip(view["reported"], view["reportedColumns"])
+            }
+        return item
+
+    def rows(self, positions, statuses: Optional[List[str]] = None) -> List[dict]:
+        """Linhas da tabela (_status_time_row) das issues nas posições informadas."""
+        view = self._view(statuses)
+        return [_status_time_row(self._item(i, view)) for i in positions]
+
+    def summary(self, statuses: Optional[List[str]] = None) -> dict:
+        """Summary sobre todas as issues (cópia: o memorizado é compartilhado)."""
+        return copy.deepcopy(self._view(statuses)["summary"])
+
+    def order(self, sort_by: str) -> tuple[list, list]:
+        """
+        (chaves de ordenação ascendentes, posições das issues nessa ordem) para sortBy; não
+        depende dos status pedidos (readyMs/inTestMs vêm sempre de STATUS_TIME_TARGET).
+        """
+        with self._lock:
+            order = self._orders.get(sort_by)
+        if order is not None:
+            return order
+        view = self._view(None)
+        keyed = sorted(
+            ((_status_time_sort_value(self._item(i, view), sort_by), i) for i in range(len(self.issues))),
+            key=lambda pair: pair[0],
+        )
+        order = ([value for value, _ in keyed], [i for _, i in keyed])
+        with self._lock:
+            self._orders[sort_by] = order
+        return order
+
+
+# Categorias de defeito: tipo (Bug, Sub-Bug) x situação do status (cancelado, fechado, aberto)
+_DEFECT_TYPE_CODES = {ISSUE_TYPE_BUG: 0, ISSUE_TYPE_SUB_BUG: 1}
+_STATUS_CANCELED_CODE, _STATUS_CLOSED_CODE, _STATUS_OPEN_CODE = 0, 1, 2
+_DEFECT_CATEGORIES = 6
+_EPOCH_DATE = date(1970, 1, 1)
+def _category(type_code: int, status_code: int) -> int:
+    return type_code * 3 + status_code
+
+
+def _status_situation(status: Optional[str]) -> int:
+    """Situação do status: cancelado, fechado ou aberto."""
+    st = (status or "").strip()
+    if st == STATUS_CANCELED:
+        return _STATUS_CANCELED_CODE
+    if st in STATUS_CLOSED:
+        return _STATUS_CLOSED_CODE
+    return _STATUS_OPEN_CODE
+
+
+def _defect_category(issuetype: Optional[str], status: Optional[str]) -> Optional[int]:
+    """Categoria (tipo x situação do status) da issue; None se não for Bug/Sub-Bug."""
+    type_code = _DEFECT_TYPE_CODES.get((issuetype or "").strip())
+    if type_code is None:
+        return None
+    return _category(type_code, _status_situation(status))
+
+
+def _column_categories(columns: IssueColumns, selection: np.ndarray) -> np.ndarray:
+    """
+    Categoria de defeito das issues do cache colunar em selection (máscara ou índices), via tabelas
+    por código de dicionário; -1 para issues que não são Bug/Sub-Bug.
+    """
+    type_of = np.asarray(
+        [_DEFECT_TYPE_CODES.get(value, -1) for value in columns.dictionaries["issuetype"].values] or [-1],
+        dtype=np.int64,
+    )
+    status_of = np.asarray(
+        [_status_situation(value) for value in columns.dictionaries["status"].values] or [_STATUS_OPEN_CODE],
+        dtype=np.int64,
+    )
+    type_codes = type_of[columns.codes["issuetype"][selection]]
+    return np.where(type_codes >= 0, type_codes * 3 + status_of[columns.codes["status"][selection]], -1)
+
+
+class DefectsAggregator:
+    """
+    Agregação incremental das métricas e séries do dashboard (Bug/Sub-Bug), vetorizada com NumPy.
+    Cada página vira arrays compactos (categoria tipo x status, índice do dia) e é somada a uma
+    matriz de contagens categoria x dia via bincount; métricas e séries saem de somas sobre a
+    matriz. O resultado não depende da ordem de chegada das issues.
+    """
+
+    def __init__(self, days: List[str]):
+        self.days = days
+        self._day_index = {d: i for i, d in enumerate(days)}
+        # Última coluna: issues sem data ou com dia fora do período (contam nos totais, não nas séries)
+        self._columns = len(days) + 1
+        self._first_day = (date.fromisoformat(days[0]) - _EPOCH_DATE).days if days else 0
+        self._counts = np.zeros((_DEFECT_CATEGORIES, self._columns), dtype=np.int64)
+        self.issue_count = 0
+
+    def _day_columns(self, created_values: List[str]) -> np.ndarray:
+        """
+        Coluna do dia (America/Sao_Paulo) de cada created, vetorizado: formato fixo do Jira via
+        jira_epoch_ms_array + DayBucketer; demais formatos via _created_to_day_br.
+        """
+        outside = self._columns - 1
+        columns = np.full(len(created_values), outside, dtype=np.int64)
+        epoch_ms, valid = jira_epoch_ms_array(created_values)
+        if valid.any():
+            day_numbers = get_day_bucketer().day_numbers(epoch_ms[valid]) - self._first_day
+            columns[valid] = np.where((day_numbers >= 0) & (day_numbers < len(self.days)), day_numbers, outside)
+        for i in np.flatnonzero(~valid).tolist():
+            day = _created_to_day_br(created_values[i])
+            if day:
+                columns[i] = self._day_index.get(day, outside)
+        return columns
+
+    def add_many(self, issues) -> None:
+        """Soma issues ({issuetype, status, created}) à matriz de contagens."""
+        categories = []
+        created_values = []
+        for issue in issues:
+            self.issue_count += 1
+            category = _defect_category(issue.get("issuetype"), issue.get("status"))
+            if category is None:
                 continue
-            from_str = (item.get("from") or "").strip()
-            to_str = (item.get("to") or "").strip()
-            status_changes.append({"at": at_ms, "from": from_str, "to": to_str})
-    status_changes.sort(key=lambda x: x["at"])
+            categories.append(category)
+            created_values.append((issue.get("created") or "").strip())
+        if not categories:
+            return
+        flat = np.asarray(categories, dtype=np.int64) * self._columns + self._day_columns(created_values)
+        self._counts += np.bincount(flat, minlength=_DEFECT_CATEGORIES * self._columns).reshape(
+            _DEFECT_CATEGORIES, self._columns
+        )
+
+    def add(self, issue: dict) -> None:
+        self.add_many((issue,))
+
+    def add_columns(self, columns: IssueColumns, mask: np.ndarray) -> None:
+        """Soma as issues do cache colunar selecionadas por mask, direto dos arrays codificados."""
+        self.issue_count += int(mask.sum())
+        categories = _column_categories(columns, mask)
+        keep = categories >= 0
+        categories = categories[keep]
+        day_numbers = columns.day[mask][keep].astype(np.int64) - self._first_day
+        outside = self._columns - 1
+        day_columns = np.where((day_numbers >= 0) & (day_numbers < len(self.days)), day_numbers, outside)
+        self._counts += np.bincount(
+            categories * self._columns + day_columns, minlength=_DEFECT_CATEGORIES * self._columns
+        ).reshape(_DEFECT_CATEGORIES, self._columns)
+
+    def add_counts(self, rows) -> None:
+        """Soma contagens já agregadas por dia ({day, issuetype, status, count}, ex.: rollups do espelho)."""
+        outside = self._columns - 1
+        for row in rows:
+            count = int(row["count"])
+            self.issue_count += count
+            category = _defect_category(row.get("issuetype"), row.get("status"))
+            if category is not None:
+                self._counts[category, self._day_index.get(row.get("day"), outside)] += count
+
+    def _rows(self, type_codes: tuple, status_codes: tuple) -> np.ndarray:
+        """Soma das linhas (categorias) selecionadas, por coluna de dia."""
+        rows = [_category(t, s) for t in type_codes for s in status_codes]
+        return self._counts[rows].sum(axis=0)
+
+    def metrics(self) -> dict:
+        """Métricas do período (leakage, valid rate, ratio, breakdowns)."""
+        return _category_metrics(self._counts.sum(axis=1))
+
+    def series(self) -> dict:
+        """Séries diárias dos dias do período."""
+        days_slice = slice(0, len(self.days))
+        valid = (_STATUS_CLOSED_CODE, _STATUS_OPEN_CODE)
+        reported = self._counts.sum(axis=0)[days_slice]
+        valid_daily = self._rows((0, 1), valid)[days_slice]
+        prod_daily = self._rows((0,), valid)[days_slice]
+        return _defect_series(self.days, prod_daily, valid_daily, reported)
+
+
+def _defect_metrics(
+    bugs_closed: int,
+    bugs_open: int,
+    sub_bugs_closed: int,
+    sub_bugs_open: int,
+    total_reported: int,
+) -> dict:
+    """Métricas do dashboard a partir das contagens (usado pelo DefectsAggregator e pelo roll-up)."""
+    bugs_valid = bugs_closed + bugs_open
+    sub_bugs_valid = sub_bugs_closed + sub_bugs_open
+    total_defects_valid = bugs_valid + sub_bugs_valid
+    production_bugs_valid = bugs_valid
+
+    rate_leakage = (production_bugs_valid / total_defects_valid * 100) if total_defects_valid else 0.0
+    rate_valid = (total_defects_valid / total_reported * 100) if total_reported else 0.0
+    ratio = (sub_bugs_valid / bugs_valid) if bugs_valid else None
+    return {
+        "defectLeakage": {
+            "productionBugs": production_bugs_valid,
+            "totalDefectsValid": total_defects_valid,
+            "ratePercent": round(rate_leakage, 2),
+        },
+        "defectValidRate": {
+            "validDefects": total_defects_valid,
+            "totalReported": total_reported,
+            "ratePercent": round(rate_valid, 2),
+        },
+        "defectsRatio": {
+            "subBugsValid": sub_bugs_valid,
+            "bugsValid": bugs_valid,
+            "ratio": round(ratio, 2) if ratio is not None else None,
+        },
+        "defectsBreakdown": {
+            "closed": sub_bugs_closed,
+            "open": sub_bugs_open,
+            "total": sub_bugs_valid,
+        },
+        "bugsBreakdown": {
+            "closed": bugs_closed,
+            "open": bugs_open,
+            "total": bugs_valid,
+        },
+    }
+
+
+def _category_metrics(totals: np.ndarray) -> dict:
+    """Métricas do dashboard a partir dos totais por categoria (vetor de _DEFECT_CATEGORIES)."""
+    return _defect_metrics(
+        int(totals[_category(0, _STATUS_CLOSED_CODE)]),
+        int(totals[_category(0, _STATUS_OPEN_CODE)]),
+        int(totals[_category(1, _STATUS_CLOSED_CODE)]),
+        int(totals[_category(1, _STATUS_OPEN_CODE)]),
+        int(totals.sum()),
+    )
+
+
+def _group_rows(
+    columns: IssueColumns, mask: np.ndarray, column: Optional[str], sprints: List[dict]
+) -> tuple[np.ndarray, np.ndarray, List[dict]]:
+    """
+    Pares (issue, grupo) das issues selecionadas por mask e a descrição de cada grupo ({key[, sprint]}).
+    - Coluna de valor único: o código do dicionário é o grupo.
+    - Coluna multivalorada: um par por valor (expansão do CSR); issue sem valor vai para o grupo "".
+    - column None (sprint): janela [startDate, endDate] de cada sprint (limites da JQL); em
+      sobreposição vence a sprint que começou por último; fora de todas, grupo "".
+    """
+    if column is None:
+        rows = np.flatnonzero(mask)
+        created = columns.created_ms[rows]
+        groups = np.full(len(rows), len(sprints), dtype=np.int64)
+        for code, sprint in enumerate(sprints):
+            inside = (created >= day_start_ms(sprint["startDate"])) & (created <= day_start_ms(sprint["endDate"]))
+            groups[inside] = code
+        return rows, groups, [{"key": sprint.get("name") or "", "sprint": sprint} for sprint in sprints] + [{"key": ""}]
+
+    dictionary = columns.dictionaries[column]
+    keys = [{"key": value} for value in dictionary.values]
+    if column not in IssueColumns.MULTI_COLUMNS:
+        rows = np.flatnonzero(mask)
+        return rows, columns.codes[column][rows].astype(np.int64), keys
+
+    offsets = columns.multi_offsets[column]
+    value_counts = np.diff(offsets)
+    owners = np.repeat(np.arange(len(columns)), value_counts)
+    keep = mask[owners]
+    empty = np.flatnonzero(mask & (value_counts == 0))
+    empty_group = dictionary.code("")
+    if empty_group is None:
+        empty_group = len(keys)
+        keys.append({"key": ""})
+    rows = np.concatenate((owners[keep], empty))
+    groups = np.concatenate(
+        (columns.multi_codes[column][keep].astype(np.int64), np.full(len(empty), empty_group, dtype=np.int64))
+    )
+    return rows, groups, keys
+
+
+def _group_breakdown(
+    columns: IssueColumns,
+    mask: np.ndarray,
+    group_by: str,
+    top_n: int,
+    sprints: Optional[List[dict]] = None,
+) -> dict:
+    """
+    Métricas do dashboard por grupo (DASHBOARD_GROUP_BY) numa única passada: um bincount sobre
+    grupo x categoria gera a matriz de contagens de todos os grupos de uma vez.
+    Mantém os top_n grupos com mais defeitos reportados; os demais viram "other", calculado sobre as
+    issues distintas desses grupos (uma issue com vários componentes/labels conta uma vez).
+    """
+    rows, groups, keys = _group_rows(columns, mask, DASHBOARD_GROUP_BY[group_by], sprints or [])
+    categories = _column_categories(columns, rows)
+    group_count = len(keys)
+    issues = np.bincount(groups, minlength=group_count)
+    defects = categories >= 0
+    counts = np.bincount(
+        groups[defects] * _DEFECT_CATEGORIES + categories[defects], minlength=group_count * _DEFECT_CATEGORIES
+    ).reshape(group_count, _DEFECT_CATEGORIES)
+    reported = counts.sum(axis=1)
+    order = sorted(np.flatnonzero(issues).tolist(), key=lambda g: (-int(reported[g]), -int(issues[g]), keys[g]["key"]))
+    top, rest = order[:top_n], order[top_n:]
+
+    other = None
+    if rest:
+        in_rest = np.zeros(group_count, dtype=bool)
+        in_rest[rest] = True
+        other_rows = np.unique(rows[in_rest[groups]])
+        other_categories = _column_categories(columns, other_rows)
+        other = {
+            "groups": len(rest),
+            "issues": int(len(other_rows)),
+            "metrics": _category_metrics(
+                np.bincount(other_categories[other_categories >= 0], minlength=_DEFECT_CATEGORIES)
+            ),
+        }
+    return {
+        "groupBy": group_by,
+        "topN": top_n,
+        "groups": [
+            {**keys[g], "issues": int(issues[g]), "metrics": _category_metrics(counts[g])} for g in top
+        ],
+        "other": other,
+    }
 
-    if not status_changes:
-        return totals
 
-    current_status = status_changes[0]["from"]
-    interval_start = created_ms
-    now_ms = int(datetime.now(TIMEZONE).timestamp() * 1000)
+def _metrics_change(current: dict, previous: dict) -> dict:
+    """Variação (atual - anterior) dos principais indicadores entre duas janelas da tendência."""
+    ratio_current = current["defectsRatio"]["ratio"]
+    ratio_previous = previous["defectsRatio"]["ratio"]
+    return {
+        "totalReported": current["defectValidRate"]["totalReported"] - previous["defectValidRate"]["totalReported"],
+        "validDefects": current["defectValidRate"]["validDefects"] - previous["defectValidRate"]["validDefects"],
+        "defectLeakagePercent": round(
+            current["defectLeakage"]["ratePercent"] - previous["defectLeakage"]["ratePercent"], 2
+        ),
+        "defectValidRatePercent": round(
+            current["defectValidRate"]["ratePercent"] - previous["defectValidRate"]["ratePercent"], 2
+        ),
+        "defectsRatio": (
+            round(ratio_current - ratio_previous, 2) if ratio_current is not None and ratio_previous is not None else None
+        ),
+    }
 
-    for change in status_changes:
-        interval_end = change["at"]
-        if current_status in target_statuses:
-            totals[current_status] = totals.get(current_status, 0) + (interval_end - interval_start)
-        current_status = change["to"]
-        interval_start = interval_end
 
-    if current_status in target_statuses:
-        totals[current_status] = totals.get(current_status, 0) + (now_ms - interval_start)
+def _percent_daily(numerators: np.ndarray, denominators: np.ndarray) -> list:
+    """numerador / denominador * 100 por dia (0.0 sem denominador), arredondado como round(x, 2)."""
+    values = np.divide(
+        numerators, denominators, out=np.zeros(len(numerators), dtype=np.float64), where=denominators > 0
+    ) * 100
+    # round() do Python por valor: np.round pode divergir em casos de meio (ex.: x.xx5)
+    return [round(v, 2) for v in values.tolist()]
 
-    return totals
+
+def _defect_series(days: List[str], prod_daily: np.ndarray, valid_daily: np.ndarray, reported: np.ndarray) -> dict:
+    """Séries diárias do dashboard a partir das contagens por dia (usado pelo DefectsAggregator e pelo roll-up)."""
+    return {
+        "defectLeakageDaily": {
+            "labels": days,
+            "valuesPercent": _percent_daily(prod_daily, valid_daily),
+            "productionBugs": prod_daily.tolist(),
+            "totalDefectsValid": valid_daily.tolist(),
+        },
+        "defectValidRateDaily": {
+            "labels": days,
+            "valuesPercent": _percent_daily(valid_daily, reported),
+            "validDefects": valid_daily.tolist(),
+            "totalReported": reported.tolist(),
+        },
+    }
+
+
+def _rollup_dashboards(payloads: List[dict]) -> dict:
+    """
+    Roll-up de dashboards de vários projetos: soma as contagens (breakdowns, total reportado e
+    contagens diárias por data) e recalcula taxas e séries com as mesmas regras do DefectsAggregator.
+    Projetos com períodos diferentes (sprints) entram pela união das datas.
+    """
+    bugs_closed = bugs_open = sub_bugs_closed = sub_bugs_open = total_reported = 0
+    daily: dict = {}
+    for payload in payloads:
+        metrics = payload["metrics"]
+        bugs_closed += metrics["bugsBreakdown"]["closed"]
+        bugs_open += metrics["bugsBreakdown"]["open"]
+        sub_bugs_closed += metrics["defectsBreakdown"]["closed"]
+        sub_bugs_open += metrics["defectsBreakdown"]["open"]
+        total_reported += metrics["defectValidRate"]["totalReported"]
+        leakage = payload["series"]["defectLeakageDaily"]
+        reported = payload["series"]["defectValidRateDaily"]["totalReported"]
+        for day, prod, valid, day_reported in zip(
+            leakage["labels"], leakage["productionBugs"], leakage["totalDefectsValid"], reported
+        ):
+            day_counts = daily.setdefault(day, [0, 0, 0])
+            day_counts[0] += prod
+            day_counts[1] += valid
+            day_counts[2] += day_reported
+
+    days = sorted(daily)
+    counts = np.asarray([daily[d] for d in days], dtype=np.int64).reshape(len(days), 3)
+    return {
+        "metrics": _defect_metrics(bugs_closed, bugs_open, sub_bugs_closed, sub_bugs_open, total_reported),
+        "series": _defect_series(days, counts[:, 0], counts[:, 1], counts[:, 2]),
+    }
 
 
 class DashboardService:
@@ -119,12 +1086,80 @@ class DashboardService:
         """
         if credentials:
             # Usar instância que não valida .env
-            jira = get_issue_tracker("jira", skip_env_validation=True)
+            jira = get_issue_tracker("jira", skip_env_validation=True, async_mode=True)
         else:
-            jira = get_issue_tracker("jira")
+            jira = get_issue_tracker("jira", async_mode=True)
         return jira
 
-    def get_projects(self, credentials: Optional[dict] = None) -> List[dict]:
+    async def _resolve_period(
+        self,
+        jira,
+        project_key: str,
+        period_type: str,
+        custom_start: Optional[str] = None,
+        custom_end: Optional[str] = None,
+        credentials: Optional[dict] = None,
+        rollup_range: bool = False,
+    ) -> tuple[str, str, dict]:
+        """
+        Resolve o período via resolve_period. Para sprints, as datas vêm do índice de
+        sprints do projeto (sem chamadas ao Jira enquanto fresco) e são repassadas como
+        callbacks já resolvidos. Período custom limitado a DASHBOARD_CUSTOM_RANGE_MONTHS; com
+        rollup_range (cálculo que lê os rollups do espelho), a _custom_range_limit_months.
+        """
+        custom_limit_months = _base_range_limit_months()
+        if rollup_range and period_type == "custom":
+            custom_limit_months = await _custom_range_limit_months(
+                jira, project_key, custom_start, custom_end, credentials
+            )
+        sprint_dates = None
+        if period_type == "sprint_current" and project_key:
+            sprint_dates = await jira.get_sprint_current_dates(project_key, credentials=credentials)
+        elif period_type == "sprint_previous" and project_key:
+            sprint_dates = await jira.get_sprint_previous_dates(project_key, credentials=credentials)
+
+        return resolve_period(
+            period_type=period_type,
+            custom_start=custom_start,
+            custom_end=custom_end,
+            project_key=project_key,
+            get_sprint_dates=lambda pk: sprint_dates,
+            get_sprint_previous_dates=lambda pk: sprint_dates,
+            custom_limit_months=custom_limit_months,
+        )
+
+    async def _cached_result(
+        self,
+        endpoint: str,
+        jira,
+        project_key: str,
+        start_date: str,
+        end_date: str,
+        credentials: Optional[dict],
+        compute: Callable[[], Awaitable[dict]],
+        variant: tuple = (),
+        period_payload: Optional[dict] = None,
+    ) -> dict:
+        """
+        Resultado de compute() via cache de resultados (chave: tenant, projeto, início, fim, endpoint
+        e variante, ex.: filtros).
+        Cálculos simultâneos com a mesma chave são coalescidos (single-flight).
+        Períodos já encerrados (fim antes de hoje) usam TTL longo. Preenche meta.cached e meta.ageSeconds.
+        A chave não inclui o tipo de período (custom e month_previous com as mesmas datas compartilham
+        o cálculo): period_payload, se informado, substitui o bloco period do resultado em cache.
+        """
+        key = _result_key(endpoint, jira, project_key, start_date, end_date, credentials, variant)
+        result, cached, age = await get_result_cache().get_or_compute(
+            key, lambda: _flights.do(key, compute), closed_period=_is_closed_period(end_date)
+        )
+        if period_payload is not None:
+            result["period"] = period_payload
+        result.setdefault("meta", {})
+        result["meta"]["cached"] = cached
+        result["meta"]["ageSeconds"] = int(age)
+        return result
+
+    async def get_projects(self, credentials: Optional[dict] = None) -> List[dict]:
         """
         Retorna lista de projetos disponíveis para o usuário (não arquivados).
         Ordenação alfabética por name é feita no jira_service.
@@ -133,10 +1168,41 @@ class DashboardService:
             credentials: Dict opcional com {base_url, email, api_token} para autenticação dinâmica
         """
         jira = self._get_jira(credentials)
-        projects = jira.project_search_all(credentials=credentials)
+        projects = await jira.project_search_all(credentials=credentials)
         return [{"id": p["id"], "key": p["key"], "name": p["name"]} for p in projects]
 
-    def get_dashboard_period(
+    def invalidate_metadata_cache(self, kind: Optional[str] = None, credentials: Optional[dict] = None) -> dict:
+        """
+        Invalida o cache de metadados do Jira (projetos, projeto, boards, sprints) e o cache
+        de resultados e o cache colunar (kind="results") do tenant.
+        kind restringe a um tipo; retorna quantas entradas foram removidas e os contadores.
+        """
+        jira = self._get_jira(credentials)
+        tenant = jira.tenant_key(credentials)
+        removed = invalidate_metadata(tenant=tenant, kind=kind)
+        if kind in (None, "boards", "sprints"):
+            get_sprint_index_store().invalidate(tenant)
+        if kind in (None, "results"):
+            removed += get_result_cache().invalidate(tenant)
+            column_cache = get_issue_column_cache()
+            if column_cache is not None:
+                removed += column_cache.invalidate(tenant)
+        return {"removed": removed, "stats": metadata_cache_stats()}
+
+    def get_cache_stats(self) -> dict:
+        """Contadores de hit/miss dos caches do dashboard, fila de requisições ao Jira e espelho local."""
+        mirror = get_issue_mirror()
+        column_cache = get_issue_column_cache()
+        return {
+            "metadata": metadata_cache_stats(),
+            "results": get_result_cache().stats(),
+            "columns": column_cache.stats() if column_cache else None,
+            "singleFlight": _flights.stats(),
+            "jiraClients": get_client_registry().stats(),
+            "issueMirror": mirror.stats() if mirror else None,
+        }
+
+    async def get_dashboard_period(
         self,
         project_key: str,
         period_type: str,
@@ -154,208 +1220,378 @@ class DashboardService:
         """
         jira = self._get_jira(credentials)
 
-        def get_sprint_dates(pk: str):
-            return jira.get_sprint_current_dates(pk, credentials=credentials)
-
-        def get_sprint_previous_dates(pk: str):
-            return jira.get_sprint_previous_dates(pk, credentials=credentials)
-
-        start_date, end_date, meta = resolve_period(
-            period_type=period_type,
-            custom_start=custom_start,
-            custom_end=custom_end,
-            project_key=project_key,
-            get_sprint_dates=get_sprint_dates,
-            get_sprint_previous_dates=get_sprint_previous_dates,
+        start_date, end_date, meta = await self._resolve_period(
+            jira, project_key, period_type, custom_start, custom_end, credentials, rollup_range=True
         )
 
-        period_payload = {
-            "type": period_type,
-            "timezone": meta.get("timezone", "America/Sao_Paulo"),
-            "startDate": start_date,
-            "endDate": end_date,
-            "source": meta.get("source", period_type),
-        }
-        if "sprint" in meta:
-            period_payload["sprint"] = meta["sprint"]
+        period_payload = _period_payload(period_type, start_date, end_date, meta)
 
         return {
             "project": {"key": project_key},
             "period": period_payload,
         }
 
-    def get_dashboard(
+    async def get_dashboard(
         self,
         project_key: str,
         period_type: str,
         custom_start: Optional[str] = None,
         custom_end: Optional[str] = None,
         credentials: Optional[dict] = None,
+        filters: Optional[dict] = None,
+        group_by: Optional[str] = None,
+        top_n: Optional[int] = None,
     ) -> dict:
         """
-        Retorna DTO completo do dashboard: project, period, metrics, series, meta.
-        Uma única busca JQL paginada; agregação e cálculos no backend.
+        Retorna DTO completo do dashboard: project, period, metrics, series, meta (e breakdown com group_by).
+        Resultado em cache por (tenant, projeto, período resolvido, filtros, agrupamento), com
+        stale-while-revalidate; meta.cached / meta.ageSeconds indicam a origem.
         
         Args:
             credentials: Dict opcional com {base_url, email, api_token} para autenticação dinâmica
+            filters: Filtros opcionais {components, labels, assignees, priorities, statuses: [valores]},
+                avaliados localmente sobre o cache colunar (OR entre valores, AND entre campos)
+            group_by: Agrupamento opcional (chave de DASHBOARD_GROUP_BY): métricas por grupo em breakdown
+            top_n: Grupos mantidos no breakdown (padrão GROUP_BY_TOP_N_DEFAULT); o restante vira "other"
         """
-        import time
-        t0 = time.perf_counter()
         jira = self._get_jira(credentials)
+        normalized = _normalize_dashboard_filters(filters)
+        variant = tuple(sorted(normalized.items()))
+        if group_by is not None:
+            if group_by not in DASHBOARD_GROUP_BY:
+                raise ValueError(f"groupBy inválido: {group_by}. Use {', '.join(DASHBOARD_GROUP_BY)}.")
+            top_n = GROUP_BY_TOP_N_DEFAULT if top_n is None else top_n
+            if not 1 <= top_n <= GROUP_BY_TOP_N_MAX:
+                raise ValueError(f"topN deve estar entre 1 e {GROUP_BY_TOP_N_MAX}.")
+            variant += (("groupBy", group_by, top_n),)
+        # Filtros e group_by são avaliados nas colunas, não nos rollups do espelho
+        start_date_str, end_date_str, meta = await self._resolve_period(
+            jira, project_key, period_type, custom_start, custom_end, credentials,
+            rollup_range=not normalized and group_by is None,
+        )
+        return await self._cached_result(
+            "dashboard", jira, project_key, start_date_str, end_date_str, credentials,
+            lambda: self._compute_dashboard(
+                jira, project_key, period_type, start_date_str, end_date_str, meta, credentials, normalized,
+                group_by, top_n,
+            ),
+            variant=variant,
+            period_payload=_period_payload(period_type, start_date_str, end_date_str, meta),
+        )
 
-        def get_sprint_dates(pk: str):
-            return jira.get_sprint_current_dates(pk, credentials=credentials)
-
-        def get_sprint_previous_dates(pk: str):
-            return jira.get_sprint_previous_dates(pk, credentials=credentials)
+    async def get_bundle(
+        self,
+        project_key: str,
+        period_type: str,
+        custom_start: Optional[str] = None,
+        custom_end: Optional[str] = None,
+        sections: Optional[List[str]] = None,
+        credentials: Optional[dict] = None,
+    ) -> dict:
+        """
+        Dashboard e Status Time numa única chamada: período e projeto resolvidos uma vez (em
+        paralelo), seções calculadas em paralelo (cada uma pelo mesmo cache de resultados dos endpoints
+        individuais). Erro de período propaga (ValueError); erro de uma seção não derruba a outra.
+        Retorna project, period e sections {nome: resultado ou exceção}.
 
-        start_date_str, end_date_str, meta = resolve_period(
-            period_type=period_type,
-            custom_start=custom_start,
-            custom_end=custom_end,
-            project_key=project_key,
-            get_sprint_dates=get_sprint_dates,
-            get_sprint_previous_dates=get_sprint_previous_dates,
+        Args:
+            sections: Subconjunto de BUNDLE_SECTIONS (todas se omitido)
+            credentials: Dict opcional com {base_url, email, api_token} para autenticação dinâmica
+        """
+        jira = self._get_jira(credentials)
+        names = [name for name in BUNDLE_SECTIONS if sections is None or name in sections]
+        # Projeto buscado uma vez, junto com a resolução do período, e repassado às seções.
+        # Status Time não lê o espelho: com ela, o período custom fica no limite sem rollups
+        (start_date_str, end_date_str, meta), project_info = await asyncio.gather(
+            self._resolve_period(
+                jira, project_key, period_type, custom_start, custom_end, credentials,
+                rollup_range="statusTime" not in names,
+            ),
+            jira.get_project(project_key, credentials=credentials),
         )
+        period_payload = _period_payload(period_type, start_date_str, end_date_str, meta)
+
+        def section(name: str) -> Awaitable[dict]:
+            if name == "statusTime":
+                # Primeira página, com o summary de todas as issues
+                return self._status_time_page(
+                    jira, project_key, period_type, start_date_str, end_date_str, meta, credentials,
+                    project_info=project_info,
+                )
+            return self._cached_result(
+                name, jira, project_key, start_date_str, end_date_str, credentials,
+                lambda: self._compute_dashboard(
+                    jira, project_key, period_type, start_date_str, end_date_str, meta, credentials,
+                    project_info=project_info,
+                ),
+                period_payload=period_payload,
+            )
+
+        results = await asyncio.gather(*(section(name) for name in names), return_exceptions=True)
+        return {
+            "project": project_info,
+            "period": period_payload,
+            "sections": dict(zip(names, results)),
+        }
+
+    async def get_multi_dashboard(
+        self,
+        project_keys: Optional[List[str]],
+        period_type: str,
+        custom_start: Optional[str] = None,
+        custom_end: Optional[str] = None,
+        credentials: Optional[dict] = None,
+    ) -> dict:
+        """
+        Dashboard de vários projetos (project_keys vazio/None = todos os projetos visíveis).
+        Cada projeto passa por get_dashboard (mesmo cache e single-flight), em paralelo sob o limite
+        global DASHBOARD_MULTI_CONCURRENCY; erro de um projeto não derruba os demais.
+        Retorna period, projects [(key, resultado ou exceção)] e rollup (métricas e séries somadas
+        dos projetos que deram certo). Raises ValueError para período inválido ou projetos demais.
+        
+        Args:
+            credentials: Dict opcional com {base_url, email, api_token} para autenticação dinâmica
+        """
+        t0 = time_module.perf_counter()
+        jira = self._get_jira(credentials)
+
+        # Períodos que não dependem do projeto: validados uma vez, antes do fan-out
+        period_payload = {"type": period_type}
+        if not period_type.startswith("sprint_"):
+            start_date_str, end_date_str, meta = await self._resolve_period(
+                jira, "", period_type, custom_start, custom_end, credentials, rollup_range=True
+            )
+            period_payload = _period_payload(period_type, start_date_str, end_date_str, meta)
+
+        if project_keys:
+            keys = list(dict.fromkeys(k.strip().upper() for k in project_keys if k and k.strip()))
+        else:
+            keys = [p["key"] for p in await jira.project_search_all(credentials=credentials)]
+        max_projects = int(os.getenv("DASHBOARD_MULTI_MAX_PROJECTS", str(MULTI_PROJECT_MAX_DEFAULT)))
+        if len(keys) > max_projects:
+            raise ValueError(f"Máximo de {max_projects} projetos por requisição ({len(keys)} informados).")
+
+        semaphore = _multi_project_semaphore()
+
+        async def one(project_key: str) -> dict:
+            async with semaphore:
+                return await self.get_dashboard(project_key, period_type, custom_start, custom_end, credentials)
+
+        results = await asyncio.gather(*(one(k) for k in keys), return_exceptions=True)
+        succeeded = [r for r in results if not isinstance(r, BaseException)]
 
-        period_payload = {
-            "type": period_type,
-            "timezone": meta.get("timezone", "America/Sao_Paulo"),
-            "startDate": start_date_str,
-            "endDate": end_date_str,
-            "source": meta.get("source", period_type),
+        elapsed_ms = int((time_module.perf_counter() - t0) * 1000)
+        logger.info(
+            "[dashboard] multi projects=%s failed=%s period=%s durationMs=%s",
+            len(keys), len(keys) - len(succeeded), period_type, elapsed_ms,
+        )
+        return {
+            "period": period_payload,
+            "projects": list(zip(keys, results)),
+            "rollup": {"projects": len(succeeded), **_rollup_dashboards(succeeded)},
         }
-        if "sprint" in meta:
-            period_payload["sprint"] = meta["sprint"]
 
-        jql = build_defects_base_jql(project_key, start_date_str, end_date_str)
-        issues = jira.search_issues_paginated(jql, ["issuetype", "status", "created"], credentials=credentials)
+    async def get_trend(
+        self,
+        project_key: str,
+        mode: str,
+        sprint_count: Optional[int] = None,
+        period_type: Optional[str] = None,
+        custom_start: Optional[str] = None,
+        custom_end: Optional[str] = None,
+        credentials: Optional[dict] = None,
+    ) -> dict:
+        """
+        Tendência das métricas do dashboard em várias janelas, com uma única busca.
+        - mode=sprints: últimas sprint_count sprints (ativa + fechadas), da mais antiga para a mais recente.
+        - mode=period: período informado (current) contra a janela anterior comparável (previous):
+          sprint anterior do índice, mesmo trecho do mês anterior ou mesma duração imediatamente antes.
+        Janelas resolvidas de uma leitura do índice de sprints; issues de todas elas vêm de uma carga
+        do cache colunar (_issue_columns) e são separadas localmente. Raises ValueError para modo,
+        período ou sprints inválidos/indisponíveis.
+
+        Args:
+            credentials: Dict opcional com {base_url, email, api_token} para autenticação dinâmica
+        """
+        if mode not in TREND_MODES:
+            raise ValueError(f"mode inválido: {mode}. Use {', '.join(TREND_MODES)}.")
+        jira = self._get_jira(credentials)
+        period_payload = None
+        if mode == "sprints":
+            sprint_count = TREND_SPRINTS_DEFAULT if sprint_count is None else sprint_count
+            if not 1 <= sprint_count <= TREND_SPRINTS_MAX:
+                raise ValueError(f"sprints deve estar entre 1 e {TREND_SPRINTS_MAX}.")
+            index = await jira.get_sprint_index(project_key, credentials)
+            current = index.current()
+            sprints = ([current] if current else []) + index.last_closed(sprint_count - (1 if current else 0))
+            windows = [
+                {"label": sp.get("name") or "", "startDate": sp["startDate"], "endDate": sp["endDate"], "sprint": sp}
+                for sp in reversed(sprints)
+                if len(sp["startDate"]) == 10 and len(sp["endDate"]) == 10
+            ]
+            if not windows:
+                raise ValueError("Nenhuma sprint com datas encontrada para o projeto informado.")
+        else:
+            if not period_type:
+                raise ValueError("period é obrigatório quando mode=period.")
+            start_date_str, end_date_str, meta = await self._resolve_period(
+                jira, project_key, period_type, custom_start, custom_end, credentials
+            )
+            period_payload = _period_payload(period_type, start_date_str, end_date_str, meta)
+            current = {"label": "current", "startDate": start_date_str, "endDate": end_date_str}
+            if "sprint" in meta:
+                current["sprint"] = meta["sprint"]
+            if period_type.startswith("sprint_"):
+                # Mesmo índice já lido por _resolve_period: sem nova listagem de sprints
+                index = await jira.get_sprint_index(project_key, credentials)
+                candidates = index.last_closed(2)
+                sprint = candidates[0] if period_type == "sprint_current" else (candidates[1:] or [None])[0]
+                if sprint is None or len(sprint["startDate"]) != 10 or len(sprint["endDate"]) != 10:
+                    raise ValueError("Sprint anterior indisponível para o projeto informado.")
+                previous = {"label": "previous", "startDate": sprint["startDate"], "endDate": sprint["endDate"], "sprint": sprint}
+            else:
+                previous_start, previous_end = previous_period_window(
+                    period_type, date.fromisoformat(start_date_str), date.fromisoformat(end_date_str)
+                )
+                previous = {"label": "previous", "startDate": previous_start.isoformat(), "endDate": previous_end.isoformat()}
+            windows = [previous, current]
+
+        span_start = min(w["startDate"] for w in windows)
+        span_end = max(w["endDate"] for w in windows)
+        return await self._cached_result(
+            "trend", jira, project_key, span_start, span_end, credentials,
+            lambda: self._compute_trend(jira, project_key, mode, windows, period_payload, credentials),
+            # Janelas (e sprint de cada uma) dependem do tipo de período: ele entra na variante
+            variant=(mode, period_type if mode == "period" else None, *((w["startDate"], w["endDate"]) for w in windows)),
+            period_payload=period_payload,
+        )
+
+    async def _compute_trend(
+        self,
+        jira,
+        project_key: str,
+        mode: str,
+        windows: List[dict],
+        period_payload: Optional[dict] = None,
+        credentials: Optional[dict] = None,
+    ) -> dict:
+        """
+        Métricas de cada janela ({label, startDate, endDate[, sprint]}) a partir de uma carga das
+        colunas cobrindo todas elas: uma máscara de created por janela + bincount das categorias.
+        """
+        t0 = time_module.perf_counter()
+        columns = await self._issue_columns(
+            jira,
+            project_key,
+            date.fromisoformat(min(w["startDate"] for w in windows)),
+            date.fromisoformat(max(w["endDate"] for w in windows)),
+            credentials,
+        )
+        results = []
+        for window in windows:
+            mask = columns.select(day_start_ms(window["startDate"]), day_start_ms(window["endDate"]))
+            categories = _column_categories(columns, mask)
+            results.append({
+                **window,
+                "issues": int(mask.sum()),
+                "metrics": _category_metrics(np.bincount(categories[categories >= 0], minlength=_DEFECT_CATEGORIES)),
+            })
+
+        meta_payload = {"generatedAt": _generated_at(), "source": "jira"}
+        column_meta = _column_cache_meta((jira.tenant_key(credentials), project_key.strip().upper()), columns)
+        if column_meta is not None:
+            meta_payload["columnCache"] = column_meta
+        elapsed_ms = int((time_module.perf_counter() - t0) * 1000)
+        logger.info(
+            "[dashboard] trend project=%s mode=%s windows=%s issues=%s durationMs=%s",
+            project_key, mode, len(windows), len(columns), elapsed_ms,
+        )
+
+        project_info = await jira.get_project(project_key, credentials=credentials)
+        payload = {"project": project_info, "mode": mode, "windows": results, "meta": meta_payload}
+        if period_payload is not None:
+            payload["period"] = period_payload
+            payload["change"] = _metrics_change(results[1]["metrics"], results[0]["metrics"])
+        return payload
+
+    async def _compute_dashboard(
+        self,
+        jira,
+        project_key: str,
+        period_type: str,
+        start_date_str: str,
+        end_date_str: str,
+        meta: dict,
+        credentials: Optional[dict] = None,
+        filters: Optional[dict] = None,
+        group_by: Optional[str] = None,
+        top_n: int = GROUP_BY_TOP_N_DEFAULT,
+        project_info: Optional[dict] = None,
+    ) -> dict:
+        """
+        Calcula o dashboard do período já resolvido (project_info: projeto já buscado, ex.: pelo bundle).
+        Busca JQL paginada, particionada por data em fatias paralelas; cada página é agregada
+        assim que chega (DefectsAggregator), sem materializar a lista completa de issues.
+        Com o espelho local, usa os rollups diários (contagens por dia/tipo/status); senão, se o
+        período cabe no cache colunar (_column_cache_span), fatia as colunas do projeto (_issue_columns).
+        filters ({coluna: valores}, de _normalize_dashboard_filters) sempre usa as colunas: a máscara
+        do período é combinada com os índices por valor dos filtros, sem nova busca por combinação.
+        group_by também usa as colunas: breakdown com as métricas por grupo (_group_breakdown).
+        Períodos fora do cache sem filtros/group_by seguem pela busca em streaming.
+        """
+        t0 = time_module.perf_counter()
+        volume_key = (jira.tenant_key(credentials), project_key.strip().upper())
+
+        period_payload = _period_payload(period_type, start_date_str, end_date_str, meta)
 
         start_d = date.fromisoformat(start_date_str)
         end_d = date.fromisoformat(end_date_str)
-        days = list_days(start_d, end_d)
 
-        production_bugs_valid = 0
-        total_defects_valid = 0
-        total_reported = 0
-        sub_bugs_valid = 0
-        bugs_valid = 0
-        
-        # Contadores para breakdown (fechados/abertos)
-        sub_bugs_closed = 0
-        sub_bugs_open = 0
-        bugs_closed = 0
-        bugs_open = 0
-
-        daily_prod_bugs: dict[str, int] = defaultdict(int)
-        daily_total_valid: dict[str, int] = defaultdict(int)
-        daily_valid: dict[str, int] = defaultdict(int)
-        daily_reported: dict[str, int] = defaultdict(int)
-
-        days_set = set(days)
-        for issue in issues:
-            it = (issue.get("issuetype") or "").strip()
-            st = (issue.get("status") or "").strip()
-            created = issue.get("created") or ""
-            day = _created_to_day_br(created)
-            is_bug = it == ISSUE_TYPE_BUG
-            is_sub_bug = it == ISSUE_TYPE_SUB_BUG
-            if not (is_bug or is_sub_bug):
-                continue
-            is_valid = st != STATUS_CANCELED
-            is_closed = st in STATUS_CLOSED
-            total_reported += 1
-            if day and day in days_set:
-                daily_reported[day] += 1
-            if is_valid:
-                total_defects_valid += 1
-                if day and day in days_set:
-                    daily_total_valid[day] += 1
-                    daily_valid[day] += 1
-            if is_bug and is_valid:
-                production_bugs_valid += 1
-                bugs_valid += 1
-                if is_closed:
-                    bugs_closed += 1
-                else:
-                    bugs_open += 1
-                if day and day in days_set:
-                    daily_prod_bugs[day] += 1
-            if is_sub_bug and is_valid:
-                sub_bugs_valid += 1
-                if is_closed:
-                    sub_bugs_closed += 1
-                else:
-                    sub_bugs_open += 1
-
-        rate_leakage = (production_bugs_valid / total_defects_valid * 100) if total_defects_valid else 0.0
-        rate_valid = (total_defects_valid / total_reported * 100) if total_reported else 0.0
-        ratio = (sub_bugs_valid / bugs_valid) if bugs_valid else None
-
-        metrics = {
-            "defectLeakage": {
-                "productionBugs": production_bugs_valid,
-                "totalDefectsValid": total_defects_valid,
-                "ratePercent": round(rate_leakage, 2),
-            },
-            "defectValidRate": {
-                "validDefects": total_defects_valid,
-                "totalReported": total_reported,
-                "ratePercent": round(rate_valid, 2),
-            },
-            "defectsRatio": {
-                "subBugsValid": sub_bugs_valid,
-                "bugsValid": bugs_valid,
-                "ratio": round(ratio, 2) if ratio is not None else None,
-            },
-            "defectsBreakdown": {
-                "closed": sub_bugs_closed,
-                "open": sub_bugs_open,
-                "total": sub_bugs_valid,
-            },
-            "bugsBreakdown": {
-                "closed": bugs_closed,
-                "open": bugs_open,
-                "total": bugs_valid,
-            },
-        }
+        column_span = _column_cache_span(get_issue_column_cache(), volume_key, start_d, end_d)
+        mirror = get_issue_mirror()
+        mirror_info = None
+        if mirror and not filters and not group_by:
+            mirror_info = await mirror.ensure_fresh(jira, project_key, start_date_str, credentials)
+        shards = 0
+        columns = None
+        breakdown = None
+        aggregator = DefectsAggregator(list_days(start_d, end_d))
+        rollups = await mirror.query_defect_rollups(mirror_info["scope"], start_date_str, end_date_str) if mirror_info else None
+        if rollups is not None:
+            # Contagens diárias materializadas: custo proporcional a dias, não a issues
+            aggregator.add_counts(rollups)
+        elif mirror_info:
+            aggregator.add_many(await mirror.query_defects(mirror_info["scope"], start_date_str, end_date_str))
+        elif filters or group_by or column_span is not None:
+            # Período fatiado das colunas em memória do projeto (busca só se o span não cobrir)
+            columns = await self._issue_columns(jira, project_key, start_d, end_d, credentials)
+            mask = columns.select(day_start_ms(start_date_str), day_start_ms(end_date_str))
+            if filters:
+                mask &= columns.filter_mask(filters)
+            aggregator.add_columns(columns, mask)
+            if group_by:
+                sprints = None
+                if DASHBOARD_GROUP_BY[group_by] is None:
+                    sprints = await self._sprint_windows(jira, project_key, start_date_str, end_date_str, credentials)
+                breakdown = _group_breakdown(columns, mask, group_by, top_n, sprints)
+        else:
+            # Busca particionada por data: páginas das fatias agregadas conforme chegam
+            shards = _plan_search_shards(volume_key, start_d, end_d)
+            async for page in jira.iter_issues_sharded_pages(
+                lambda start, end, end_exclusive: build_defects_base_jql(project_key, start, end, end_exclusive),
+                start_date_str,
+                end_date_str,
+                ["issuetype", "status", "created"],
+                shards=shards,
+                credentials=credentials,
+            ):
+                aggregator.add_many(page)
+            _record_search_volume(volume_key, aggregator.issue_count, start_d, end_d)
 
-        leakage_values = []
-        leakage_prod = []
-        leakage_total = []
-        valid_rate_values = []
-        valid_valid = []
-        valid_reported = []
-        for d in days:
-            tv = daily_total_valid.get(d, 0)
-            pb = daily_prod_bugs.get(d, 0)
-            leakage_total.append(tv)
-            leakage_prod.append(pb)
-            leakage_values.append(round((pb / tv * 100) if tv else 0.0, 2))
-            tr = daily_reported.get(d, 0)
-            vd = daily_valid.get(d, 0)
-            valid_reported.append(tr)
-            valid_valid.append(vd)
-            valid_rate_values.append(round((vd / tr * 100) if tr else 0.0, 2))
-
-        series = {
-            "defectLeakageDaily": {
-                "labels": days,
-                "valuesPercent": leakage_values,
-                "productionBugs": leakage_prod,
-                "totalDefectsValid": leakage_total,
-            },
-            "defectValidRateDaily": {
-                "labels": days,
-                "valuesPercent": valid_rate_values,
-                "validDefects": valid_valid,
-                "totalReported": valid_reported,
-            },
-        }
+        metrics = aggregator.metrics()
+        series = aggregator.series()
 
-        generated_at = datetime.now(TIMEZONE).strftime("%Y-%m-%dT%H:%M:%S%z")
-        if len(generated_at) == 22 and generated_at[-5] in "+-":
-            generated_at = generated_at[:-2] + ":" + generated_at[-2:]
+        generated_at = _generated_at()
         meta_payload = {
             "generatedAt": generated_at,
             "source": "jira",
@@ -365,135 +1601,411 @@ class DashboardService:
                 "Cálculos realizados no backend; front apenas renderiza",
             ],
         }
+        if mirror_info:
+            meta_payload["mirror"] = {"syncedAt": mirror_info["syncedAt"], "rollups": rollups is not None}
+        if filters:
+            meta_payload["filters"] = {
+                field: list(filters[column]) for field, column in DASHBOARD_FILTERS.items() if column in filters
+            }
+        column_meta = _column_cache_meta(volume_key, columns) if columns is not None else None
+        if column_meta is not None:
+            meta_payload["columnCache"] = column_meta
 
-        elapsed_ms = int((time.perf_counter() - t0) * 1000)
+        elapsed_ms = int((time_module.perf_counter() - t0) * 1000)
         logger.info(
-            "[dashboard] project=%s period=%s start=%s end=%s issues=%s durationMs=%s",
-            project_key, period_type, start_date_str, end_date_str, len(issues), elapsed_ms,
+            "[dashboard] project=%s period=%s start=%s end=%s issues=%s shards=%s mirror=%s columns=%s durationMs=%s",
+            project_key, period_type, start_date_str, end_date_str, aggregator.issue_count, shards, bool(mirror_info),
+            columns is not None, elapsed_ms,
         )
 
-        project_info = jira.get_project(project_key, credentials=credentials)
-        return {
+        if project_info is None:
+            project_info = await jira.get_project(project_key, credentials=credentials)
+        payload = {
             "project": project_info,
             "period": period_payload,
             "metrics": metrics,
             "series": series,
             "meta": meta_payload,
         }
+        if breakdown is not None:
+            payload["breakdown"] = breakdown
+        return payload
+
+    async def _sprint_windows(
+        self,
+        jira,
+        project_key: str,
+        start_date_str: str,
+        end_date_str: str,
+        credentials: Optional[dict] = None,
+    ) -> List[dict]:
+        """
+        Sprints (sprint_info) do índice do projeto cuja janela [startDate, endDate] cruza o período,
+        ordenadas por início. Raises ValueError se o projeto não tiver board de sprints.
+        """
+        index = await jira.get_sprint_index(project_key, credentials)
+        if not index.boards:
+            raise ValueError("Sprints indisponíveis para o projeto informado.")
+        sprints = [sprint_info(sp) for sp in index.all_sprints()]
+        return sorted(
+            (
+                sp for sp in sprints
+                if len(sp["startDate"]) == 10 and len(sp["endDate"]) == 10
+                and sp["startDate"] <= end_date_str and sp["endDate"] >= start_date_str
+            ),
+            key=lambda sp: (sp["startDate"], str(sp["id"])),
+        )
+
+    async def _issue_columns(
+        self,
+        jira,
+        project_key: str,
+        start_d: date,
+        end_d: date,
+        credentials: Optional[dict] = None,
+    ) -> IssueColumns:
+        """
+        Colunas das issues do dashboard do projeto cobrindo [start_d, end_d], do cache colunar.
+        Sem cobertura (ou vencido, DASHBOARD_COLUMN_CACHE_TTL), carrega numa única busca
+        particionada o span de _column_cache_span e o guarda no cache.
+        Período que não passa pelo cache (desativado, antigo, longo ou grande demais): carrega só
+        [start_d, end_d], sem guardar (usado por filtros, group_by e tendência).
+        """
+        cache = get_issue_column_cache()
+        pk = project_key.strip().upper()
+        key = (jira.tenant_key(credentials), pk)
+        if cache is not None:
+            ttl = float(os.getenv("DASHBOARD_COLUMN_CACHE_TTL", str(COLUMN_CACHE_TTL_DEFAULT)))
+            columns = cache.get(key, day_start_ms(start_d.isoformat()), day_start_ms(end_d.isoformat()), ttl)
+            if columns is not None:
+                return columns
+        span = _column_cache_span(cache, key, start_d, end_d)
+        span_start, span_end = span or (start_d, end_d)
+
+        async def load() -> IssueColumns:
+            t0 = time_module.perf_counter()
+            shards = _plan_search_shards(key, span_start, span_end)
+            issues = []
+            async for page in jira.iter_issues_sharded_pages(
+                lambda start, end, end_exclusive: build_defects_base_jql(pk, start, end, end_exclusive),
+                span_start.isoformat(),
+                span_end.isoformat(),
+                DASHBOARD_ISSUE_FIELDS,
+                shards=shards,
+                credentials=credentials,
+            ):
+                issues.extend(page)
+            _record_search_volume(key, len(issues), span_start, span_end)
+            loaded = IssueColumns.from_issues(issues, span_start.isoformat(), span_end.isoformat())
+            stored = cache.put(key, loaded) if span is not None else False
+            logger.info(
+                "[columnCache] project=%s span=%s..%s issues=%s bytes=%s shards=%s cached=%s durationMs=%s",
+                pk, loaded.span_start, loaded.span_end, len(loaded), loaded.nbytes(), shards, stored,
+                int((time_module.perf_counter() - t0) * 1000),
+            )
+            return loaded
+
+        return await _flights.do(("columns", key, span_start, span_end), load)
+
+    async def _fetch_status_changelogs(self, jira, issues: List[dict], credentials: Optional[dict] = None) -> dict:
+        """
+        Retorna dict key -> changelog (lista de { created, items }) com apenas transições de status.
+        Usa o bulk changelog do Jira (poucas requisições, paginação completa); se indisponível,
+        cai para GET por issue em paralelo (limite de concorrência e timeout por issue).
+        Issues cuja busca falhou ficam fora do dict.
+        """
+        ids = [item["id"] for item in issues if item.get("id")]
+        if len(ids) == len(issues):
+            try:
+                by_id = await jira.get_changelogs_bulk(ids, field_ids=["status"], credentials=credentials)
+                return {item["key"]: by_id.get(str(item["id"]), []) for item in issues}
+            except PermissionError:
+                raise
+            except Exception as e:
+                logger.warning("[statusTime] bulk changelog indisponível, usando GET por issue: %s", e)
+
+        concurrency = int(os.getenv("DASHBOARD_STATUS_TIME_CONCURRENCY", str(STATUS_TIME_CONCURRENCY_DEFAULT)))
+        issue_timeout = float(os.getenv("DASHBOARD_STATUS_TIME_ISSUE_TIMEOUT", str(STATUS_TIME_ISSUE_TIMEOUT_DEFAULT)))
+
+        async def fetch_changelog(item: dict) -> list:
+            full = await jira.get_issue(item["key"], fields=["changelog"], credentials=credentials)
+            return (full.get("fields") or {}).get("changelog") or []
 
-    def get_status_time(
+        results = await _gather_bounded(issues, fetch_changelog, concurrency, timeout=issue_timeout, label="statusTime")
+        return {item["key"]: changelog for item, changelog in zip(issues, results) if changelog is not None}
+
+    async def get_status_time(
         self,
         project_key: str,
         period_type: str,
         custom_start: Optional[str] = None,
         custom_end: Optional[str] = None,
+        page_size: Optional[int] = None,
+        sort_by: Optional[str] = None,
+        sort_dir: Optional[str] = None,
+        cursor: Optional[str] = None,
+        statuses: Optional[List[str]] = None,
         credentials: Optional[dict] = None,
     ) -> dict:
         """
         Retorna DTO para Status Time: issues que passaram por QA com tempo em
-        Ready to test e In Test. Limita a MAX_ISSUES_STATUS_TIME issues;
-        para cada uma faz GET com changelog e calcula intervalos.
+        Ready to test e In Test, paginadas por cursor. summary cobre todas as issues do período.
+        Raises ValueError para período ou cursor inválido.
         
         Args:
+            page_size: Issues por página (padrão STATUS_TIME_PAGE_SIZE_DEFAULT)
+            sort_by: Um de STATUS_TIME_SORT_KEYS (padrão "created")
+            sort_dir: "asc" ou "desc" (padrão "asc")
+            cursor: page.nextCursor da página anterior (mantém ordenação e sentido)
+            statuses: Status a detalhar (horas/entradas por issue e no summary); padrão STATUS_TIME_TARGET
             credentials: Dict opcional com {base_url, email, api_token} para autenticação dinâmica
         """
-        t0 = time_module.perf_counter()
         jira = self._get_jira(credentials)
+        start_date_str, end_date_str, meta = await self._resolve_period(
+            jira, project_key, period_type, custom_start, custom_end, credentials
+        )
+        return await self._status_time_page(
+            jira, project_key, period_type, start_date_str, end_date_str, meta, credentials,
+            page_size=page_size, sort_by=sort_by, sort_dir=sort_dir, cursor=cursor, statuses=statuses,
+        )
 
-        def get_sprint_dates(pk: str):
-            return jira.get_sprint_current_dates(pk, credentials=credentials)
+    async def stream_status_time(
+        self,
+        project_key: str,
+        period_type: str,
+        custom_start: Optional[str] = None,
+        custom_end: Optional[str] = None,
+        statuses: Optional[List[str]] = None,
+        credentials: Optional[dict] = None,
+    ) -> AsyncIterator[dict]:
+        """
+        Status Time em streaming (um evento por linha NDJSON):
+        - {"type": "meta", "data": {project, period}} primeiro (ValueError aqui se o período for inválido);
+        - {"type": "issue", "data": linha} por issue, assim que o changelog da sua página de busca
+          é processado (mesmo schema das linhas de get_status_time; sem ordem definida);
+        - {"type": "summary", "data": summary, "meta": meta} ao final, sobre todas as issues.
+        Com o índice em cache as linhas saem do índice; senão as páginas da busca e seus
+        changelogs são processados em paralelo e o índice final vai para o cache.
+        
+        Args:
+            statuses: Status a detalhar, como em get_status_time
+            credentials: Dict opcional com {base_url, email, api_token} para autenticação dinâmica
+        """
+        jira = self._get_jira(credentials)
+        start_date_str, end_date_str, meta = await self._resolve_period(
+            jira, project_key, period_type, custom_start, custom_end, credentials
+        )
+        project_info = await jira.get_project(project_key, credentials=credentials)
+        period_payload = _period_payload(period_type, start_date_str, end_date_str, meta)
+        yield {"type": "meta", "data": {"project": project_info, "period": period_payload}}
 
-        def get_sprint_previous_dates(pk: str):
-            return jira.get_sprint_previous_dates(pk, credentials=credentials)
+        key = _result_key("statusTime", jira, project_key, start_date_str, end_date_str, credentials)
+        hit, _, _ = get_result_cache().peek(key)
+        if hit:
+            index, index_meta = await self._status_time_index(
+                jira, project_key, period_type, start_date_str, end_date_str, credentials
+            )
+            for row in index.rows(range(len(index)), statuses):
+                yield {"type": "issue", "data": row}
+            yield {"type": "summary", "data": index.summary(statuses), "meta": index_meta}
+            return
 
-        start_date_str, end_date_str, meta = resolve_period(
-            period_type=period_type,
-            custom_start=custom_start,
-            custom_end=custom_end,
-            project_key=project_key,
-            get_sprint_dates=get_sprint_dates,
-            get_sprint_previous_dates=get_sprint_previous_dates,
+        t0 = time_module.perf_counter()
+        timeline = StatusTimeline()
+        entries = []
+        sketches = _status_time_sketches(timeline)
+        pages = jira.iter_issues_pages(
+            build_status_time_jql(project_key, start_date_str, end_date_str),
+            ["summary", "status", "created", "issuetype"],
+            max_results_per_page=STATUS_TIME_SEARCH_PAGE_SIZE,
+            credentials=credentials,
         )
 
-        period_payload = {
-            "type": period_type,
-            "timezone": meta.get("timezone", "America/Sao_Paulo"),
-            "startDate": start_date_str,
-            "endDate": end_date_str,
-            "source": meta.get("source", period_type),
+        async def process(issues: List[dict]) -> tuple[List[dict], dict]:
+            return issues, await self._fetch_status_changelogs(jira, issues, credentials)
+
+        # Próxima página da busca e changelogs das páginas já recebidas correm juntos
+        next_page = asyncio.ensure_future(pages.__anext__())
+        pending = {next_page}
+        try:
+            while pending:
+                done, pending = await asyncio.wait(pending, return_when=asyncio.FIRST_COMPLETED)
+                for task in done:
+                    if task is next_page:
+                        try:
+                            page = task.result()
+                        except StopAsyncIteration:
+                            continue
+                        issues = _status_time_process_filter(page)
+                        if issues:
+                            pending.add(asyncio.ensure_future(process(issues)))
+                        next_page = asyncio.ensure_future(pages.__anext__())
+                        pending.add(next_page)
+                        continue
+                    issues, changelogs = task.result()
+                    page_timeline = StatusTimeline(now_ms=timeline.now_ms)
+                    page_entries = _add_status_time_issues(page_timeline, issues, changelogs)
+                    page_items, *_ = _status_time_items(page_entries, page_timeline, statuses)
+                    timeline.extend(page_timeline)
+                    entries.extend(page_entries)
+                    _merge_status_time_sketches(sketches, _status_time_sketches(page_timeline))
+                    for item in page_items:
+                        yield {"type": "issue", "data": _status_time_row(item)}
+        finally:
+            for task in pending:
+                task.cancel()
+            if pending:
+                await asyncio.gather(*pending, return_exceptions=True)
+            await pages.aclose()
+
+        index = StatusTimeIndex(entries, timeline, sketches, _status_time_index_meta())
+        get_result_cache().put(key, index, closed_period=_is_closed_period(end_date_str), immutable=True)
+        logger.info(
+            "[statusTime] project=%s period=%s issues=%s stream=True durationMs=%s",
+            project_key, period_type, len(entries), int((time_module.perf_counter() - t0) * 1000),
+        )
+
+        yield {
+            "type": "summary",
+            "data": index.summary(statuses),
+            "meta": {**index.meta, "cached": False, "ageSeconds": 0},
         }
-        if "sprint" in meta:
-            period_payload["sprint"] = meta["sprint"]
 
-        jql = build_status_time_jql(project_key, start_date_str, end_date_str)
-        issues_from_search = jira.search_issues_paginated(
-            jql, ["summary", "status", "created", "issuetype"], max_results_per_page=MAX_ISSUES_STATUS_TIME, credentials=credentials
+    async def _status_time_page(
+        self,
+        jira,
+        project_key: str,
+        period_type: str,
+        start_date_str: str,
+        end_date_str: str,
+        meta: dict,
+        credentials: Optional[dict] = None,
+        page_size: Optional[int] = None,
+        sort_by: Optional[str] = None,
+        sort_dir: Optional[str] = None,
+        cursor: Optional[str] = None,
+        statuses: Optional[List[str]] = None,
+        project_info: Optional[dict] = None,
+    ) -> dict:
+        """
+        Uma página do Status Time a partir do índice do período (em cache, ver _compute_status_time_index).
+        project_info: projeto já buscado pelo chamador (ex.: bundle); senão é buscado aqui.
+        Paginação por keyset: o cursor guarda a ordenação e a última posição (valor, key), então
+        continua válido mesmo se o índice for recalculado entre as páginas.
+        statuses: status extras a reportar (horas e entradas por issue e no summary); saem da
+        timeline do índice, sem nova busca no Jira.
+        """
+        after = None
+        if cursor:
+            cursor_sort, cursor_dir, after = _decode_status_time_cursor(cursor)
+            if (sort_by and sort_by != cursor_sort) or (sort_dir and sort_dir != cursor_dir):
+                raise ValueError("cursor inválido: sortBy/sortDir diferentes dos da página anterior.")
+            sort_by, sort_dir = cursor_sort, cursor_dir
+        sort_by = sort_by or "created"
+        sort_dir = sort_dir or "asc"
+        if sort_by not in STATUS_TIME_SORT_KEYS:
+            raise ValueError(f"sortBy inválido: {sort_by}")
+        if sort_dir not in ("asc", "desc"):
+            raise ValueError(f"sortDir inválido: {sort_dir}")
+        page_size = max(1, min(STATUS_TIME_PAGE_SIZE_MAX, page_size or STATUS_TIME_PAGE_SIZE_DEFAULT))
+
+        index, index_meta = await self._status_time_index(
+            jira, project_key, period_type, start_date_str, end_date_str, credentials
         )
-        issues_slice = issues_from_search[:MAX_ISSUES_STATUS_TIME]
 
-        rows = []
-        totals_ready = 0
-        totals_in_test = 0
+        # Ordem ascendente por (valor, key), memorizada no índice; desc percorre de trás para frente
+        positions, ordered = index.order(sort_by)
+        if sort_dir == "asc":
+            begin = bisect_right(positions, after) if after is not None else 0
+            page = ordered[begin:begin + page_size]
+            has_more = begin + page_size < len(ordered)
+            last = begin + len(page) - 1
+        else:
+            stop = bisect_left(positions, after) if after is not None else len(ordered)
+            page = ordered[max(0, stop - page_size):stop][::-1]
+            has_more = stop - page_size > 0
+            last = max(0, stop - page_size)
+        next_cursor = None
+        if page and has_more:
+            next_cursor = _encode_status_time_cursor(sort_by, sort_dir, positions[last])
 
-        for item in issues_slice:
-            key = item.get("key")
-            if not key:
-                continue
-            
-            # Pegar issuetype da busca inicial (já parseado como string)
-            issue_type = item.get("issuetype") or "-"
-            
-            try:
-                full = jira.get_issue(key, fields=["summary", "created", "status", "changelog"], credentials=credentials)
-            except Exception as e:
-                logger.warning("[statusTime] skip issue %s: %s", key, e)
-                continue
-            fields = full.get("fields") or {}
-            summary = (fields.get("summary") or "").strip() or "-"
-            status_obj = fields.get("status")
-            current_status = status_obj.get("name", "-") if isinstance(status_obj, dict) else "-"
-            
-            # Ignorar issues canceladas - não passaram pelo fluxo de testes
-            if current_status == STATUS_CANCELED:
-                continue
-            
-            created_iso = fields.get("created") or ""
-            changelog = fields.get("changelog") or []
-
-            # changelog do get_issue vem como lista de { created, items }; ordenar por created asc
-            changelog_sorted = sorted(changelog, key=lambda h: h.get("created") or "")
-            totals_ms = _calc_time_in_statuses(created_iso, changelog_sorted, STATUS_TIME_TARGET)
-            ready_ms = totals_ms.get("Ready to test", 0)
-            in_test_ms = totals_ms.get("In Test", 0)
-            total_ms = ready_ms + in_test_ms
-
-            ready_h = round(ready_ms / (1000 * 60 * 60), 2)
-            in_test_h = round(in_test_ms / (1000 * 60 * 60), 2)
-            total_h = round(total_ms / (1000 * 60 * 60), 2)
-
-            totals_ready += ready_ms
-            totals_in_test += in_test_ms
-            rows.append({
-                "key": key,
-                "issueType": issue_type,
-                "summary": summary,
-                "currentStatus": current_status,
-                "readyToTestHours": ready_h,
-                "inTestHours": in_test_h,
-                "totalHours": total_h,
-            })
+        period_payload = _period_payload(period_type, start_date_str, end_date_str, meta)
+
+        if project_info is None:
+            project_info = await jira.get_project(project_key, credentials=credentials)
+        return {
+            "project": project_info,
+            "period": period_payload,
+            "issues": index.rows(page, statuses),
+            "summary": index.summary(statuses),
+            "page": {
+                "pageSize": page_size,
+                "sortBy": sort_by,
+                "sortDir": sort_dir,
+                "returned": len(page),
+                "total": len(ordered),
+                "nextCursor": next_cursor,
+            },
+            "meta": index_meta,
+        }
+
+    async def _status_time_index(
+        self,
+        jira,
+        project_key: str,
+        period_type: str,
+        start_date_str: str,
+        end_date_str: str,
+        credentials: Optional[dict] = None,
+    ) -> tuple[StatusTimeIndex, dict]:
+        """
+        Índice do Status Time pelo cache de resultados, sem cópia (somente leitura, ver
+        StatusTimeIndex). Retorna (índice, meta do índice com cached e ageSeconds).
+        """
+        key = _result_key("statusTime", jira, project_key, start_date_str, end_date_str, credentials)
+        index, cached, age = await get_result_cache().get_or_compute(
+            key,
+            lambda: _flights.do(
+                key,
+                lambda: self._compute_status_time_index(
+                    jira, project_key, period_type, start_date_str, end_date_str, credentials
+                ),
+                copy_result=False,
+            ),
+            closed_period=_is_closed_period(end_date_str),
+            immutable=True,
+        )
+        return index, {**index.meta, "cached": cached, "ageSeconds": int(age)}
+
+    async def _compute_status_time_index(
+        self,
+        jira,
+        project_key: str,
+        period_type: str,
+        start_date_str: str,
+        end_date_str: str,
+        credentials: Optional[dict] = None,
+    ) -> StatusTimeIndex:
+        """
+        Passo agregado do Status Time: todas as issues do período (sem limite de quantidade) e a
+        StatusTimeline com os intervalos de todos os status (uma passada por changelog), mais os
+        sketches de tempo por status (percentis/histogramas do summary).
+        Changelogs (apenas status) via bulk changelog, em lotes; não são guardados no índice.
+        """
+        t0 = time_module.perf_counter()
+
+        jql = build_status_time_jql(project_key, start_date_str, end_date_str)
+        issues_from_search = await jira.search_issues_paginated(
+            jql, ["summary", "status", "created", "issuetype"],
+            max_results_per_page=STATUS_TIME_SEARCH_PAGE_SIZE, credentials=credentials,
+        )
 
-        count = len(rows)
-        total_ready_h = round(totals_ready / (1000 * 60 * 60), 2)
-        total_in_test_h = round(totals_in_test / (1000 * 60 * 60), 2)
-        total_all_h = round((totals_ready + totals_in_test) / (1000 * 60 * 60), 2)
-        avg_ready = round(total_ready_h / count, 2) if count else 0
-        avg_in_test = round(total_in_test_h / count, 2) if count else 0
+        issues_to_process = _status_time_process_filter(issues_from_search)
+        changelogs = await self._fetch_status_changelogs(jira, issues_to_process, credentials)
 
-        project_info = jira.get_project(project_key, credentials=credentials)
-        generated_at = datetime.now(TIMEZONE).strftime("%Y-%m-%dT%H:%M:%S%z")
-        if len(generated_at) == 22 and generated_at[-5] in "+-":
-            generated_at = generated_at[:-2] + ":" + generated_at[-2:]
+        timeline = StatusTimeline()
+        entries = _add_status_time_issues(timeline, issues_to_process, changelogs)
+        count = len(entries)
 
         elapsed_ms = int((time_module.perf_counter() - t0) * 1000)
         logger.info(
@@ -501,24 +2013,4 @@ class DashboardService:
             project_key, period_type, count, elapsed_ms,
         )
 
-        return {
-            "project": project_info,
-            "period": period_payload,
-            "issues": rows,
-            "summary": {
-                "count": count,
-                "totalReadyToTestHours": total_ready_h,
-                "totalInTestHours": total_in_test_h,
-                "totalHours": total_all_h,
-                "avgReadyToTestHours": avg_ready,
-                "avgInTestHours": avg_in_test,
-            },
-            "meta": {
-                "generatedAt": generated_at,
-                "notes": [
-                    "Tempo em 'Ready to test' e 'In Test' calculado a partir do changelog.",
-                    "Issues com status 'Cancelado' são excluídas do cálculo.",
-                    f"Máximo de {MAX_ISSUES_STATUS_TIME} issues processadas.",
-                ],
-            },
-        }
+        return StatusTimeIndex(entries, timeline, _status_time_sketches(timeline), _status_time_index_meta())
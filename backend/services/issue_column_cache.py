@@ -0,0 +1,320 @@
+# backend/services/issue_column_cache.py
+
+"""
+Cache colunar em memória das issues do dashboard (Bug/Sub-Bug) por (tenant, projeto).
+Cada projeto guarda um intervalo contínuo de criação (span) em arrays NumPy: created (ms),
+dia local (dias desde 1970-01-01) e colunas codificadas por dicionário (tipo, status,
+responsável, prioridade, componentes, labels), com um índice por valor para filtros. Qualquer
+período e combinação de filtros dentro do span é respondido fatiando os arrays, sem nova busca
+no Jira. Orçamento de memória global com descarte LRU entre projetos.
+"""
+
+import os
+import threading
+import time
+from collections import OrderedDict
+from datetime import date, datetime, time as dt_time
+from typing import Hashable, Iterable, List, Optional
+
+import numpy as np
+
+from backend.utils.date_range_utils import TIMEZONE
+from backend.utils.jira_dates import get_day_bucketer, jira_epoch_ms_array, jira_to_epoch_ms
+
+COLUMN_CACHE_BUDGET_MB_DEFAULT = 64
+COLUMN_CACHE_TTL_DEFAULT = 300
+# Dias antes de hoje incluídos no span ao carregar um projeto (cobre mês atual/anterior,
+# últimos 3 meses e sprints recentes com uma única busca)
+COLUMN_CACHE_SPAN_DAYS_DEFAULT = 100
+# Maior span (dias) carregado no cache; períodos maiores usam a busca em streaming
+COLUMN_CACHE_SPAN_MAX_DAYS_DEFAULT = 366
+# Projetos com densidade (bytes por dia de span) conhecida
+COLUMN_CACHE_DENSITY_MAX_ENTRIES = 1024
+# Issue sem created válido
+NO_CREATED = -1
+# Fração mínima de issues com o valor para indexá-lo por bitmap compactado (1 bit por issue);
+# abaixo dela, lista ordenada de linhas (int32, 32 bits por ocorrência) ocupa menos
+BITMAP_DENSITY_MIN = 1 / 32
+
+
+def day_start_ms(day_str: str) -> int:
+    """Início (00:00 America/Sao_Paulo) do dia YYYY-MM-DD em ms — limite de `created >= "dia"` na JQL."""
+    return int(datetime.combine(date.fromisoformat(day_str[:10]), dt_time.min, tzinfo=TIMEZONE).timestamp() * 1000)
+
+
+class ValueDictionary:
+    """Codificação por dicionário: valor (str) -> código inteiro, na ordem de aparição."""
+
+    def __init__(self):
+        self.values: List[str] = []
+        self._codes: dict = {}
+
+    def __len__(self) -> int:
+        return len(self.values)
+
+    def encode(self, value: str) -> int:
+        code = self._codes.get(value)
+        if code is None:
+            code = len(self.values)
+            self._codes[value] = code
+            self.values.append(value)
+        return code
+
+    def code(self, value: str) -> Optional[int]:
+        """Código do valor, ou None se ele não aparece na coluna."""
+        return self._codes.get(value)
+
+    def nbytes(self) -> int:
+        return sum(len(value) + 64 for value in self.values)
+
+
+def _value_indexes(rows: np.ndarray, codes: np.ndarray, value_count: int, size: int) -> List[np.ndarray]:
+    """
+    Índice de cada código: issues (rows, em ordem crescente) onde ele aparece. Valores esparsos
+    viram a lista ordenada das linhas (int32); a partir de BITMAP_DENSITY_MIN, bitmap compactado
+    (np.packbits, uint8). Um único buffer de bits é reaproveitado entre os valores densos.
+    """
+    order = np.argsort(codes, kind="stable")
+    bounds = np.concatenate(([0], np.cumsum(np.bincount(codes, minlength=value_count))))
+    bits = None
+    indexes = []
+    for code in range(value_count):
+        # Ordenação estável: linhas do código continuam crescentes
+        code_rows = rows[order[bounds[code]:bounds[code + 1]]]
+        if len(code_rows) < size * BITMAP_DENSITY_MIN:
+            indexes.append(code_rows.astype(np.int32))
+            continue
+        if bits is None:
+            bits = np.zeros(size, dtype=bool)
+        bits[code_rows] = True
+        indexes.append(np.packbits(bits))
+        bits[code_rows] = False
+    return indexes
+
+
+class IssueColumns:
+    """
+    Colunas das issues criadas em [span_start, span_end] (limites da JQL: 00:00 de cada dia).
+    - Colunas de valor único (SINGLE_COLUMNS): codes (int32) + ValueDictionary.
+    - Colunas multivaloradas (MULTI_COLUMNS): layout CSR, valores da issue i em
+      multi_codes[nome][multi_offsets[nome][i]:multi_offsets[nome][i + 1]].
+    - Um índice por valor de cada coluna (_value_indexes): linhas ordenadas (int32) para valores
+      esparsos, bitmap compactado (uint8) para os densos; filtros com OR/AND sobre uma máscara.
+    Instâncias são somente leitura depois de montadas (compartilhadas entre requisições).
+    """
+
+    SINGLE_COLUMNS = ("issuetype", "status", "assignee", "priority")
+    MULTI_COLUMNS = ("components", "labels")
+
+    def __init__(self, span_start: str, span_end: str):
+        self.span_start = span_start
+        self.span_end = span_end
+        self.span_start_ms = day_start_ms(span_start)
+        self.span_end_ms = day_start_ms(span_end)
+        self.loaded_at = time.time()
+        self.created_ms = np.zeros(0, dtype=np.int64)
+        self.day = np.zeros(0, dtype=np.int32)
+        self.dictionaries = {name: ValueDictionary() for name in (*self.SINGLE_COLUMNS, *self.MULTI_COLUMNS)}
+        self.codes = {name: np.zeros(0, dtype=np.int32) for name in self.SINGLE_COLUMNS}
+        self.multi_offsets = {name: np.zeros(1, dtype=np.int64) for name in self.MULTI_COLUMNS}
+        self.multi_codes = {name: np.zeros(0, dtype=np.int32) for name in self.MULTI_COLUMNS}
+        self.value_indexes: dict = {name: [] for name in self.dictionaries}
+
+    def __len__(self) -> int:
+        return len(self.created_ms)
+
+    @classmethod
+    def from_issues(cls, issues: Iterable[dict], span_start: str, span_end: str) -> "IssueColumns":
+        """
+        Monta as colunas a partir de issues parseadas
+        ({issuetype, status, created, assignee, priority, components, labels}).
+        """
+        columns = cls(span_start, span_end)
+        created_values = []
+        single = {name: [] for name in cls.SINGLE_COLUMNS}
+        offsets = {name: [0] for name in cls.MULTI_COLUMNS}
+        multi = {name: [] for name in cls.MULTI_COLUMNS}
+        for issue in issues:
+            created_values.append((issue.get("created") or "").strip())
+            for name in cls.SINGLE_COLUMNS:
+                single[name].append(columns.dictionaries[name].encode((issue.get(name) or "").strip()))
+            for name in cls.MULTI_COLUMNS:
+                dictionary = columns.dictionaries[name]
+                multi[name].extend(dictionary.encode(v) for v in dict.fromkeys(issue.get(name) or []))
+                offsets[name].append(len(multi[name]))
+
+        epoch_ms, valid = jira_epoch_ms_array(created_values)
+        created = np.full(len(created_values), NO_CREATED, dtype=np.int64)
+        created[valid] = epoch_ms[valid]
+        for i in np.flatnonzero(~valid).tolist():
+            ms = jira_to_epoch_ms(created_values[i])
+            if ms is not None:
+                created[i] = ms
+        known = created != NO_CREATED
+        day = np.full(len(created), NO_CREATED, dtype=np.int32)
+        day[known] = get_day_bucketer().day_numbers(created[known])
+
+        size = len(created)
+        columns.created_ms = created
+        columns.day = day
+        for name in cls.SINGLE_COLUMNS:
+            codes = np.asarray(single[name], dtype=np.int32)
+            columns.codes[name] = codes
+            columns.value_indexes[name] = _value_indexes(
+                np.arange(size), codes, len(columns.dictionaries[name]), size
+            )
+        for name in cls.MULTI_COLUMNS:
+            offsets_array = np.asarray(offsets[name], dtype=np.int64)
+            codes = np.asarray(multi[name], dtype=np.int32)
+            columns.multi_offsets[name] = offsets_array
+            columns.multi_codes[name] = codes
+            columns.value_indexes[name] = _value_indexes(
+                np.repeat(np.arange(size), np.diff(offsets_array)), codes, len(columns.dictionaries[name]), size
+            )
+        return columns
+
+    def covers(self, start_ms: int, end_ms: int) -> bool:
+        """True se [start_ms, end_ms] está dentro do span carregado."""
+        return self.span_start_ms <= start_ms and end_ms <= self.span_end_ms
+
+    def select(self, start_ms: int, end_ms: int) -> np.ndarray:
+        """Máscara das issues com created em [start_ms, end_ms] (mesmos limites da JQL)."""
+        return (self.created_ms >= start_ms) & (self.created_ms <= end_ms)
+
+    def filter_mask(self, filters: dict) -> np.ndarray:
+        """
+        Máscara das issues que atendem filters ({coluna: valores}): OR entre os valores de uma
+        coluna (nas multivaloradas, basta a issue ter um deles), AND entre colunas.
+        Valores ausentes da coluna não selecionam nada; "" seleciona as issues sem valor.
+        """
+        size = len(self)
+        mask = np.ones(size, dtype=bool)
+        for name, values in filters.items():
+            union = np.zeros(size, dtype=bool)
+            dictionary = self.dictionaries[name]
+            for value in values:
+                code = dictionary.code(value)
+                if code is None:
+                    continue
+                index = self.value_indexes[name][code]
+                if index.dtype == np.uint8:
+                    union |= np.unpackbits(index, count=size).view(bool)
+                else:
+                    union[index] = True
+            if "" in values and name in self.MULTI_COLUMNS:
+                union |= np.diff(self.multi_offsets[name]) == 0
+            mask &= union
+        return mask
+
+    def nbytes(self) -> int:
+        arrays = [
+            self.created_ms, self.day, *self.codes.values(), *self.multi_offsets.values(), *self.multi_codes.values(),
+            *(index for indexes in self.value_indexes.values() for index in indexes),
+        ]
+        return sum(a.nbytes for a in arrays) + sum(d.nbytes() for d in self.dictionaries.values())
+
+
+class IssueColumnCache:
+    """
+    Cache LRU de IssueColumns por chave (tenant, projeto), limitado por bytes (budget_bytes).
+    Uma entrada serve um período se o span a cobre e tem menos de ttl segundos.
+    Guarda também os bytes por dia da última carga de cada projeto, para estimar (fits) se um
+    span cabe no orçamento antes de buscá-lo.
+    """
+
+    def __init__(self, budget_bytes: int):
+        self.budget_bytes = budget_bytes
+        self._data: "OrderedDict[Hashable, IssueColumns]" = OrderedDict()
+        self._bytes = 0
+        self._bytes_per_day: "OrderedDict[Hashable, float]" = OrderedDict()
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.oversized = 0
+
+    def get(self, key: Hashable, start_ms: int, end_ms: int, ttl: float) -> Optional[IssueColumns]:
+        """Colunas do projeto se cobrirem [start_ms, end_ms] e tiverem menos de ttl segundos; senão None."""
+        with self._lock:
+            columns = self._data.get(key)
+            if columns is not None and time.time() - columns.loaded_at < ttl and columns.covers(start_ms, end_ms):
+                self._data.move_to_end(key)
+                self.hits += 1
+                return columns
+            self.misses += 1
+            return None
+
+    def contains(self, key: Hashable, columns: IssueColumns) -> bool:
+        """True se columns é o span guardado do projeto (e não uma carga fora do cache)."""
+        with self._lock:
+            return self._data.get(key) is columns
+
+    def fits(self, key: Hashable, span_start: date, span_end: date) -> bool:
+        """False se o span, pela densidade da última carga do projeto, não cabe no orçamento."""
+        with self._lock:
+            per_day = self._bytes_per_day.get(key)
+        return per_day is None or per_day * ((span_end - span_start).days + 1) <= self.budget_bytes
+
+    def put(self, key: Hashable, columns: IssueColumns) -> bool:
+        """
+        Guarda as colunas (substitui o span anterior do projeto) e descarta LRU acima do orçamento.
+        Retorna False, mantendo o span anterior, se as colunas sozinhas passam do orçamento.
+        """
+        size = columns.nbytes()
+        days = (date.fromisoformat(columns.span_end) - date.fromisoformat(columns.span_start)).days + 1
+        with self._lock:
+            self._bytes_per_day.pop(key, None)
+            self._bytes_per_day[key] = size / max(1, days)
+            while len(self._bytes_per_day) > COLUMN_CACHE_DENSITY_MAX_ENTRIES:
+                self._bytes_per_day.popitem(last=False)
+            if size > self.budget_bytes:
+                self.oversized += 1
+                return False
+            previous = self._data.pop(key, None)
+            if previous is not None:
+                self._bytes -= previous.nbytes()
+            self._data[key] = columns
+            self._bytes += size
+            while self._bytes > self.budget_bytes:
+                _, evicted = self._data.popitem(last=False)
+                self._bytes -= evicted.nbytes()
+                self.evictions += 1
+            return True
+
+    def invalidate(self, tenant: Optional[tuple] = None) -> int:
+        """Remove os projetos do tenant (todos se None). Retorna quantos foram removidos."""
+        with self._lock:
+            keys = [key for key in self._data if tenant is None or key[0] == tenant]
+            for key in keys:
+                self._bytes -= self._data.pop(key).nbytes()
+            return len(keys)
+
+    def stats(self) -> dict:
+        with self._lock:
+            return {
+                "projects": len(self._data),
+                "issues": sum(len(columns) for columns in self._data.values()),
+                "bytes": self._bytes,
+                "budgetBytes": self.budget_bytes,
+                "hits": self.hits,
+                "misses": self.misses,
+                "evictions": self.evictions,
+                "oversized": self.oversized,
+            }
+
+
+_cache: Optional[IssueColumnCache] = None
+_cache_lock = threading.Lock()
+
+
+def get_issue_column_cache() -> Optional[IssueColumnCache]:
+    """Cache global (orçamento via DASHBOARD_COLUMN_CACHE_MB), ou None se o orçamento for 0."""
+    global _cache
+    budget_mb = float(os.getenv("DASHBOARD_COLUMN_CACHE_MB", str(COLUMN_CACHE_BUDGET_MB_DEFAULT)))
+    if budget_mb <= 0:
+        return None
+    if _cache is None:
+        with _cache_lock:
+            if _cache is None:
+                _cache = IssueColumnCache(budget_bytes=int(budget_mb * 1024 * 1024))
+    return _cache
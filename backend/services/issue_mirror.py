@@ -0,0 +1,426 @@
+# backend/services/issue_mirror.py
+
+"""
+Espelho local (SQLite) dos defeitos (Bug e Sub-Bug) de cada projeto, opcional (ISSUE_MIRROR_ENABLED=true).
+Guarda key, tipo, status, created, updated e summary; é mantido por sincronizações incrementais
+(`updated >= -Nm`) e por uma sincronização completa periódica, que roda em segundo plano: enquanto
+o espelho não estiver fresco, o chamador consulta o Jira como antes.
+O dashboard consulta o espelho quando ele está fresco e cobre o período. O Status Time abrange
+todos os tipos de issue (exceto os excluídos) e por isso continua consultando o Jira.
+Para o dashboard, o espelho mantém também rollups diários de defeitos (contagem por dia de
+criação, tipo e status), recalculados a cada sincronização só para os dias das issues alteradas.
+Todo acesso ao SQLite (gravação da sincronização e consultas) roda numa thread dedicada, fora do
+event loop; as consultas públicas são corrotinas.
+"""
+
+import asyncio
+import hashlib
+import json
+import logging
+import math
+import os
+import sqlite3
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime, time as dt_time, timedelta
+from functools import partial
+from typing import Any, Callable, Optional
+
+from backend.utils.date_range_utils import TIMEZONE
+from backend.utils.jira_dates import get_day_bucketer, jira_to_epoch_ms
+
+logger = logging.getLogger(__name__)
+
+ISSUE_MIRROR_PATH_DEFAULT = "config/cache/issue_mirror.sqlite3"
+# Segundos em que o espelho é considerado fresco sem nova sincronização
+ISSUE_MIRROR_MAX_AGE_DEFAULT = 300
+# Janela espelhada: issues criadas nos últimos N dias. Cobre um período custom de
+# DASHBOARD_ROLLUP_RANGE_MONTHS (12) mais a janela anterior comparável, de mesma duração
+ISSUE_MIRROR_HORIZON_DAYS_DEFAULT = 732
+# Segundos entre sincronizações completas (remove issues excluídas/movidas de projeto)
+ISSUE_MIRROR_FULL_SYNC_DEFAULT = 86400
+# Minutos extras na janela `updated >= -Nm` (relógio do Jira x servidor, escrita em andamento)
+SYNC_OVERLAP_MINUTES = 5
+
+SYNC_FIELDS = ["summary", "issuetype", "status", "created", "updated"]
+# Tipos espelhados (mesmo filtro de build_defects_base_jql)
+SYNC_ISSUE_TYPES_JQL = 'issuetype in (Bug, "Sub-Bug")'
+# Tipos com rollup diário (mesmo filtro de query_defects)
+ROLLUP_ISSUE_TYPES = ("bug", "sub-bug")
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS issues (
+    scope TEXT NOT NULL,
+    issue_id TEXT NOT NULL,
+    issue_key TEXT NOT NULL,
+    issuetype TEXT NOT NULL,
+    status TEXT NOT NULL,
+    summary TEXT NOT NULL,
+    created TEXT NOT NULL,
+    created_ms INTEGER,
+    updated TEXT NOT NULL,
+    PRIMARY KEY (scope, issue_id)
+);
+CREATE INDEX IF NOT EXISTS idx_issues_scope_created ON issues (scope, created_ms);
+CREATE TABLE IF NOT EXISTS defect_daily (
+    scope TEXT NOT NULL,
+    day TEXT NOT NULL,
+    issuetype TEXT NOT NULL,
+    status TEXT NOT NULL,
+    issue_count INTEGER NOT NULL,
+    PRIMARY KEY (scope, day, issuetype, status)
+);
+CREATE TABLE IF NOT EXISTS rollup_state (
+    scope TEXT PRIMARY KEY,
+    built_at REAL NOT NULL
+);
+CREATE TABLE IF NOT EXISTS sync_state (
+    scope TEXT PRIMARY KEY,
+    project_key TEXT NOT NULL,
+    horizon_start TEXT NOT NULL,
+    last_sync_started REAL NOT NULL,
+    last_full_sync REAL NOT NULL,
+    issue_count INTEGER NOT NULL
+);
+"""
+
+
+def _day_start_ms(day_str: str) -> int:
+    """Início (00:00 America/Sao_Paulo) do dia YYYY-MM-DD em ms — mesmo limite de `created >= "dia"` na JQL."""
+    day = datetime.strptime(day_str[:10], "%Y-%m-%d").date()
+    return int(datetime.combine(day, dt_time.min, tzinfo=TIMEZONE).timestamp() * 1000)
+
+
+def _placeholders(values: list) -> str:
+    return ", ".join("?" for _ in values)
+
+
+def _next_day(day_str: str) -> str:
+    return (datetime.strptime(day_str[:10], "%Y-%m-%d").date() + timedelta(days=1)).isoformat()
+
+
+class IssueMirror:
+    """
+    Espelho SQLite por escopo (tenant + projeto).
+    Leituras replicam os limites da JQL: `created >= "start"` e `created <= "end"`
+    (ambos às 00:00 do dia no timezone do dashboard).
+    """
+
+    def __init__(self, path: str, max_age: int, horizon_days: int, full_sync_interval: int):
+        self.path = path
+        self.max_age = max_age
+        self.horizon_days = horizon_days
+        self.full_sync_interval = full_sync_interval
+        self._lock = threading.Lock()
+        self._conn: Optional[sqlite3.Connection] = None
+        # Thread única para o SQLite: gravações e consultas em série, sem bloquear o event loop
+        self._executor: Optional[ThreadPoolExecutor] = None
+        # Sincronizações em andamento por (event loop, escopo) -> (task, completa?)
+        self._syncing: dict[tuple, tuple[asyncio.Task, bool]] = {}
+        self.syncs = 0
+        self.full_syncs = 0
+        self.reads = 0
+
+    def _connect(self) -> sqlite3.Connection:
+        if self._conn is None:
+            directory = os.path.dirname(self.path)
+            if directory:
+                os.makedirs(directory, exist_ok=True)
+            conn = sqlite3.connect(self.path, check_same_thread=False)
+            conn.row_factory = sqlite3.Row
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.executescript(SCHEMA)
+            self._conn = conn
+        return self._conn
+
+    async def _run(self, fn: Callable[..., Any], *args) -> Any:
+        """Executa fn(*args) (acesso ao SQLite) na thread do espelho."""
+        with self._lock:
+            if self._executor is None:
+                self._executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="issue-mirror")
+            executor = self._executor
+        return await asyncio.get_running_loop().run_in_executor(executor, partial(fn, *args))
+
+    @staticmethod
+    def scope_id(tenant: tuple, project_key: str) -> str:
+        """Escopo = hash de (tenant, projeto); o tenant já não contém o token em claro."""
+        raw = json.dumps([list(tenant), project_key.strip().upper()])
+        return hashlib.sha256(raw.encode()).hexdigest()[:32]
+
+    def _state(self, scope: str) -> Optional[sqlite3.Row]:
+        with self._lock:
+            return self._connect().execute("SELECT * FROM sync_state WHERE scope = ?", (scope,)).fetchone()
+
+    async def ensure_fresh(self, jira, project_key: str, start_date: str, credentials: Optional[dict] = None) -> Optional[dict]:
+        """
+        Garante o espelho do projeto atualizado e cobrindo start_date.
+        A sincronização completa (primeira ou periódica) é iniciada em segundo plano e não é
+        aguardada; a incremental é aguardada (requisições simultâneas compartilham a mesma).
+        Retorna {scope, syncedAt} ou None se o espelho não puder atender (ainda sem sincronização,
+        desatualizado durante uma completa, período fora da janela ou falha) — nesse caso o
+        chamador consulta o Jira.
+        """
+        pk = project_key.strip().upper()
+        scope = self.scope_id(jira.tenant_key(credentials), pk)
+        state = await self._run(self._state, scope)
+        now = time.time()
+        if state is None or now - state["last_full_sync"] >= self.full_sync_interval:
+            self._start_sync(jira, scope, pk, credentials, full=True)
+        if state is None:
+            return None
+        if now - state["last_sync_started"] >= self.max_age:
+            task, full = self._start_sync(jira, scope, pk, credentials, full=False)
+            if full:
+                return None
+            try:
+                await asyncio.shield(task)
+            except PermissionError:
+                raise
+            except Exception:
+                return None
+            state = await self._run(self._state, scope)
+        if start_date[:10] < state["horizon_start"]:
+            return None
+        synced_at = datetime.fromtimestamp(state["last_sync_started"], TIMEZONE).isoformat(timespec="seconds")
+        return {"scope": scope, "syncedAt": synced_at}
+
+    def _start_sync(self, jira, scope: str, project_key: str, credentials: Optional[dict], full: bool) -> tuple[asyncio.Task, bool]:
+        """
+        Inicia _sync no event loop atual, ou retorna a sincronização do escopo já em andamento.
+        Retorna (task, completa?); falhas são registradas no log ao terminar.
+        """
+        task_key = (id(asyncio.get_running_loop()), scope)
+        running = self._syncing.get(task_key)
+        if running is None:
+            task = asyncio.ensure_future(self._sync(jira, scope, project_key, credentials, full))
+            running = (task, full)
+            self._syncing[task_key] = running
+            task.add_done_callback(partial(self._sync_done, task_key, project_key))
+        return running
+
+    def _sync_done(self, task_key: tuple, project_key: str, task: asyncio.Task) -> None:
+        self._syncing.pop(task_key, None)
+        if not task.cancelled() and task.exception() is not None:
+            logger.warning("[issueMirror] sincronização falhou (project=%s), usando Jira: %s", project_key, task.exception())
+
+    def cancel_syncs(self) -> None:
+        """Cancela as sincronizações em andamento (encerramento do app)."""
+        for task, _ in list(self._syncing.values()):
+            task.cancel()
+
+    async def _sync(self, jira, scope: str, project_key: str, credentials: Optional[dict], full: bool) -> None:
+        """
+        Sincroniza o escopo. Completa: todos os defeitos criados na janela (substitui o escopo).
+        Incremental: defeitos com `updated` desde a última sincronização (relativo, sem depender
+        do timezone do usuário no Jira).
+        """
+        started = time.time()
+        state = await self._run(self._state, scope)
+        if full or state is None:
+            horizon_start = (datetime.now(TIMEZONE).date() - timedelta(days=self.horizon_days)).isoformat()
+            jql = f'project = {project_key} AND {SYNC_ISSUE_TYPES_JQL} AND created >= "{horizon_start}" ORDER BY created ASC'
+        else:
+            horizon_start = state["horizon_start"]
+            minutes = math.ceil((started - state["last_sync_started"]) / 60) + SYNC_OVERLAP_MINUTES
+            jql = (
+                f'project = {project_key} AND {SYNC_ISSUE_TYPES_JQL} AND created >= "{horizon_start}" '
+                f'AND updated >= "-{minutes}m" ORDER BY created ASC'
+            )
+
+        issues = await jira.search_issues_paginated(jql, SYNC_FIELDS, credentials=credentials)
+        changed, count = await self._run(
+            self._write_sync, scope, project_key, state, full, started, horizon_start, issues
+        )
+        self.syncs += 1
+        if full or state is None:
+            self.full_syncs += 1
+        logger.info(
+            "[issueMirror] project=%s full=%s changed=%s total=%s durationMs=%s",
+            project_key, full or state is None, changed, count, int((time.time() - started) * 1000),
+        )
+
+    def _write_sync(
+        self,
+        scope: str,
+        project_key: str,
+        state: Optional[sqlite3.Row],
+        full: bool,
+        started: float,
+        horizon_start: str,
+        issues: list[dict],
+    ) -> tuple[int, int]:
+        """
+        Grava o resultado da sincronização (issues, rollups e estado) numa transação.
+        Roda na thread do espelho. Retorna (issues alteradas, total de issues do escopo).
+        """
+        issue_rows = [
+            (
+                scope, str(i["id"]), i.get("key") or "", i.get("issuetype") or "", i.get("status") or "",
+                i.get("summary") or "", i.get("created") or "", jira_to_epoch_ms(i.get("created") or ""),
+                i.get("updated") or "",
+            )
+            for i in issues if i.get("id")
+        ]
+
+        with self._lock:
+            conn = self._connect()
+            with conn:
+                if full or state is None:
+                    conn.execute("DELETE FROM issues WHERE scope = ?", (scope,))
+                conn.executemany("INSERT OR REPLACE INTO issues VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)", issue_rows)
+                has_rollups = conn.execute("SELECT 1 FROM rollup_state WHERE scope = ?", (scope,)).fetchone()
+                if full or state is None or has_rollups is None:
+                    self._refresh_rollups(conn, scope)
+                else:
+                    # created não muda: só os dias de criação das issues alteradas são recalculados
+                    bucketer = get_day_bucketer()
+                    self._refresh_rollups(conn, scope, {
+                        bucketer.day_string(bucketer.day_number(row[7])) for row in issue_rows if row[7] is not None
+                    })
+                count = conn.execute("SELECT COUNT(*) FROM issues WHERE scope = ?", (scope,)).fetchone()[0]
+                last_full = started if (full or state is None) else state["last_full_sync"]
+                conn.execute(
+                    "INSERT OR REPLACE INTO sync_state VALUES (?, ?, ?, ?, ?, ?)",
+                    (scope, project_key, horizon_start, started, last_full, count),
+                )
+        return len(issue_rows), count
+
+    @staticmethod
+    def _refresh_rollups(conn: sqlite3.Connection, scope: str, days: Optional[set] = None) -> None:
+        """
+        Recalcula defect_daily do escopo a partir da tabela issues: todos os dias (days None) ou só
+        os dias informados. Chamado com o lock e dentro da transação da sincronização.
+        """
+        types = list(ROLLUP_ISSUE_TYPES)
+        sql = (
+            "SELECT created_ms, issuetype, status FROM issues WHERE scope = ? AND created_ms IS NOT NULL "
+            f"AND lower(issuetype) IN ({_placeholders(types)})"
+        )
+        if days is None:
+            conn.execute("DELETE FROM defect_daily WHERE scope = ?", (scope,))
+            rows = conn.execute(sql, [scope, *types]).fetchall()
+        else:
+            rows = []
+            for day in sorted(days):
+                conn.execute("DELETE FROM defect_daily WHERE scope = ? AND day = ?", (scope, day))
+                rows.extend(conn.execute(
+                    sql + " AND created_ms >= ? AND created_ms < ?",
+                    [scope, *types, _day_start_ms(day), _day_start_ms(_next_day(day))],
+                ).fetchall())
+
+        bucketer = get_day_bucketer()
+        counts: dict = {}
+        for r in rows:
+            key = (bucketer.day_string(bucketer.day_number(r["created_ms"])), r["issuetype"], r["status"])
+            counts[key] = counts.get(key, 0) + 1
+        conn.executemany(
+            "INSERT INTO defect_daily VALUES (?, ?, ?, ?, ?)",
+            [(scope, day, issuetype, status, n) for (day, issuetype, status), n in counts.items()],
+        )
+        conn.execute("INSERT OR REPLACE INTO rollup_state VALUES (?, ?)", (scope, time.time()))
+
+    def _query(self, sql: str, params: list) -> list[sqlite3.Row]:
+        with self._lock:
+            self.reads += 1
+            return self._connect().execute(sql, params).fetchall()
+
+    def _query_defects(self, scope: str, start_date: str, end_date: str) -> list[dict]:
+        """Bug e Sub-Bug criados no período (mesmo escopo de build_defects_base_jql)."""
+        rows = self._query(
+            "SELECT issue_id, issue_key, issuetype, status, created FROM issues "
+            "WHERE scope = ? AND created_ms >= ? AND created_ms <= ? "
+            "AND lower(issuetype) IN ('bug', 'sub-bug') ORDER BY created_ms, issue_id",
+            [scope, _day_start_ms(start_date), _day_start_ms(end_date)],
+        )
+        return [
+            {"id": r["issue_id"], "key": r["issue_key"], "issuetype": r["issuetype"], "status": r["status"], "created": r["created"]}
+            for r in rows
+        ]
+
+    def _query_defect_rollups(self, scope: str, start_date: str, end_date: str) -> Optional[list[dict]]:
+        """
+        Contagens de Bug e Sub-Bug criados no período por (dia, tipo, status), a partir dos rollups:
+        os dias [start, end) inteiros e, no dia end, só as issues criadas às 00:00 (limite
+        `created <= "end"` da JQL, lido da tabela issues). None se o escopo ainda não tem rollups.
+        """
+        types = list(ROLLUP_ISSUE_TYPES)
+        with self._lock:
+            self.reads += 1
+            conn = self._connect()
+            if conn.execute("SELECT 1 FROM rollup_state WHERE scope = ?", (scope,)).fetchone() is None:
+                return None
+            rows = conn.execute(
+                "SELECT day, issuetype, status, issue_count FROM defect_daily "
+                "WHERE scope = ? AND day >= ? AND day < ? ORDER BY day, issuetype, status",
+                [scope, start_date[:10], end_date[:10]],
+            ).fetchall()
+            end_rows = conn.execute(
+                "SELECT issuetype, status, COUNT(*) AS issue_count FROM issues "
+                f"WHERE scope = ? AND created_ms = ? AND lower(issuetype) IN ({_placeholders(types)}) "
+                "GROUP BY issuetype, status",
+                [scope, _day_start_ms(end_date), *types],
+            ).fetchall()
+        result = [
+            {"day": r["day"], "issuetype": r["issuetype"], "status": r["status"], "count": r["issue_count"]}
+            for r in rows
+        ]
+        result.extend(
+            {"day": end_date[:10], "issuetype": r["issuetype"], "status": r["status"], "count": r["issue_count"]}
+            for r in end_rows
+        )
+        return result
+
+    async def query_defects(self, scope: str, start_date: str, end_date: str) -> list[dict]:
+        """Bug e Sub-Bug criados no período (ver _query_defects), fora do event loop."""
+        return await self._run(self._query_defects, scope, start_date, end_date)
+
+    async def query_defect_rollups(self, scope: str, start_date: str, end_date: str) -> Optional[list[dict]]:
+        """Contagens diárias de defeitos do período (ver _query_defect_rollups), fora do event loop."""
+        return await self._run(self._query_defect_rollups, scope, start_date, end_date)
+
+    def stats(self) -> dict:
+        with self._lock:
+            conn = self._connect()
+            scopes = conn.execute("SELECT COUNT(*), COALESCE(SUM(issue_count), 0) FROM sync_state").fetchone()
+            rollup_rows = conn.execute("SELECT COUNT(*) FROM defect_daily").fetchone()[0]
+        return {
+            "scopes": scopes[0],
+            "issues": scopes[1],
+            "rollupRows": rollup_rows,
+            "syncs": self.syncs,
+            "fullSyncs": self.full_syncs,
+            "reads": self.reads,
+        }
+
+    def close(self) -> None:
+        with self._lock:
+            executor, self._executor = self._executor, None
+        # Fora do lock: tarefas pendentes da thread do espelho também usam o lock
+        if executor is not None:
+            executor.shutdown(wait=True)
+        with self._lock:
+            if self._conn is not None:
+                self._conn.close()
+                self._conn = None
+
+
+_mirror: Optional[IssueMirror] = None
+_mirror_lock = threading.Lock()
+
+
+def get_issue_mirror() -> Optional[IssueMirror]:
+    """Espelho global, ou None se ISSUE_MIRROR_ENABLED não estiver habilitado."""
+    global _mirror
+    if os.getenv("ISSUE_MIRROR_ENABLED", "false").strip().lower() not in ("1", "true", "yes"):
+        return None
+    if _mirror is None:
+        with _mirror_lock:
+            if _mirror is None:
+                _mirror = IssueMirror(
+                    path=os.getenv("ISSUE_MIRROR_PATH", ISSUE_MIRROR_PATH_DEFAULT),
+                    max_age=int(os.getenv("ISSUE_MIRROR_MAX_AGE", str(ISSUE_MIRROR_MAX_AGE_DEFAULT))),
+                    horizon_days=int(os.getenv("ISSUE_MIRROR_HORIZON_DAYS", str(ISSUE_MIRROR_HORIZON_DAYS_DEFAULT))),
+                    full_sync_interval=int(os.getenv("ISSUE_MIRROR_FULL_SYNC", str(ISSUE_MIRROR_FULL_SYNC_DEFAULT))),
+                )
+    return _mirror
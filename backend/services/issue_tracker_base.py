@@ -72,3 +72,36 @@ class IssueTrackerBase(ABC):
             Ex: "PKGS"
         """
         return issue_key.split('-')[0].upper()
+
+
+class AsyncIssueTrackerBase(ABC):
+    """
+    Interface abstrata assíncrona para Issue Trackers.
+    Mesmo contrato de IssueTrackerBase, com chamadas de I/O via `await`
+    (usada pelas rotas async para não bloquear o event loop).
+    """
+    
+    @abstractmethod
+    async def get_issue(self, issue_key: str, fields: Optional[list[str]] = None) -> dict:
+        """Busca uma issue pelo identificador."""
+        pass
+    
+    @abstractmethod
+    async def create_subtask(
+        self, 
+        parent_key: str, 
+        summary: str, 
+        description: str
+    ) -> dict:
+        """Cria uma subtask vinculada a uma issue pai."""
+        pass
+    
+    @abstractmethod
+    def get_available_fields(self) -> list[dict]:
+        """Retorna campos disponíveis para consulta."""
+        pass
+    
+    @abstractmethod
+    async def test_connection(self) -> dict:
+        """Testa a conexão com o serviço."""
+        pass
@@ -1,6 +1,7 @@
 # backend/services/issue_tracker_factory.py
 
 from backend.services.jira_service import JiraService
+from backend.services.jira_async_service import AsyncJiraService
 # Futuro: from backend.services.azure_devops_service import AzureDevOpsService
 # Futuro: from backend.services.github_service import GitHubService
 
@@ -10,13 +11,19 @@ ISSUE_TRACKERS = {
     # "github": GitHubService,              # Futuro
 }
 
-def get_issue_tracker(tracker_name: str = "jira", skip_env_validation: bool = False):
+# Implementações assíncronas (rotas async / DashboardService)
+ASYNC_ISSUE_TRACKERS = {
+    "jira": AsyncJiraService,
+}
+
+def get_issue_tracker(tracker_name: str = "jira", skip_env_validation: bool = False, async_mode: bool = False):
     """
     Factory para obter instância do Issue Tracker.
     
     Args:
         tracker_name: Nome do tracker (default: jira)
         skip_env_validation: Se True, não valida credenciais do .env (para uso com credentials dinâmicos)
+        async_mode: Se True, retorna a implementação assíncrona (métodos de I/O com await)
         
     Returns:
         Instância do Issue Tracker
@@ -25,10 +32,11 @@ def get_issue_tracker(tracker_name: str = "jira", skip_env_validation: bool = Fa
         ValueError: Se tracker não suportado
     """
     tracker_name = tracker_name.lower()
-    if tracker_name not in ISSUE_TRACKERS:
+    trackers = ASYNC_ISSUE_TRACKERS if async_mode else ISSUE_TRACKERS
+    if tracker_name not in trackers:
         raise ValueError(f"Issue Tracker '{tracker_name}' não suportado.")
     
-    tracker_class = ISSUE_TRACKERS[tracker_name]
+    tracker_class = trackers[tracker_name]
     
     # JiraService aceita skip_env_validation
     if tracker_name == "jira":
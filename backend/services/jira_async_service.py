@@ -0,0 +1,627 @@
+# backend/services/jira_async_service.py
+
+import asyncio
+import logging
+from datetime import date
+from typing import AsyncIterator, Callable, Optional
+
+import httpx
+
+from backend.services.issue_tracker_base import AsyncIssueTrackerBase
+from backend.services.jira_rate_limiter import RETRY_STATUS_CODES, is_retryable
+from backend.services.jira_service import CHANGELOG_BULK_MAX_ISSUES, JiraService
+from backend.services.sprint_index import SprintIndex, get_sprint_index_store
+from backend.utils.date_range_utils import split_date_range
+from backend.utils.single_flight import SingleFlight
+
+logger = logging.getLogger(__name__)
+
+# Coalescência de chamadas idênticas simultâneas (get_issue, project_search_all)
+_flights = SingleFlight()
+
+
+class AsyncJiraService(JiraService, AsyncIssueTrackerBase):
+    """
+    Implementação assíncrona (httpx) do Issue Tracker para Jira Cloud.
+    Reaproveita configuração, parsing e montagem de payloads do JiraService;
+    apenas as chamadas HTTP passam a ser `await`, sem bloquear o event loop.
+    As conexões vêm do mesmo registro por tenant do JiraService.
+    """
+
+    async def _request(self, method: str, url: str, credentials: Optional[dict] = None, **kwargs) -> httpx.Response:
+        """
+        Executa a requisição no cliente assíncrono do tenant, sob o rate limiter do tenant.
+        Em 429/503, requisições idempotentes (GET, search/jql, changelog/bulkfetch) são repetidas
+        após Retry-After / X-RateLimit-Reset ou backoff exponencial com jitter; as demais
+        retornam a resposta ao chamador.
+        """
+        jira_client = self._get_client(credentials)
+        client = jira_client.get_async_client()
+        limiter = jira_client.rate_limiter
+        kwargs.setdefault("headers", self._get_headers(credentials))
+        kwargs.setdefault("timeout", self.timeout)
+        retryable = is_retryable(method, url)
+        attempt = 0
+        # Checkout: se o registro descartar o tenant agora, o cliente só fecha quando isto terminar
+        with jira_client.checkout():
+            while True:
+                async with limiter.slot():
+                    response = await client.request(method, url, **kwargs)
+                limiter.observe(response.status_code, response.headers)
+                if response.status_code not in RETRY_STATUS_CODES or not retryable or attempt >= limiter.max_retries:
+                    return response
+                delay = limiter.backoff_delay(attempt, response.headers)
+                attempt += 1
+                limiter.retries += 1
+                logger.warning(
+                    "[jiraRateLimit] %s %s status=%s tentativa=%s aguardando=%.2fs",
+                    method, url.split("?", 1)[0], response.status_code, attempt, delay,
+                )
+                await asyncio.sleep(delay)
+
+    async def get_issue(self, issue_key: str, fields: Optional[list[str]] = None, credentials: Optional[dict] = None) -> dict:
+        """
+        Busca uma issue no Jira.
+
+        Args:
+            issue_key: Chave da issue (ex: "PROJ-123")
+            fields: Lista de campos a retornar
+            credentials: Dict opcional com {base_url, email, api_token} para autenticação dinâmica
+
+        Chamadas simultâneas para a mesma issue/campos/tenant compartilham uma única requisição.
+        """
+        flight_key = ("issue", self.tenant_key(credentials), issue_key, tuple(fields) if fields is not None else None)
+        return await _flights.do(flight_key, lambda: self._fetch_issue(issue_key, fields, credentials))
+
+    async def _fetch_issue(self, issue_key: str, fields: Optional[list[str]], credentials: Optional[dict]) -> dict:
+        """GET da issue (sem coalescência); ver get_issue."""
+        url, fields, include_changelog = self._build_issue_request(issue_key, fields, credentials)
+        response = await self._request("GET", url, credentials)
+
+        if response.status_code == 404:
+            raise ValueError(f"Card {issue_key} não encontrado.")
+        if response.status_code == 401:
+            raise PermissionError("Token de API do Jira inválido ou expirado.")
+        if response.status_code == 403:
+            raise PermissionError(f"Sem permissão para acessar o card {issue_key}.")
+        response.raise_for_status()
+
+        return self._build_issue_result(response.json(), fields, include_changelog)
+
+    async def create_subtask(
+        self,
+        parent_key: str,
+        summary: str,
+        description: str,
+        credentials: Optional[dict] = None,
+    ) -> dict:
+        """Cria uma subtask no Jira."""
+        base_url = self._get_base_url(credentials)
+        payload = self._build_subtask_payload(parent_key, summary, description)
+        response = await self._request("POST", f"{base_url}/rest/api/3/issue", credentials, json=payload)
+
+        if response.status_code == 400:
+            error_data = response.json()
+            errors = error_data.get("errors", {})
+            error_messages = error_data.get("errorMessages", [])
+            msg = self._sanitize_jira_error(errors, error_messages, "create_subtask")
+            raise ValueError(msg)
+        if response.status_code == 401:
+            raise PermissionError("Token de API do Jira inválido ou expirado.")
+        if response.status_code == 403:
+            raise PermissionError("Sem permissão para criar issues neste projeto.")
+        response.raise_for_status()
+
+        return self._created_issue_result(response.json(), base_url)
+
+    async def create_bug(
+        self,
+        project_key: str,
+        summary: str,
+        description: str,
+        issue_type: str = "bug",  # "bug" ou "sub_bug"
+        parent_key: Optional[str] = None,
+        credentials: Optional[dict] = None,
+    ) -> dict:
+        """
+        Cria um Bug ou Sub-Bug no Jira com estrutura mínima.
+        Mesma semântica de JiraService.create_bug.
+        """
+        base_url = self._get_base_url(credentials)
+
+        if issue_type == "sub_bug":
+            if not parent_key:
+                raise ValueError("parent_key é obrigatório para Sub-Bug")
+            try:
+                parent_issue = await self.get_issue(parent_key, ["issuetype"], credentials=credentials)
+                issuetype_id = self._issuetype_id_from_parent(parent_issue)
+            except Exception:
+                # Se falhar ao buscar parent, usar ID configurado
+                issuetype_id = self.sub_bug_type_id
+        else:
+            issuetype_id = self.bug_type_id
+
+        payload = self._build_bug_payload(project_key, summary, description, issuetype_id, issue_type, parent_key)
+        response = await self._request("POST", f"{base_url}/rest/api/3/issue", credentials, json=payload)
+
+        if response.status_code == 400:
+            error_data = response.json()
+            errors = error_data.get("errors", {})
+            error_messages = error_data.get("errorMessages", [])
+            msg = self._sanitize_jira_error(errors, error_messages, "create_bug")
+            raise ValueError(msg)
+        if response.status_code == 401:
+            raise PermissionError("Token de API do Jira inválido ou expirado.")
+        if response.status_code == 403:
+            raise PermissionError("Sem permissão para criar issues neste projeto.")
+        response.raise_for_status()
+
+        return self._created_issue_result(response.json(), base_url)
+
+    async def upload_attachments(
+        self,
+        issue_key: str,
+        files: list[tuple[str, bytes, str]],
+        credentials: Optional[dict] = None,
+    ) -> list[dict]:
+        """
+        Faz upload de anexos para uma issue do Jira.
+        files: Lista de tuplas (filename, file_content, content_type)
+        """
+        if not files:
+            return []
+
+        base_url = self._get_base_url(credentials)
+        auth_value = self._get_headers(credentials).get("Authorization", "")
+        headers = {
+            "Accept": "application/json",
+            "X-Atlassian-Token": "no-check",  # Obrigatório para bypass XSRF
+            "Authorization": auth_value
+        }
+        files_data = [("file", (filename, content, content_type)) for filename, content, content_type in files]
+
+        response = await self._request(
+            "POST", f"{base_url}/rest/api/3/issue/{issue_key}/attachments", credentials, headers=headers, files=files_data
+        )
+
+        if response.status_code == 400:
+            error_data = response.json()
+            errors = error_data.get("errors", {})
+            error_messages = error_data.get("errorMessages", [])
+            msg = self._sanitize_jira_error(errors, error_messages, "upload_attachments")
+            raise ValueError(msg)
+        if response.status_code == 401:
+            raise PermissionError("Token de API do Jira inválido ou expirado.")
+        if response.status_code == 403:
+            raise PermissionError("Sem permissão para anexar arquivos nesta issue.")
+        response.raise_for_status()
+
+        return response.json()
+
+    async def _post_search_jql(self, payload: dict, credentials: Optional[dict] = None) -> dict:
+        """POST /rest/api/3/search/jql (enhanced) com tratamento de erros padrão."""
+        url = f"{self._get_base_url(credentials)}/rest/api/3/search/jql"
+        response = await self._request("POST", url, credentials, json=payload)
+        if response.status_code == 400:
+            error_data = response.json()
+            errors = error_data.get("errors", {})
+            error_messages = error_data.get("errorMessages", [])
+            msg = self._sanitize_jira_error(errors, error_messages, "search_jql")
+            raise ValueError(msg)
+        if response.status_code == 401:
+            raise PermissionError("Token de API do Jira inválido ou expirado.")
+        if response.status_code == 403:
+            raise PermissionError("Sem permissão para buscar issues neste projeto.")
+        response.raise_for_status()
+        return response.json()
+
+    async def search_subtasks(
+        self,
+        parent_key: str,
+        fields: Optional[list[str]] = None,
+        max_results: int = 100,
+        credentials: Optional[dict] = None,
+    ) -> dict:
+        """Busca todas as subtasks de uma issue pai usando JQL (mesmo retorno de JiraService.search_subtasks)."""
+        if fields is None:
+            fields = ["issuetype", "summary", "assignee", "status"]
+
+        base_url = self._get_base_url(credentials)
+        payload = {
+            "jql": f"parent = {parent_key} ORDER BY created ASC",
+            "fields": fields,
+            "maxResults": max_results
+        }
+        data = await self._post_search_jql(payload, credentials)
+
+        processed_issues = [
+            {
+                "key": issue.get("key"),
+                "self": issue.get("self"),
+                "url": f"{base_url}/browse/{issue.get('key')}",
+                "fields": self._parse_subtask_fields(issue.get("fields", {}))
+            }
+            for issue in data.get("issues", [])
+        ]
+        # Enhanced API não retorna "total"; usamos o tamanho da página quando uma única página é suficiente
+        total = len(processed_issues) if data.get("isLast", True) else max_results
+        return {
+            "issues": processed_issues,
+            "total": total,
+            "maxResults": max_results
+        }
+
+    async def iter_issues_pages(
+        self,
+        jql: str,
+        fields: Optional[list[str]] = None,
+        max_results_per_page: int = 100,
+        credentials: Optional[dict] = None
+    ) -> AsyncIterator[list[dict]]:
+        """
+        Busca issues por JQL com paginação (nextPageToken), entregando cada página já
+        parseada assim que chega. Apenas uma página fica em memória por vez.
+        """
+        if fields is None:
+            fields = ["issuetype", "status", "created"]
+        next_page_token: Optional[str] = None
+
+        while True:
+            payload = {
+                "jql": jql,
+                "fields": fields,
+                "maxResults": max_results_per_page
+            }
+            if next_page_token:
+                payload["nextPageToken"] = next_page_token
+
+            data = await self._post_search_jql(payload, credentials)
+            issues = data.get("issues", [])
+            is_last = data.get("isLast", True)
+            next_page_token = data.get("nextPageToken")
+
+            page = []
+            for issue in issues:
+                parsed = self._parse_dashboard_issue_fields(issue.get("fields", {}), fields)
+                parsed["key"] = issue.get("key")
+                parsed["id"] = issue.get("id")
+                page.append(parsed)
+            del data, issues
+            if page:
+                yield page
+
+            if is_last or not next_page_token or not page:
+                break
+
+    async def search_issues_paginated(
+        self,
+        jql: str,
+        fields: Optional[list[str]] = None,
+        max_results_per_page: int = 100,
+        credentials: Optional[dict] = None
+    ) -> list[dict]:
+        """
+        Busca issues por JQL com paginação (nextPageToken) até trazer todas.
+        Mesmo retorno de JiraService.search_issues_paginated.
+        """
+        all_issues: list[dict] = []
+        async for page in self.iter_issues_pages(jql, fields, max_results_per_page, credentials):
+            all_issues.extend(page)
+        return all_issues
+
+    async def iter_issues_sharded_pages(
+        self,
+        build_jql: Callable[[str, str, bool], str],
+        start_date: str,
+        end_date: str,
+        fields: Optional[list[str]] = None,
+        shards: int = 1,
+        max_results_per_page: int = 100,
+        credentials: Optional[dict] = None,
+    ) -> AsyncIterator[list[dict]]:
+        """
+        Busca paginada particionada por data: divide [start_date, end_date] em até `shards`
+        fatias contíguas (no máximo uma por dia), pagina as fatias em paralelo e entrega cada
+        página assim que chega, sem ordem garantida entre fatias (o consumidor deve agregar de
+        forma independente da ordem). A fila entre fatias e consumidor guarda no máximo uma
+        página por fatia, então a memória não cresce com o total de issues (só o conjunto de
+        chaves já entregues, usado para descartar issues repetidas entre páginas ou fatias).
+
+        Args:
+            build_jql: build_jql(inicio, fim, fim_exclusivo) -> JQL da fatia (ex: build_defects_base_jql parcial)
+            start_date: Data inicial YYYY-MM-DD
+            end_date: Data final YYYY-MM-DD (inclusiva, como no JQL original)
+            fields: Lista de campos a retornar
+            shards: Número desejado de fatias
+            max_results_per_page: Máximo de resultados por página
+            credentials: Dict opcional com {base_url, email, api_token} para autenticação dinâmica
+        """
+        ranges = split_date_range(date.fromisoformat(start_date[:10]), date.fromisoformat(end_date[:10]), shards)
+        queue: asyncio.Queue = asyncio.Queue(maxsize=len(ranges))
+        done = object()
+
+        async def produce(jql: str) -> None:
+            try:
+                async for page in self.iter_issues_pages(jql, fields, max_results_per_page, credentials):
+                    await queue.put(page)
+            except Exception as e:
+                await queue.put(e)
+                return
+            await queue.put(done)
+
+        tasks = [
+            asyncio.ensure_future(produce(build_jql(shard_start.isoformat(), shard_end.isoformat(), end_exclusive)))
+            for shard_start, shard_end, end_exclusive in ranges
+        ]
+        pending = len(tasks)
+        seen: set = set()
+        try:
+            while pending:
+                item = await queue.get()
+                if item is done:
+                    pending -= 1
+                    continue
+                if isinstance(item, Exception):
+                    raise item
+                page = []
+                for issue in item:
+                    key = issue.get("key")
+                    if key in seen:
+                        continue
+                    seen.add(key)
+                    page.append(issue)
+                if page:
+                    yield page
+        finally:
+            for task in tasks:
+                task.cancel()
+            await asyncio.gather(*tasks, return_exceptions=True)
+
+    async def get_changelogs_bulk(
+        self,
+        issue_ids_or_keys: list[str],
+        field_ids: Optional[list[str]] = None,
+        credentials: Optional[dict] = None,
+    ) -> dict[str, list]:
+        """
+        Changelogs de várias issues via bulk changelog (mesmo retorno de JiraService.get_changelogs_bulk).
+        Os lotes de CHANGELOG_BULK_MAX_ISSUES são buscados em paralelo; cada lote segue sua paginação.
+        """
+        if field_ids is None:
+            field_ids = ["status"]
+        url = f"{self._get_base_url(credentials)}/rest/api/3/changelog/bulkfetch"
+
+        async def fetch_batch(batch: list[str]) -> dict[str, list]:
+            batch_result: dict[str, list] = {}
+            next_page_token: Optional[str] = None
+            while True:
+                payload = self._build_changelog_bulk_payload(batch, field_ids, next_page_token)
+                response = await self._request("POST", url, credentials, json=payload)
+                if response.status_code == 401:
+                    raise PermissionError("Token de API do Jira inválido ou expirado.")
+                if response.status_code == 403:
+                    raise PermissionError("Sem permissão para acessar o histórico das issues.")
+                response.raise_for_status()
+                next_page_token = self._merge_changelog_bulk_page(response.json(), batch_result)
+                if not next_page_token:
+                    return batch_result
+
+        batches = [
+            issue_ids_or_keys[i:i + CHANGELOG_BULK_MAX_ISSUES]
+            for i in range(0, len(issue_ids_or_keys), CHANGELOG_BULK_MAX_ISSUES)
+        ]
+        result: dict[str, list] = {}
+        for batch_result in await asyncio.gather(*(fetch_batch(b) for b in batches)):
+            for issue_id, histories in batch_result.items():
+                result.setdefault(issue_id, []).extend(histories)
+        return result
+
+    async def test_connection(self, credentials: Optional[dict] = None) -> dict:
+        """Testa a conexão com o Jira (mesmo retorno de JiraService.test_connection)."""
+        url = f"{self._get_base_url(credentials)}/rest/api/3/myself"
+        try:
+            response = await self._request("GET", url, credentials)
+
+            if response.status_code == 401:
+                return {
+                    "success": False,
+                    "error": "Falha na autenticação",
+                    "detail": "Verifique o email e token de API do Jira."
+                }
+            response.raise_for_status()
+
+            data = response.json()
+            return {
+                "success": True,
+                "message": "Conexão com Jira estabelecida com sucesso",
+                "user": {
+                    "displayName": data.get("displayName", ""),
+                    "emailAddress": data.get("emailAddress", "")
+                }
+            }
+        except httpx.TimeoutException:
+            return {
+                "success": False,
+                "error": "Timeout",
+                "detail": f"Conexão expirou após {self.timeout} segundos."
+            }
+        except (httpx.ConnectError, httpx.UnsupportedProtocol):
+            return {
+                "success": False,
+                "error": "Erro de conexão",
+                "detail": "Não foi possível conectar ao Jira. Verifique a URL."
+            }
+
+    async def project_search_all(self, max_results_per_page: int = 50, credentials: Optional[dict] = None) -> list[dict]:
+        """
+        Busca todos os projetos disponíveis para o usuário (paginação), ordenados por name.
+        Chamadas simultâneas do mesmo tenant compartilham uma única busca.
+        """
+        hit, cached, cache_key = self._metadata_cache_get("projects", credentials)
+        if hit:
+            return cached
+        flight_key = ("projects", self.tenant_key(credentials), max_results_per_page)
+        return await _flights.do(flight_key, lambda: self._fetch_projects(cache_key, max_results_per_page, credentials))
+
+    async def _fetch_projects(self, cache_key: tuple, max_results_per_page: int, credentials: Optional[dict]) -> list[dict]:
+        """Paginação de /project/search e gravação no cache de metadados; ver project_search_all."""
+        url = f"{self._get_base_url(credentials)}/rest/api/3/project/search"
+        all_projects = []
+        start_at = 0
+
+        while True:
+            params = {"startAt": start_at, "maxResults": max_results_per_page}
+            response = await self._request("GET", url, credentials, params=params)
+
+            if response.status_code == 401:
+                raise PermissionError("Token de API do Jira inválido ou expirado.")
+            if response.status_code == 403:
+                raise PermissionError("Sem permissão para listar projetos.")
+            response.raise_for_status()
+
+            data = response.json()
+            values = data.get("values", [])
+            total = data.get("total", 0)
+            all_projects.extend(self._parse_projects_page(values))
+
+            if start_at + len(values) >= total:
+                break
+            start_at += len(values)
+            if not values:
+                break
+
+        all_projects.sort(key=lambda x: (x.get("name") or "").lower())
+        self._metadata_cache_set(cache_key, "projects", all_projects)
+        return all_projects
+
+    async def get_project(self, project_key: str, credentials: Optional[dict] = None) -> dict:
+        """
+        Retorna dados básicos do projeto (key, name) por chave.
+        Se o projeto não existir ou não tiver permissão, retorna { key: project_key, name: "" }.
+        """
+        hit, cached, cache_key = self._metadata_cache_get("project", credentials, project_key)
+        if hit:
+            return cached
+        url = f"{self._get_base_url(credentials)}/rest/api/3/project/{project_key}"
+        try:
+            response = await self._request("GET", url, credentials)
+            if response.status_code in (401, 403, 404):
+                return {"key": project_key, "name": ""}
+            response.raise_for_status()
+            data = response.json()
+            project = {"key": data.get("key", project_key), "name": data.get("name", "")}
+            self._metadata_cache_set(cache_key, "project", project)
+            return project
+        except Exception:
+            return {"key": project_key, "name": ""}
+
+    async def _agile_get_all(
+        self,
+        url: str,
+        params: dict,
+        max_results: int,
+        forbidden_message: str,
+        credentials: Optional[dict] = None,
+        start_at: int = 0,
+    ) -> list[dict]:
+        """
+        Lê todas as páginas (startAt/isLast) de um endpoint da Jira Agile API e retorna os "values".
+        Raises PermissionError em 401/403.
+        """
+        values: list[dict] = []
+        while True:
+            page_params = {**params, "startAt": start_at, "maxResults": max_results}
+            response = await self._request("GET", url, credentials, params=page_params)
+            if response.status_code == 401:
+                raise PermissionError("Token de API do Jira inválido ou expirado.")
+            if response.status_code == 403:
+                raise PermissionError(forbidden_message)
+            response.raise_for_status()
+            data = response.json()
+            page = data.get("values", [])
+            values.extend(page)
+            if data.get("isLast", True) or not page:
+                return values
+            start_at += len(page)
+
+    async def agile_get_boards(self, project_key_or_id: str, max_results: int = 50, credentials: Optional[dict] = None) -> list[dict]:
+        """Lista todos os boards do projeto (Jira Agile API, paginação completa; max_results por página)."""
+        hit, cached, cache_key = self._metadata_cache_get("boards", credentials, project_key_or_id, max_results)
+        if hit:
+            return cached
+        url = self._agile_url("/board", credentials)
+        params = {"projectKeyOrId": project_key_or_id}
+        boards = await self._agile_get_all(url, params, max_results, "Sem permissão para acessar boards do projeto.", credentials)
+        self._metadata_cache_set(cache_key, "boards", boards)
+        return boards
+
+    async def agile_get_sprints_by_state(self, board_id: int, state: str = "active", max_results: int = 50, credentials: Optional[dict] = None) -> list[dict]:
+        """Lista todas as sprints do board por estado ('active', 'closed', 'future') (Jira Agile API, paginação completa)."""
+        hit, cached, cache_key = self._metadata_cache_get("sprints", credentials, board_id, state, max_results)
+        if hit:
+            return cached
+        sprints = await self.agile_get_all_sprints(board_id, max_results=max_results, state=state, credentials=credentials)
+        self._metadata_cache_set(cache_key, "sprints", sprints)
+        return sprints
+
+    async def agile_get_active_sprints(self, board_id: int, max_results: int = 50, credentials: Optional[dict] = None) -> list[dict]:
+        """Lista sprints ativas do board (Jira Agile API)."""
+        return await self.agile_get_sprints_by_state(board_id, state="active", max_results=max_results, credentials=credentials)
+
+    async def agile_get_all_sprints(
+        self,
+        board_id: int,
+        start_at: int = 0,
+        max_results: int = 50,
+        state: Optional[str] = None,
+        credentials: Optional[dict] = None,
+    ) -> list[dict]:
+        """
+        Lista todas as sprints do board a partir de start_at, seguindo a paginação
+        (startAt/isLast) da Jira Agile API. state filtra por estado ('active,future', etc.).
+        """
+        url = self._agile_url(f"/board/{board_id}/sprint", credentials)
+        params = {"state": state} if state else {}
+        return await self._agile_get_all(
+            url, params, max_results, "Sem permissão para acessar sprints do board.", credentials, start_at=start_at
+        )
+
+    async def agile_get_sprint(self, sprint_id: int, credentials: Optional[dict] = None) -> Optional[dict]:
+        """Sprint por id (Jira Agile API). None se não existir mais."""
+        url = self._agile_url(f"/sprint/{sprint_id}", credentials)
+        response = await self._request("GET", url, credentials)
+        if response.status_code == 401:
+            raise PermissionError("Token de API do Jira inválido ou expirado.")
+        if response.status_code == 403:
+            raise PermissionError("Sem permissão para acessar sprints do board.")
+        if response.status_code == 404:
+            return None
+        response.raise_for_status()
+        return response.json()
+
+    async def get_sprint_index(self, project_key: str, credentials: Optional[dict] = None) -> SprintIndex:
+        """Índice de sprints do projeto (persistido e atualizado incrementalmente)."""
+        return await get_sprint_index_store().get(self, project_key, credentials)
+
+    async def get_sprint_current_dates(self, project_key: str, credentials: Optional[dict] = None) -> tuple[str, str, dict]:
+        """
+        Obtém start_date e end_date da sprint ativa do projeto (board scrum "Downstream").
+        Raises ValueError se não houver board downstream ou sprint ativa.
+        """
+        index = await self.get_sprint_index(project_key, credentials)
+        best_sprint = index.current()
+        if best_sprint is None:
+            raise ValueError("Sprint atual indisponível para o projeto informado.")
+        return best_sprint["startDate"], best_sprint["endDate"], best_sprint
+
+    async def get_sprint_previous_dates(self, project_key: str, credentials: Optional[dict] = None) -> tuple[str, str, dict]:
+        """
+        Obtém start_date e end_date da última sprint fechada do projeto (board scrum "Downstream").
+        Considera todas as sprints fechadas dos boards (paginação completa).
+        Raises ValueError se não houver board downstream ou sprint fechada.
+        """
+        index = await self.get_sprint_index(project_key, credentials)
+        best_sprint = index.previous()
+        if best_sprint is None:
+            raise ValueError("Sprint passada indisponível para o projeto informado.")
+        return best_sprint["startDate"], best_sprint["endDate"], best_sprint
@@ -0,0 +1,343 @@
+# backend/services/jira_client_registry.py
+
+"""
+Registro de clientes HTTP do Jira por tenant (base_url, email, hash do token).
+Cada tenant mantém uma sessão com pool keep-alive reutilizada entre requests e entre
+serviços (JiraService, DashboardService), evitando novo handshake TCP+TLS a cada chamada.
+Tenants ociosos são removidos por LRU; o fechamento de um cliente com requisições em andamento
+é adiado até a última terminar.
+O cliente assíncrono (httpx.AsyncClient) é criado sob demanda, no event loop em uso.
+"""
+
+import asyncio
+import hashlib
+import logging
+import os
+import threading
+import time
+from base64 import b64encode
+from collections import OrderedDict
+from contextlib import contextmanager
+from typing import Optional, Tuple
+
+import httpx
+import requests
+from requests.adapters import HTTPAdapter
+from urllib3.exceptions import MaxRetryError, ResponseError
+from urllib3.util.retry import Retry
+
+from backend.services.jira_rate_limiter import RETRY_STATUS_CODES, TenantRateLimiter, is_retryable
+
+logger = logging.getLogger(__name__)
+
+TenantKey = Tuple[str, str, str]
+
+
+def _close_async_client(client: Optional[httpx.AsyncClient], loop: Optional[asyncio.AbstractEventLoop]) -> None:
+    """
+    Fecha um httpx.AsyncClient no event loop em que foi criado (suas conexões pertencem a ele):
+    - loop rodando: aclose é agendado nele;
+    - loop parado: aclose roda nele até o fim (numa thread auxiliar se esta thread já tem um loop rodando);
+    - loop fechado: as conexões não podem mais ser fechadas pelo asyncio e ficam para o coletor.
+    """
+    if client is None or loop is None or loop.is_closed():
+        return
+    try:
+        if loop.is_running():
+            asyncio.run_coroutine_threadsafe(client.aclose(), loop)
+            return
+        try:
+            asyncio.get_running_loop()
+        except RuntimeError:
+            loop.run_until_complete(client.aclose())
+            return
+        closer = threading.Thread(target=loop.run_until_complete, args=(client.aclose(),), daemon=True)
+        closer.start()
+        closer.join(timeout=5)
+    except Exception as e:
+        logger.debug("[jiraClient] falha ao fechar cliente assíncrono: %s", e)
+
+
+class _IdempotentRetry(Retry):
+    """
+    Retry da sessão síncrona: repete GETs e os POSTs de leitura (search/jql, changelog/bulkfetch).
+    allowed_methods só distingue o método; a URL é conferida aqui com is_retryable.
+    """
+
+    def increment(self, method=None, url=None, response=None, error=None, _pool=None, _stacktrace=None):
+        if response is not None and method and url and not is_retryable(method, url):
+            raise MaxRetryError(_pool, url, ResponseError(f"{method} {url} não é repetível"))
+        return super().increment(method, url, response, error, _pool, _stacktrace)
+
+
+def tenant_key(base_url: Optional[str], email: Optional[str], api_token: Optional[str]) -> TenantKey:
+    """
+    Chave do tenant: (base_url normalizada, email, sha256 do token).
+    O token nunca fica em claro na chave (pode aparecer em logs/métricas).
+    """
+    token_hash = hashlib.sha256((api_token or "").encode()).hexdigest()
+    return ((base_url or "").rstrip("/"), (email or "").strip().lower(), token_hash)
+
+
+class _TrackedSession(requests.Session):
+    """Sessão que registra cada requisição como checkout do JiraClient (fechamento adiado)."""
+
+    def __init__(self, owner: "JiraClient"):
+        super().__init__()
+        self._owner = owner
+
+    def request(self, *args, **kwargs):
+        with self._owner.checkout():
+            return super().request(*args, **kwargs)
+
+
+class JiraClient:
+    """
+    Cliente de um tenant: sessão HTTP com pool keep-alive e header Basic pré-computado.
+    Requisições em andamento são contadas (checkout); close() com contagem > 0 só marca o cliente
+    e o fechamento acontece quando a última requisição termina.
+    `session` (requests) atende o JiraService; `get_async_client()` (httpx) atende o AsyncJiraService.
+    `rate_limiter` controla taxa, requisições simultâneas e repetições apenas do cliente assíncrono.
+    A sessão síncrona não passa por ele: só repete GETs e buscas (search/jql, changelog/bulkfetch)
+    em 429/503 respeitando Retry-After (urllib3 Retry), sem taxa nem limite de simultâneas.
+    """
+
+    def __init__(self, base_url: str, email: str, api_token: str, pool_size: int):
+        self.base_url = (base_url or "").rstrip("/")
+        self.pool_size = pool_size
+        self.auth_header = b64encode(f"{email}:{api_token}".encode()).decode()
+        self._state_lock = threading.Lock()
+        self._in_flight = 0
+        self._closing = False
+        self.session = _TrackedSession(self)
+        self.rate_limiter = TenantRateLimiter.from_env(pool_size)
+        retry = _IdempotentRetry(
+            total=self.rate_limiter.max_retries,
+            connect=0,
+            read=0,
+            status_forcelist=RETRY_STATUS_CODES,
+            allowed_methods=frozenset(["GET", "POST"]),
+            backoff_factor=self.rate_limiter.base_delay,
+            respect_retry_after_header=True,
+            raise_on_status=False,
+        )
+        adapter = HTTPAdapter(pool_connections=1, pool_maxsize=pool_size, max_retries=retry)
+        self.session.mount("https://", adapter)
+        self.session.mount("http://", adapter)
+        self.last_used = time.monotonic()
+        self._async_client: Optional[httpx.AsyncClient] = None
+        self._async_loop: Optional[asyncio.AbstractEventLoop] = None
+
+    def touch(self) -> None:
+        self.last_used = time.monotonic()
+
+    @property
+    def in_flight(self) -> int:
+        """Requisições em andamento (checkouts abertos)."""
+        return self._in_flight
+
+    @contextmanager
+    def checkout(self):
+        """Marca uma requisição em andamento: o cliente não é fechado até ela terminar."""
+        with self._state_lock:
+            self._in_flight += 1
+        try:
+            yield self
+        finally:
+            with self._state_lock:
+                self._in_flight -= 1
+                close_now = self._closing and not self._in_flight
+                if close_now:
+                    self._closing = False
+            self.touch()
+            if close_now:
+                self._close_now()
+
+    def get_async_client(self) -> httpx.AsyncClient:
+        """
+        Retorna o httpx.AsyncClient do tenant (pool keep-alive de pool_size conexões).
+        O cliente fica atrelado ao event loop em que foi criado; se o loop mudar, é recriado.
+        """
+        loop = asyncio.get_running_loop()
+        if self._async_client is None or self._async_loop is not loop or self._async_client.is_closed:
+            if self._async_client is not None and self._async_loop is not loop:
+                # Cliente de outro loop: fechado lá, para não deixar as conexões abertas
+                _close_async_client(self._async_client, self._async_loop)
+            limits = httpx.Limits(max_connections=self.pool_size, max_keepalive_connections=self.pool_size)
+            self._async_client = httpx.AsyncClient(limits=limits)
+            self._async_loop = loop
+        return self._async_client
+
+    def close(self) -> None:
+        """Fecha sessão e cliente assíncrono; com requisições em andamento, adia para o fim da última."""
+        with self._state_lock:
+            if self._in_flight:
+                self._closing = True
+                return
+        self._close_now()
+
+    async def aclose(self) -> None:
+        """
+        Fecha já, sem esperar requisições em andamento (encerramento do app). O cliente assíncrono
+        do loop atual é aguardado até fechar; o de outro loop segue _close_async_client.
+        """
+        client, loop = self._detach()
+        if client is None or loop is not asyncio.get_running_loop():
+            _close_async_client(client, loop)
+            return
+        try:
+            await client.aclose()
+        except Exception as e:
+            logger.debug("[jiraClient] falha ao fechar cliente assíncrono: %s", e)
+
+    def _close_now(self) -> None:
+        _close_async_client(*self._detach())
+
+    def _detach(self) -> tuple[Optional[httpx.AsyncClient], Optional[asyncio.AbstractEventLoop]]:
+        """Fecha a sessão e solta o cliente assíncrono; retorna (cliente, loop) para o chamador fechar."""
+        try:
+            self.session.close()
+        except Exception:
+            pass
+        client, loop = self._async_client, self._async_loop
+        self._async_client = None
+        self._async_loop = None
+        return client, loop
+
+
+class JiraClientRegistry:
+    """
+    Registro LRU de JiraClient por tenant.
+    - max_tenants: máximo de tenants mantidos; o menos usado recentemente é descartado.
+    - idle_timeout: segundos sem uso após os quais o tenant é descartado (só sem requisições em andamento).
+    - pool_size: conexões keep-alive por tenant.
+    """
+
+    def __init__(self, max_tenants: int = 32, pool_size: int = 10, idle_timeout: int = 900):
+        self.max_tenants = max(1, max_tenants)
+        self.pool_size = max(1, pool_size)
+        self.idle_timeout = idle_timeout
+        self._clients: "OrderedDict[TenantKey, JiraClient]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, base_url: Optional[str], email: Optional[str], api_token: Optional[str]) -> JiraClient:
+        """Retorna o cliente do tenant, criando-o se necessário."""
+        key = tenant_key(base_url, email, api_token)
+        with self._lock:
+            self._evict_idle()
+            client = self._clients.get(key)
+            if client is not None:
+                self._clients.move_to_end(key)
+                client.touch()
+                return client
+            client = JiraClient(base_url or "", email or "", api_token or "", self.pool_size)
+            self._clients[key] = client
+            while len(self._clients) > self.max_tenants:
+                _, evicted = self._clients.popitem(last=False)
+                evicted.close()
+            return client
+
+    def _evict_idle(self) -> None:
+        """Remove tenants sem uso há mais de idle_timeout segundos e sem requisições em andamento (chamado com lock)."""
+        if not self.idle_timeout or self.idle_timeout <= 0:
+            return
+        now = time.monotonic()
+        idle = [k for k, c in self._clients.items() if not c.in_flight and now - c.last_used > self.idle_timeout]
+        for key in idle:
+            self._clients.pop(key).close()
+
+    async def prewarm(
+        self,
+        base_url: Optional[str],
+        email: Optional[str],
+        api_token: Optional[str],
+        connections: Optional[int] = None,
+        timeout: int = 10,
+    ) -> int:
+        """
+        Abre antecipadamente conexões do pool assíncrono do tenant (o mesmo httpx.AsyncClient usado
+        pelo AsyncJiraService no event loop atual): GET /rest/api/3/serverInfo em paralelo.
+        Retorna o número de conexões estabelecidas com sucesso.
+        """
+        if not base_url:
+            return 0
+        client = self.get(base_url, email, api_token)
+        total = min(connections or client.pool_size, client.pool_size)
+        url = f"{client.base_url}/rest/api/3/serverInfo"
+        http = client.get_async_client()
+
+        async def _warm() -> bool:
+            try:
+                await http.get(url, headers={"Accept": "application/json"}, timeout=timeout)
+                return True
+            except Exception as e:
+                logger.debug("[jiraPool] prewarm falhou: %s", e)
+                return False
+
+        with client.checkout():
+            ok = sum(1 for r in await asyncio.gather(*(_warm() for _ in range(total))) if r)
+        logger.info("[jiraPool] prewarm base_url=%s connections=%s/%s", client.base_url, ok, total)
+        return ok
+
+    def stats(self) -> dict:
+        """Resumo do registro (tenants, pool e fila de requisições somada de todos os tenants)."""
+        with self._lock:
+            limiters = [c.rate_limiter.stats() for c in self._clients.values()]
+            return {
+                "tenants": len(self._clients),
+                "maxTenants": self.max_tenants,
+                "poolSize": self.pool_size,
+                "queued": sum(l["queued"] for l in limiters),
+                "inFlight": sum(l["inFlight"] for l in limiters),
+                "checkedOut": sum(c.in_flight for c in self._clients.values()),
+                "throttled": sum(l["throttled"] for l in limiters),
+                "retries": sum(l["retries"] for l in limiters),
+            }
+
+    def clear(self) -> None:
+        with self._lock:
+            for client in self._clients.values():
+                client.close()
+            self._clients.clear()
+
+    async def aclose(self) -> None:
+        """Descarta todos os tenants aguardando o fechamento dos clientes (shutdown do app)."""
+        with self._lock:
+            clients = list(self._clients.values())
+            self._clients.clear()
+        for client in clients:
+            await client.aclose()
+
+
+_registry: Optional[JiraClientRegistry] = None
+_registry_lock = threading.Lock()
+
+
+def get_client_registry() -> JiraClientRegistry:
+    """Retorna o registro global (criado na primeira chamada a partir das variáveis de ambiente)."""
+    global _registry
+    if _registry is None:
+        with _registry_lock:
+            if _registry is None:
+                _registry = JiraClientRegistry(
+                    max_tenants=int(os.getenv("JIRA_POOL_MAX_TENANTS", "32")),
+                    pool_size=int(os.getenv("JIRA_POOL_SIZE", "10")),
+                    idle_timeout=int(os.getenv("JIRA_POOL_IDLE_TIMEOUT", "900")),
+                )
+    return _registry
+
+
+async def prewarm_env_tenant() -> int:
+    """
+    Pré-aquece as conexões do tenant configurado no .env, se JIRA_POOL_PREWARM=true
+    (no event loop da aplicação, onde as requisições ao Jira são feitas).
+    Retorna o número de conexões abertas (0 se desabilitado ou sem configuração).
+    """
+    if os.getenv("JIRA_POOL_PREWARM", "false").strip().lower() not in ("1", "true", "yes"):
+        return 0
+    base_url = os.getenv("JIRA_BASE_URL")
+    email = os.getenv("JIRA_USER_EMAIL")
+    api_token = os.getenv("JIRA_API_TOKEN")
+    if not all([base_url, email, api_token]):
+        return 0
+    return await get_client_registry().prewarm(base_url, email, api_token)
@@ -0,0 +1,61 @@
+# backend/services/jira_metadata_cache.py
+
+"""
+Cache de metadados do Jira por tenant: lista de projetos, detalhes de projeto,
+boards e sprints. Dados que mudam poucas vezes ao dia; TTL por tipo (kind),
+configurável por env (JIRA_CACHE_TTL_<KIND> em segundos).
+"""
+
+import os
+import threading
+from typing import Hashable, Optional
+
+from backend.services.jira_client_registry import TenantKey
+from backend.utils.ttl_cache import TTLCache
+
+# TTL padrão (segundos) por tipo de metadado
+METADATA_TTL_DEFAULTS = {
+    "projects": 3600,
+    "project": 3600,
+    "boards": 3600,
+    "sprints": 300,
+}
+
+_cache: Optional[TTLCache] = None
+_cache_lock = threading.Lock()
+
+
+def get_metadata_cache() -> TTLCache:
+    """Cache global de metadados (tamanho via JIRA_CACHE_MAX_ENTRIES)."""
+    global _cache
+    if _cache is None:
+        with _cache_lock:
+            if _cache is None:
+                _cache = TTLCache(max_entries=int(os.getenv("JIRA_CACHE_MAX_ENTRIES", "512")))
+    return _cache
+
+
+def metadata_ttl(kind: str) -> int:
+    """TTL do tipo de metadado: JIRA_CACHE_TTL_<KIND> ou o default."""
+    return int(os.getenv(f"JIRA_CACHE_TTL_{kind.upper()}", str(METADATA_TTL_DEFAULTS.get(kind, 300))))
+
+
+def metadata_key(tenant: TenantKey, kind: str, *args: Hashable) -> tuple:
+    """Chave do cache: (tenant, kind, *args)."""
+    return (tenant, kind) + tuple(args)
+
+
+def invalidate_metadata(tenant: Optional[TenantKey] = None, kind: Optional[str] = None) -> int:
+    """
+    Invalida metadados em cache, opcionalmente restrito a um tenant e/ou tipo.
+    Retorna o número de entradas removidas.
+    """
+    def matches(key) -> bool:
+        return (tenant is None or key[0] == tenant) and (kind is None or key[1] == kind)
+
+    return get_metadata_cache().invalidate(matches)
+
+
+def metadata_cache_stats() -> dict:
+    """Contadores de hit/miss e ocupação do cache de metadados."""
+    return get_metadata_cache().stats()
@@ -0,0 +1,263 @@
+# backend/services/jira_rate_limiter.py
+
+"""
+Controle de taxa das requisições assíncronas (httpx) ao Jira por tenant.
+A sessão síncrona (requests) não passa por aqui: ela só repete em 429/503 via urllib3 Retry.
+- Limite de requisições simultâneas (JIRA_MAX_IN_FLIGHT).
+- Taxa adaptativa: sem limite local até o Jira responder 429; então um token bucket passa a
+  valer com metade da taxa observada, que volta a subir a cada período sem 429 até liberar de novo.
+  JIRA_RATE_LIMIT_RPS > 0 fixa um teto (o bucket vale sempre, no máximo nessa taxa).
+- Respostas 429/503 pausam o tenant pelo tempo indicado em Retry-After / X-RateLimit-Reset;
+  requisições idempotentes são repetidas com backoff exponencial com jitter.
+"""
+
+import asyncio
+import logging
+import math
+import os
+import random
+import threading
+import time
+from collections import deque
+from contextlib import asynccontextmanager
+from datetime import datetime, timezone
+from typing import Optional
+
+from dateutil.parser import parse as dateutil_parse
+
+logger = logging.getLogger(__name__)
+
+RETRY_STATUS_CODES = (429, 503)
+
+# Janela (segundos) da taxa observada usada na primeira redução
+RATE_WINDOW_SECONDS = 5.0
+# Fatores da taxa adaptativa: redução a cada 429, aumento a cada período sem 429
+RATE_DECREASE_FACTOR = 0.5
+RATE_INCREASE_FACTOR = 1.5
+
+# POSTs de leitura (sem efeito colateral) que podem ser repetidos com segurança
+RETRYABLE_POST_SUFFIXES = ("/search/jql", "/changelog/bulkfetch")
+
+
+def is_retryable(method: str, url: str) -> bool:
+    """GETs e POSTs de busca (search/jql, changelog/bulkfetch) são idempotentes."""
+    method = method.upper()
+    if method == "GET":
+        return True
+    return method == "POST" and url.split("?", 1)[0].rstrip("/").endswith(RETRYABLE_POST_SUFFIXES)
+
+
+def _seconds_until(value: str) -> Optional[float]:
+    """Segundos até a data (HTTP-date ou ISO) informada; None se não for uma data válida."""
+    try:
+        reset = dateutil_parse(value)
+    except (ValueError, OverflowError):
+        return None
+    if reset.tzinfo is None:
+        reset = reset.replace(tzinfo=timezone.utc)
+    return max(0.0, (reset - datetime.now(timezone.utc)).total_seconds())
+
+
+def retry_after_seconds(headers) -> Optional[float]:
+    """
+    Tempo de espera indicado pelo Jira: Retry-After (segundos ou data HTTP) ou,
+    na falta dele, X-RateLimit-Reset (timestamp ISO). None se não houver indicação.
+    """
+    value = headers.get("Retry-After")
+    if value:
+        try:
+            return max(0.0, float(value))
+        except ValueError:
+            seconds = _seconds_until(value)
+            if seconds is not None:
+                return seconds
+    reset_value = headers.get("X-RateLimit-Reset")
+    if reset_value:
+        return _seconds_until(reset_value)
+    return None
+
+
+class TenantRateLimiter:
+    """
+    Limita as requisições de um tenant.
+    - rate: teto fixo (requisições por segundo) ou None para nenhum; burst: rajada máxima do bucket.
+    - Taxa em vigor (current_rate) adaptativa: None (sem limite) até um 429; cada 429 a reduz para
+      RATE_DECREASE_FACTOR da taxa atual (ou observada), nunca abaixo de min_rate; cada
+      recovery_seconds sem 429 a multiplica por RATE_INCREASE_FACTOR e, ao alcançar a taxa que
+      causou o último 429, volta ao teto (ou a nenhum limite).
+    - max_in_flight: requisições simultâneas.
+    - max_retries, base_delay, max_delay: política de repetição em 429/503.
+    queued / in_flight ficam disponíveis em stats().
+    """
+
+    def __init__(
+        self,
+        rate: Optional[float] = None,
+        burst: int = 20,
+        max_in_flight: int = 10,
+        max_retries: int = 4,
+        base_delay: float = 0.5,
+        max_delay: float = 30.0,
+        min_rate: float = 1.0,
+        recovery_seconds: float = 30.0,
+    ):
+        self.rate = max(0.1, rate) if rate else None
+        self.current_rate = self.rate
+        self.min_rate = max(0.1, min_rate)
+        self.recovery_seconds = recovery_seconds
+        self._recover_rate: Optional[float] = None
+        self._adjusted_at = 0.0
+        self._recent: deque = deque()
+        self.burst = max(1, burst)
+        self.max_in_flight = max(1, max_in_flight)
+        self.max_retries = max(0, max_retries)
+        self.base_delay = base_delay
+        self.max_delay = max_delay
+        self._tokens = float(self.burst)
+        self._updated = time.monotonic()
+        self._blocked_until = 0.0
+        self._lock = threading.Lock()
+        self._semaphore: Optional[asyncio.Semaphore] = None
+        self._semaphore_loop: Optional[asyncio.AbstractEventLoop] = None
+        self.queued = 0
+        self.in_flight = 0
+        self.throttled = 0
+        self.retries = 0
+
+    @classmethod
+    def from_env(cls, pool_size: int) -> "TenantRateLimiter":
+        """
+        Configuração via JIRA_RATE_LIMIT_*, JIRA_MAX_IN_FLIGHT e JIRA_RETRY_* (in-flight padrão = pool).
+        JIRA_RATE_LIMIT_RPS vazio ou 0 = sem teto (só a taxa adaptativa após 429).
+        """
+        return cls(
+            rate=float(os.getenv("JIRA_RATE_LIMIT_RPS") or "0"),
+            burst=int(os.getenv("JIRA_RATE_LIMIT_BURST", "20")),
+            min_rate=float(os.getenv("JIRA_RATE_LIMIT_MIN_RPS", "1")),
+            recovery_seconds=float(os.getenv("JIRA_RATE_LIMIT_RECOVERY", "30")),
+            max_in_flight=int(os.getenv("JIRA_MAX_IN_FLIGHT", str(pool_size))),
+            max_retries=int(os.getenv("JIRA_RETRY_MAX", "4")),
+            base_delay=float(os.getenv("JIRA_RETRY_BASE_DELAY", "0.5")),
+            max_delay=float(os.getenv("JIRA_RETRY_MAX_DELAY", "30")),
+        )
+
+    def _get_semaphore(self) -> asyncio.Semaphore:
+        """Semáforo de in-flight do event loop atual (recriado se o loop mudar)."""
+        loop = asyncio.get_running_loop()
+        if self._semaphore is None or self._semaphore_loop is not loop:
+            self._semaphore = asyncio.Semaphore(self.max_in_flight)
+            self._semaphore_loop = loop
+        return self._semaphore
+
+    def _record_start(self, now: float) -> None:
+        """Registra o início de uma requisição na janela da taxa observada (chamado com lock)."""
+        self._recent.append(now)
+        while self._recent and self._recent[0] < now - RATE_WINDOW_SECONDS:
+            self._recent.popleft()
+
+    def _relax(self, now: float) -> None:
+        """Aumenta a taxa em vigor após recovery_seconds sem 429 (chamado com lock)."""
+        if self.current_rate is None or self.current_rate == self.rate:
+            return
+        if now - self._adjusted_at < self.recovery_seconds:
+            return
+        self._adjusted_at = now
+        raised = self.current_rate * RATE_INCREASE_FACTOR
+        if self._recover_rate is None or raised >= self._recover_rate:
+            self.current_rate = self.rate
+        else:
+            self.current_rate = raised if self.rate is None else min(raised, self.rate)
+
+    def _tighten(self, now: float) -> None:
+        """Reduz a taxa em vigor após um 429 (chamado com lock)."""
+        observed = len(self._recent) / RATE_WINDOW_SECONDS
+        current = self.current_rate if self.current_rate is not None else max(observed, self.min_rate)
+        self._recover_rate = current
+        self.current_rate = max(self.min_rate, current * RATE_DECREASE_FACTOR)
+        self._adjusted_at = now
+        logger.info("[jiraRateLimit] taxa reduzida para %.2f rps (429)", self.current_rate)
+
+    async def _acquire_token(self) -> None:
+        """Aguarda um token do bucket, se houver taxa em vigor (e o fim de uma pausa por 429, se houver)."""
+        while True:
+            with self._lock:
+                now = time.monotonic()
+                wait = self._blocked_until - now
+                if wait <= 0:
+                    self._relax(now)
+                    rate = self.current_rate
+                    if rate is None:
+                        self._record_start(now)
+                        return
+                    burst = min(self.burst, max(1, math.ceil(rate)))
+                    self._tokens = min(burst, self._tokens + (now - self._updated) * rate)
+                    self._updated = now
+                    if self._tokens >= 1:
+                        self._tokens -= 1
+                        self._record_start(now)
+                        return
+                    wait = (1 - self._tokens) / rate
+            await asyncio.sleep(wait)
+
+    @asynccontextmanager
+    async def slot(self):
+        """Reserva uma vaga de requisição (in-flight + token) durante o bloco."""
+        self.queued += 1
+        dequeued = False
+        try:
+            async with self._get_semaphore():
+                await self._acquire_token()
+                self.queued -= 1
+                dequeued = True
+                self.in_flight += 1
+                try:
+                    yield
+                finally:
+                    self.in_flight -= 1
+        finally:
+            if not dequeued:
+                self.queued -= 1
+
+    def pause(self, seconds: float) -> None:
+        """Suspende novas requisições do tenant por `seconds` (pedido do Jira via 429)."""
+        with self._lock:
+            self._blocked_until = max(self._blocked_until, time.monotonic() + seconds)
+            self._tokens = 0.0
+
+    def backoff_delay(self, attempt: int, headers=None) -> float:
+        """Espera antes da tentativa seguinte: indicação do Jira ou backoff exponencial com jitter."""
+        hinted = retry_after_seconds(headers) if headers is not None else None
+        if hinted is not None:
+            return min(self.max_delay, hinted + random.uniform(0, self.base_delay))
+        return random.uniform(0, min(self.max_delay, self.base_delay * (2 ** attempt)))
+
+    def observe(self, status_code: int, headers) -> Optional[float]:
+        """
+        Registra a resposta: em 429 reduz a taxa em vigor; em 429 (ou X-RateLimit-Remaining=0)
+        pausa o tenant até o reset. Retorna a pausa aplicada, se houver.
+        """
+        delay = None
+        if status_code == 429:
+            self.throttled += 1
+            with self._lock:
+                self._tighten(time.monotonic())
+            delay = retry_after_seconds(headers)
+            if delay is None:
+                delay = self.base_delay
+        elif headers.get("X-RateLimit-Remaining") == "0":
+            delay = retry_after_seconds(headers)
+        if delay:
+            self.pause(min(self.max_delay, delay))
+        return delay
+
+    def stats(self) -> dict:
+        return {
+            "queued": self.queued,
+            "inFlight": self.in_flight,
+            "maxInFlight": self.max_in_flight,
+            "rate": self.rate,
+            "currentRate": self.current_rate,
+            "burst": self.burst,
+            "throttled": self.throttled,
+            "retries": self.retries,
+        }
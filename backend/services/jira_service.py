@@ -4,11 +4,18 @@ import logging
 import os
 import requests
 from base64 import b64encode
-from typing import Optional
+from datetime import datetime, timezone
+from typing import Any, Hashable, Optional
 from backend.services.issue_tracker_base import IssueTrackerBase
+from backend.services.jira_client_registry import JiraClient, TenantKey, get_client_registry, tenant_key
+from backend.services.jira_metadata_cache import get_metadata_cache, metadata_key, metadata_ttl
+from backend.services.sprint_index import select_sprint
 
 logger = logging.getLogger(__name__)
 
+# Limite de issues por requisição do bulk changelog (POST /rest/api/3/changelog/bulkfetch)
+CHANGELOG_BULK_MAX_ISSUES = 1000
+
 class JiraService(IssueTrackerBase):
     """Implementação do Issue Tracker para Jira Cloud."""
     
@@ -57,17 +64,47 @@ class JiraService(IssueTrackerBase):
             credentials = f"{self.email}:{self.api_token}"
             self.auth_header = b64encode(credentials.encode()).decode()
     
+    def _get_client(self, credentials: Optional[dict] = None) -> JiraClient:
+        """
+        Retorna o cliente HTTP (sessão keep-alive) do tenant, a partir do registro global.
+        
+        Args:
+            credentials: Dict opcional com {base_url, email, api_token} para autenticação dinâmica.
+                         Se não fornecido, usa credenciais do .env
+        """
+        if credentials:
+            return get_client_registry().get(
+                self._get_base_url(credentials), credentials.get("email"), credentials.get("api_token")
+            )
+        return get_client_registry().get(self.base_url, self.email, self.api_token)
+
+    def tenant_key(self, credentials: Optional[dict] = None) -> TenantKey:
+        """Chave do tenant (base_url, email, hash do token) para caches e estado por credencial."""
+        if credentials:
+            return tenant_key(self._get_base_url(credentials), credentials.get("email"), credentials.get("api_token"))
+        return tenant_key(self.base_url, self.email, self.api_token)
+
+    def _metadata_cache_get(self, kind: str, credentials: Optional[dict], *args: Hashable) -> tuple[bool, Any, tuple]:
+        """Consulta o cache de metadados do tenant. Retorna (hit, valor, chave)."""
+        key = metadata_key(self.tenant_key(credentials), kind, *args)
+        hit, value = get_metadata_cache().get(key)
+        return hit, value, key
+
+    def _metadata_cache_set(self, key: tuple, kind: str, value: Any) -> None:
+        """Armazena metadado no cache com o TTL do tipo."""
+        get_metadata_cache().set(key, value, metadata_ttl(kind))
+
     def _get_headers(self, credentials: Optional[dict] = None) -> dict:
         """
         Retorna headers padrão para requests.
+        O header Basic vem pré-computado do cliente do tenant.
         
         Args:
             credentials: Dict opcional com {base_url, email, api_token} para autenticação dinâmica.
                          Se não fornecido, usa credenciais do .env
         """
         if credentials:
-            auth_str = f"{credentials['email']}:{credentials['api_token']}"
-            auth_header = b64encode(auth_str.encode()).decode()
+            auth_header = self._get_client(credentials).auth_header
         else:
             auth_header = self.auth_header
         
@@ -121,6 +158,29 @@ class JiraService(IssueTrackerBase):
             fields: Lista de campos a retornar
             credentials: Dict opcional com {base_url, email, api_token} para autenticação dinâmica
         """
+        url, fields, include_changelog = self._build_issue_request(issue_key, fields, credentials)
+        
+        response = self._get_client(credentials).session.get(
+            url,
+            headers=self._get_headers(credentials),
+            timeout=self.timeout
+        )
+        
+        if response.status_code == 404:
+            raise ValueError(f"Card {issue_key} não encontrado.")
+        if response.status_code == 401:
+            raise PermissionError("Token de API do Jira inválido ou expirado.")
+        if response.status_code == 403:
+            raise PermissionError(f"Sem permissão para acessar o card {issue_key}.")
+        
+        response.raise_for_status()
+        
+        return self._build_issue_result(response.json(), fields, include_changelog)
+    
+    def _build_issue_request(
+        self, issue_key: str, fields: Optional[list[str]], credentials: Optional[dict] = None
+    ) -> tuple[str, list[str], bool]:
+        """Monta (url, fields, include_changelog) do GET de issue."""
         if fields is None:
             fields = ["summary", "description"]
         
@@ -140,23 +200,10 @@ class JiraService(IssueTrackerBase):
         # Adicionar expand=changelog se solicitado
         if include_changelog:
             url += "&expand=changelog"
-        
-        response = requests.get(
-            url,
-            headers=self._get_headers(credentials),
-            timeout=self.timeout
-        )
-        
-        if response.status_code == 404:
-            raise ValueError(f"Card {issue_key} não encontrado.")
-        if response.status_code == 401:
-            raise PermissionError("Token de API do Jira inválido ou expirado.")
-        if response.status_code == 403:
-            raise PermissionError(f"Sem permissão para acessar o card {issue_key}.")
-        
-        response.raise_for_status()
-        
-        data = response.json()
+        return url, fields, include_changelog
+    
+    def _build_issue_result(self, data: dict, fields: list[str], include_changelog: bool) -> dict:
+        """Converte o JSON do GET de issue no dict retornado por get_issue."""
         parsed_fields = self._parse_fields(data.get("fields", {}))
         
         # Processar changelog se presente
@@ -229,8 +276,11 @@ class JiraService(IssueTrackerBase):
         parsed_histories = []
         
         for history in histories:
-            author = history.get("author", {})
+            author = history.get("author") or {}
             created = history.get("created", "")
+            # O bulk changelog retorna created como epoch (ms); normalizar para ISO
+            if isinstance(created, (int, float)):
+                created = self._epoch_ms_to_iso(created)
             items = history.get("items", [])
             
             parsed_items = []
@@ -258,6 +308,12 @@ class JiraService(IssueTrackerBase):
         
         return parsed_histories
     
+    @staticmethod
+    def _epoch_ms_to_iso(epoch_ms: float) -> str:
+        """Epoch em ms -> ISO no formato do Jira em UTC (ex: 2026-01-15T13:45:00.000+0000)."""
+        dt = datetime.fromtimestamp(epoch_ms / 1000, tz=timezone.utc)
+        return dt.strftime("%Y-%m-%dT%H:%M:%S.") + f"{dt.microsecond // 1000:03d}+0000"
+    
     def _adf_to_text(self, adf: dict) -> str:
         """Converte Atlassian Document Format para texto plano."""
         if not isinstance(adf, dict):
@@ -285,25 +341,12 @@ class JiraService(IssueTrackerBase):
         credentials: Optional[dict] = None,
     ) -> dict:
         """Cria uma subtask no Jira."""
-        project_key = self.extract_project_key(parent_key)
         base_url = self._get_base_url(credentials)
-
-        # Converter descrição para Atlassian Document Format
-        adf_description = self._text_to_adf(description)
-
-        payload = {
-            "fields": {
-                "project": {"key": project_key},
-                "parent": {"key": parent_key},
-                "issuetype": {"id": self.subtask_type_id},
-                "summary": summary,
-                "description": adf_description
-            }
-        }
+        payload = self._build_subtask_payload(parent_key, summary, description)
 
         url = f"{base_url}/rest/api/3/issue"
 
-        response = requests.post(
+        response = self._get_client(credentials).session.post(
             url,
             headers=self._get_headers(credentials),
             json=payload,
@@ -323,14 +366,34 @@ class JiraService(IssueTrackerBase):
 
         response.raise_for_status()
 
-        data = response.json()
+        return self._created_issue_result(response.json(), base_url)
+    
+    def _build_subtask_payload(self, parent_key: str, summary: str, description: str) -> dict:
+        """Monta o payload de criação de subtask."""
+        project_key = self.extract_project_key(parent_key)
+
+        # Converter descrição para Atlassian Document Format
+        adf_description = self._text_to_adf(description)
+
+        return {
+            "fields": {
+                "project": {"key": project_key},
+                "parent": {"key": parent_key},
+                "issuetype": {"id": self.subtask_type_id},
+                "summary": summary,
+                "description": adf_description
+            }
+        }
+
+    def _created_issue_result(self, data: dict, base_url: str) -> dict:
+        """Dict retornado após criar uma issue (key, id, self, url)."""
         return {
             "key": data["key"],
             "id": data["id"],
             "self": data["self"],
             "url": f"{base_url}/browse/{data['key']}"
         }
-    
+
     def create_bug(
         self,
         project_key: str,
@@ -364,43 +427,18 @@ class JiraService(IssueTrackerBase):
             # Isso garante compatibilidade, pois Sub-Bug geralmente usa o mesmo tipo do parent
             try:
                 parent_issue = self.get_issue(parent_key, ["issuetype"], credentials=credentials)
-                parent_issuetype = parent_issue["fields"].get("issuetype")
-                # _parse_fields mantém o objeto completo (id, name); usar o mesmo tipo do parent
-                if isinstance(parent_issuetype, dict):
-                    issuetype_id = parent_issuetype.get("id")
-                else:
-                    issuetype_id = None
-                if not issuetype_id:
-                    issuetype_id = self.sub_bug_type_id
+                issuetype_id = self._issuetype_id_from_parent(parent_issue)
             except Exception:
                 # Se falhar ao buscar parent, usar ID configurado
                 issuetype_id = self.sub_bug_type_id
         else:
             issuetype_id = self.bug_type_id
 
-        # Converter descrição para ADF se for string
-        if isinstance(description, str):
-            adf_description = self._text_to_adf(description)
-        else:
-            adf_description = description
-
-        # Montar payload mínimo (sem campos opcionais)
-        payload = {
-            "fields": {
-                "project": {"key": project_key},
-                "issuetype": {"id": issuetype_id},
-                "summary": summary,
-                "description": adf_description
-            }
-        }
-
-        # Adicionar parent se for Sub-Bug
-        if issue_type == "sub_bug" and parent_key:
-            payload["fields"]["parent"] = {"key": parent_key}
+        payload = self._build_bug_payload(project_key, summary, description, issuetype_id, issue_type, parent_key)
 
         url = f"{base_url}/rest/api/3/issue"
 
-        response = requests.post(
+        response = self._get_client(credentials).session.post(
             url,
             headers=self._get_headers(credentials),
             json=payload,
@@ -420,14 +458,49 @@ class JiraService(IssueTrackerBase):
         
         response.raise_for_status()
         
-        data = response.json()
-        return {
-            "key": data["key"],
-            "id": data["id"],
-            "self": data["self"],
-            "url": f"{base_url}/browse/{data['key']}"
+        return self._created_issue_result(response.json(), base_url)
+
+    def _issuetype_id_from_parent(self, parent_issue: dict) -> str:
+        """Issue Type ID do Sub-Bug a partir do parent (fallback: ID configurado)."""
+        parent_issuetype = parent_issue["fields"].get("issuetype")
+        # _parse_fields mantém o objeto completo (id, name); usar o mesmo tipo do parent
+        if isinstance(parent_issuetype, dict):
+            issuetype_id = parent_issuetype.get("id")
+        else:
+            issuetype_id = None
+        return issuetype_id or self.sub_bug_type_id
+
+    def _build_bug_payload(
+        self,
+        project_key: str,
+        summary: str,
+        description,
+        issuetype_id: str,
+        issue_type: str,
+        parent_key: Optional[str],
+    ) -> dict:
+        """Monta o payload mínimo de criação de Bug/Sub-Bug."""
+        # Converter descrição para ADF se for string
+        if isinstance(description, str):
+            adf_description = self._text_to_adf(description)
+        else:
+            adf_description = description
+
+        # Montar payload mínimo (sem campos opcionais)
+        payload = {
+            "fields": {
+                "project": {"key": project_key},
+                "issuetype": {"id": issuetype_id},
+                "summary": summary,
+                "description": adf_description
+            }
         }
 
+        # Adicionar parent se for Sub-Bug
+        if issue_type == "sub_bug" and parent_key:
+            payload["fields"]["parent"] = {"key": parent_key}
+        return payload
+
     def upload_attachments(
         self,
         issue_key: str,
@@ -468,7 +541,7 @@ class JiraService(IssueTrackerBase):
                 ("file", (filename, content, content_type))
             )
         
-        response = requests.post(
+        response = self._get_client(credentials).session.post(
             url,
             headers=headers,
             files=files_data,
@@ -527,7 +600,7 @@ class JiraService(IssueTrackerBase):
             "maxResults": max_results
         }
         url = f"{base_url}/rest/api/3/search/jql"
-        response = requests.post(
+        response = self._get_client(credentials).session.post(
             url,
             headers=self._get_headers(credentials),
             json=payload,
@@ -599,7 +672,7 @@ class JiraService(IssueTrackerBase):
             if next_page_token:
                 payload["nextPageToken"] = next_page_token
 
-            response = requests.post(
+            response = self._get_client(credentials).session.post(
                 url,
                 headers=self._get_headers(credentials),
                 json=payload,
@@ -626,6 +699,7 @@ class JiraService(IssueTrackerBase):
                 raw_fields = issue.get("fields", {})
                 parsed = self._parse_dashboard_issue_fields(raw_fields, fields)
                 parsed["key"] = issue.get("key")
+                parsed["id"] = issue.get("id")
                 all_issues.append(parsed)
 
             if is_last or not next_page_token or not issues:
@@ -633,6 +707,79 @@ class JiraService(IssueTrackerBase):
 
         return all_issues
 
+    def get_changelogs_bulk(
+        self,
+        issue_ids_or_keys: list[str],
+        field_ids: Optional[list[str]] = None,
+        credentials: Optional[dict] = None,
+    ) -> dict[str, list]:
+        """
+        Busca changelogs de várias issues via POST /rest/api/3/changelog/bulkfetch,
+        em lotes de até CHANGELOG_BULK_MAX_ISSUES, seguindo nextPageToken até o fim
+        (sem o truncamento da primeira página do expand=changelog).
+        
+        Args:
+            issue_ids_or_keys: IDs ou chaves das issues
+            field_ids: Filtra no servidor os campos do histórico (default: ["status"])
+            credentials: Dict opcional com {base_url, email, api_token} para autenticação dinâmica
+        
+        Returns:
+            Dict issueId -> lista de históricos no formato de _parse_changelog
+            (o Jira identifica cada issue pelo ID numérico na resposta).
+        """
+        if field_ids is None:
+            field_ids = ["status"]
+        base_url = self._get_base_url(credentials)
+        url = f"{base_url}/rest/api/3/changelog/bulkfetch"
+        result: dict[str, list] = {}
+
+        for start in range(0, len(issue_ids_or_keys), CHANGELOG_BULK_MAX_ISSUES):
+            batch = issue_ids_or_keys[start:start + CHANGELOG_BULK_MAX_ISSUES]
+            next_page_token: Optional[str] = None
+            while True:
+                payload = self._build_changelog_bulk_payload(batch, field_ids, next_page_token)
+                response = self._get_client(credentials).session.post(
+                    url,
+                    headers=self._get_headers(credentials),
+                    json=payload,
+                    timeout=self.timeout
+                )
+                if response.status_code == 401:
+                    raise PermissionError("Token de API do Jira inválido ou expirado.")
+                if response.status_code == 403:
+                    raise PermissionError("Sem permissão para acessar o histórico das issues.")
+                response.raise_for_status()
+
+                next_page_token = self._merge_changelog_bulk_page(response.json(), result)
+                if not next_page_token:
+                    break
+
+        return result
+
+    def _build_changelog_bulk_payload(
+        self, batch: list[str], field_ids: list[str], next_page_token: Optional[str]
+    ) -> dict:
+        """Payload do bulk changelog para um lote de issues."""
+        payload = {
+            "issueIdsOrKeys": batch,
+            "fieldIds": field_ids,
+            "maxResults": CHANGELOG_BULK_MAX_ISSUES,
+        }
+        if next_page_token:
+            payload["nextPageToken"] = next_page_token
+        return payload
+
+    def _merge_changelog_bulk_page(self, data: dict, result: dict[str, list]) -> Optional[str]:
+        """
+        Acrescenta os históricos de uma página do bulk changelog em result (issueId -> históricos).
+        Retorna o nextPageToken (None na última página).
+        """
+        for entry in data.get("issueChangeLogs", []):
+            issue_id = str(entry.get("issueId", ""))
+            histories = self._parse_changelog({"histories": entry.get("changeHistories", [])})
+            result.setdefault(issue_id, []).extend(histories)
+        return data.get("nextPageToken")
+
     def _parse_dashboard_issue_fields(self, fields: dict, requested: list[str]) -> dict:
         """Extrai apenas os campos solicitados para agregação do dashboard."""
         parsed = {}
@@ -644,6 +791,22 @@ class JiraService(IssueTrackerBase):
             parsed["status"] = st.get("name", "") if isinstance(st, dict) else str(st)
         if "created" in requested and "created" in fields:
             parsed["created"] = fields["created"] or ""
+        if "summary" in requested and "summary" in fields:
+            parsed["summary"] = fields["summary"] or ""
+        if "updated" in requested and "updated" in fields:
+            parsed["updated"] = fields["updated"] or ""
+        if "components" in requested and "components" in fields:
+            parsed["components"] = [
+                c.get("name", "") if isinstance(c, dict) else str(c) for c in fields["components"] or []
+            ]
+        if "labels" in requested and "labels" in fields:
+            parsed["labels"] = [str(label) for label in fields["labels"] or []]
+        if "priority" in requested and "priority" in fields:
+            priority = fields["priority"]
+            parsed["priority"] = (priority.get("name", "") if isinstance(priority, dict) else str(priority or "")) or ""
+        if "assignee" in requested and "assignee" in fields:
+            assignee = fields["assignee"]
+            parsed["assignee"] = (assignee.get("displayName", "") if isinstance(assignee, dict) else str(assignee or "")) or ""
         return parsed
     
     def _parse_subtask_fields(self, fields: dict) -> dict:
@@ -718,7 +881,7 @@ class JiraService(IssueTrackerBase):
         url = f"{base_url}/rest/api/3/myself"
         
         try:
-            response = requests.get(
+            response = self._get_client(credentials).session.get(
                 url,
                 headers=self._get_headers(credentials),
                 timeout=self.timeout
@@ -760,11 +923,15 @@ class JiraService(IssueTrackerBase):
         Busca todos os projetos disponíveis para o usuário (paginação).
         Retorna lista com id, key, name. Filtra arquivados se o campo existir.
         Ordenação alfabética por name é feita no retorno.
+        Resultado em cache por tenant (jira_metadata_cache, kind "projects").
         
         Args:
             max_results_per_page: Máximo de resultados por página
             credentials: Dict opcional com {base_url, email, api_token} para autenticação dinâmica
         """
+        hit, cached, cache_key = self._metadata_cache_get("projects", credentials)
+        if hit:
+            return cached
         base_url = self._get_base_url(credentials)
         url = f"{base_url}/rest/api/3/project/search"
         all_projects = []
@@ -772,7 +939,7 @@ class JiraService(IssueTrackerBase):
 
         while True:
             params = {"startAt": start_at, "maxResults": max_results_per_page}
-            response = requests.get(
+            response = self._get_client(credentials).session.get(
                 url,
                 headers=self._get_headers(credentials),
                 params=params,
@@ -789,15 +956,7 @@ class JiraService(IssueTrackerBase):
             values = data.get("values", [])
             total = data.get("total", 0)
 
-            for p in values:
-                # Filtrar arquivados se o campo existir na resposta
-                if p.get("archived") is True:
-                    continue
-                all_projects.append({
-                    "id": str(p.get("id", "")),
-                    "key": p.get("key", ""),
-                    "name": p.get("name", "")
-                })
+            all_projects.extend(self._parse_projects_page(values))
 
             if start_at + len(values) >= total:
                 break
@@ -807,21 +966,40 @@ class JiraService(IssueTrackerBase):
 
         # Ordenação alfabética por name
         all_projects.sort(key=lambda x: (x.get("name") or "").lower())
+        self._metadata_cache_set(cache_key, "projects", all_projects)
         return all_projects
 
+    def _parse_projects_page(self, values: list[dict]) -> list[dict]:
+        """Extrai id, key, name de uma página de projetos, ignorando arquivados."""
+        projects = []
+        for p in values:
+            # Filtrar arquivados se o campo existir na resposta
+            if p.get("archived") is True:
+                continue
+            projects.append({
+                "id": str(p.get("id", "")),
+                "key": p.get("key", ""),
+                "name": p.get("name", "")
+            })
+        return projects
+
     def get_project(self, project_key: str, credentials: Optional[dict] = None) -> dict:
         """
         Retorna dados básicos do projeto (key, name) por chave.
         Se o projeto não existir ou não tiver permissão, retorna { key: project_key, name: "" }.
+        Respostas válidas ficam em cache por tenant (kind "project").
         
         Args:
             project_key: Chave do projeto
             credentials: Dict opcional com {base_url, email, api_token} para autenticação dinâmica
         """
+        hit, cached, cache_key = self._metadata_cache_get("project", credentials, project_key)
+        if hit:
+            return cached
         base_url = self._get_base_url(credentials)
         url = f"{base_url}/rest/api/3/project/{project_key}"
         try:
-            response = requests.get(
+            response = self._get_client(credentials).session.get(
                 url,
                 headers=self._get_headers(credentials),
                 timeout=self.timeout
@@ -830,7 +1008,10 @@ class JiraService(IssueTrackerBase):
                 return {"key": project_key, "name": ""}
             response.raise_for_status()
             data = response.json()
-            return {"key": data.get("key", project_key), "name": data.get("name", "")}
+            project = {"key": data.get("key", project_key), "name": data.get("name", "")}
+            # Apenas respostas válidas entram no cache (fallbacks de erro não)
+            self._metadata_cache_set(cache_key, "project", project)
+            return project
         except Exception:
             return {"key": project_key, "name": ""}
 
@@ -839,59 +1020,80 @@ class JiraService(IssueTrackerBase):
         base = self._get_base_url(credentials)
         return f"{base}/rest/agile/1.0{path}"
 
+    def _agile_get_all(
+        self,
+        url: str,
+        params: dict,
+        max_results: int,
+        forbidden_message: str,
+        credentials: Optional[dict] = None,
+    ) -> list[dict]:
+        """
+        Lê todas as páginas (startAt/isLast) de um endpoint da Jira Agile API e retorna os "values".
+        Raises PermissionError em 401/403.
+        """
+        values: list[dict] = []
+        start_at = 0
+        while True:
+            response = self._get_client(credentials).session.get(
+                url,
+                headers=self._get_headers(credentials),
+                params={**params, "startAt": start_at, "maxResults": max_results},
+                timeout=self.timeout
+            )
+            if response.status_code == 401:
+                raise PermissionError("Token de API do Jira inválido ou expirado.")
+            if response.status_code == 403:
+                raise PermissionError(forbidden_message)
+            response.raise_for_status()
+            data = response.json()
+            page = data.get("values", [])
+            values.extend(page)
+            if data.get("isLast", True) or not page:
+                return values
+            start_at += len(page)
+
     def agile_get_boards(self, project_key_or_id: str, max_results: int = 50, credentials: Optional[dict] = None) -> list[dict]:
         """
-        Lista boards do projeto (Jira Agile API).
+        Lista todos os boards do projeto (Jira Agile API, paginação completa).
         Returns list of boards com id, name, type.
+        Resultado em cache por tenant (kind "boards").
         
         Args:
             project_key_or_id: Chave ou ID do projeto
-            max_results: Máximo de resultados
+            max_results: Tamanho de cada página
             credentials: Dict opcional com {base_url, email, api_token} para autenticação dinâmica
         """
+        hit, cached, cache_key = self._metadata_cache_get("boards", credentials, project_key_or_id, max_results)
+        if hit:
+            return cached
         url = self._agile_url("/board", credentials)
-        params = {"projectKeyOrId": project_key_or_id, "maxResults": max_results}
-        response = requests.get(
-            url,
-            headers=self._get_headers(credentials),
-            params=params,
-            timeout=self.timeout
-        )
-        if response.status_code == 401:
-            raise PermissionError("Token de API do Jira inválido ou expirado.")
-        if response.status_code == 403:
-            raise PermissionError("Sem permissão para acessar boards do projeto.")
-        response.raise_for_status()
-        data = response.json()
-        return data.get("values", [])
+        params = {"projectKeyOrId": project_key_or_id}
+        boards = self._agile_get_all(url, params, max_results, "Sem permissão para acessar boards do projeto.", credentials)
+        self._metadata_cache_set(cache_key, "boards", boards)
+        return boards
 
     def agile_get_sprints_by_state(self, board_id: int, state: str = "active", max_results: int = 50, credentials: Optional[dict] = None) -> list[dict]:
         """
-        Lista sprints do board por estado (Jira Agile API).
-        state: 'active', 'closed', 'future'
+        Lista todas as sprints do board por estado (Jira Agile API, paginação completa).
+        state: 'active', 'closed', 'future' (ou vários, separados por vírgula)
         Returns list of sprints com id, name, state, startDate, endDate, etc.
+        Resultado em cache por tenant (kind "sprints").
         
         Args:
             board_id: ID do board
             state: Estado das sprints ('active', 'closed', 'future')
-            max_results: Máximo de resultados
+            max_results: Tamanho de cada página
             credentials: Dict opcional com {base_url, email, api_token} para autenticação dinâmica
         """
+        hit, cached, cache_key = self._metadata_cache_get("sprints", credentials, board_id, state, max_results)
+        if hit:
+            return cached
         url = self._agile_url(f"/board/{board_id}/sprint", credentials)
-        params = {"state": state, "maxResults": max_results}
-        response = requests.get(
-            url,
-            headers=self._get_headers(credentials),
-            params=params,
-            timeout=self.timeout
-        )
-        if response.status_code == 401:
-            raise PermissionError("Token de API do Jira inválido ou expirado.")
-        if response.status_code == 403:
-            raise PermissionError("Sem permissão para acessar sprints do board.")
-        response.raise_for_status()
-        data = response.json()
-        return data.get("values", [])
+        params = {"state": state}
+        sprints = self._agile_get_all(url, params, max_results, "Sem permissão para acessar sprints do board.", credentials)
+        self._metadata_cache_set(cache_key, "sprints", sprints)
+        return sprints
 
     def agile_get_active_sprints(self, board_id: int, max_results: int = 50, credentials: Optional[dict] = None) -> list[dict]:
         """
@@ -900,11 +1102,26 @@ class JiraService(IssueTrackerBase):
         
         Args:
             board_id: ID do board
-            max_results: Máximo de resultados
+            max_results: Tamanho de cada página
             credentials: Dict opcional com {base_url, email, api_token} para autenticação dinâmica
         """
         return self.agile_get_sprints_by_state(board_id, state="active", max_results=max_results, credentials=credentials)
 
+    def _downstream_scrum_boards(self, boards: list[dict]) -> list[dict]:
+        """Filtra boards scrum cujo nome contém "downstream"."""
+        return [
+            b for b in boards
+            if (b.get("type") or "").lower() == "scrum"
+            and "downstream" in (b.get("name") or "").lower()
+        ]
+
+    def _select_sprint(self, sprints: list[dict], by: str) -> Optional[dict]:
+        """
+        Seleciona a sprint com maior data (YYYY-MM-DD) no campo `by` ("startDate" ou "endDate").
+        Retorna sprint_info {id, name, startDate, endDate, state} ou None.
+        """
+        return select_sprint(sprints, by)
+
     def get_sprint_current_dates(self, project_key: str, credentials: Optional[dict] = None) -> tuple[str, str, dict]:
         """
         Obtém start_date e end_date da sprint ativa do projeto (board scrum "Downstream").
@@ -916,39 +1133,18 @@ class JiraService(IssueTrackerBase):
             credentials: Dict opcional com {base_url, email, api_token} para autenticação dinâmica
         """
         boards = self.agile_get_boards(project_key, credentials=credentials)
-        scrum_downstream = [
-            b for b in boards
-            if (b.get("type") or "").lower() == "scrum"
-            and "downstream" in (b.get("name") or "").lower()
-        ]
+        scrum_downstream = self._downstream_scrum_boards(boards)
         if not scrum_downstream:
             raise ValueError("Sprint atual indisponível para o projeto informado.")
 
-        best_sprint = None
-        best_start = None
-
+        sprints: list[dict] = []
         for board in scrum_downstream:
             board_id = board.get("id")
             if board_id is None:
                 continue
-            sprints = self.agile_get_active_sprints(board_id, credentials=credentials)
-            for sp in sprints:
-                start_str = sp.get("startDate") or ""
-                if not start_str:
-                    continue
-                start_date_only = start_str[:10]
-                if best_start is None or start_date_only > best_start:
-                    best_start = start_date_only
-                    end_str = sp.get("endDate") or ""
-                    end_date_only = end_str[:10] if len(end_str) >= 10 else end_str
-                    best_sprint = {
-                        "id": sp.get("id"),
-                        "name": sp.get("name"),
-                        "startDate": start_date_only,
-                        "endDate": end_date_only,
-                        "state": sp.get("state"),
-                    }
-        if best_sprint is None or best_start is None:
+            sprints.extend(self.agile_get_active_sprints(board_id, credentials=credentials))
+        best_sprint = self._select_sprint(sprints, by="startDate")
+        if best_sprint is None:
             raise ValueError("Sprint atual indisponível para o projeto informado.")
         return (
             best_sprint["startDate"],
@@ -967,41 +1163,20 @@ class JiraService(IssueTrackerBase):
             credentials: Dict opcional com {base_url, email, api_token} para autenticação dinâmica
         """
         boards = self.agile_get_boards(project_key, credentials=credentials)
-        scrum_downstream = [
-            b for b in boards
-            if (b.get("type") or "").lower() == "scrum"
-            and "downstream" in (b.get("name") or "").lower()
-        ]
+        scrum_downstream = self._downstream_scrum_boards(boards)
         if not scrum_downstream:
             raise ValueError("Sprint passada indisponível para o projeto informado.")
 
-        best_sprint = None
-        best_end = None
-
+        sprints: list[dict] = []
         for board in scrum_downstream:
             board_id = board.get("id")
             if board_id is None:
                 continue
-            # Buscar sprints fechadas
-            sprints = self.agile_get_sprints_by_state(board_id, state="closed", max_results=20, credentials=credentials)
-            for sp in sprints:
-                end_str = sp.get("endDate") or ""
-                if not end_str:
-                    continue
-                end_date_only = end_str[:10]
-                # Pegar a sprint fechada mais recente (maior endDate)
-                if best_end is None or end_date_only > best_end:
-                    best_end = end_date_only
-                    start_str = sp.get("startDate") or ""
-                    start_date_only = start_str[:10] if len(start_str) >= 10 else start_str
-                    best_sprint = {
-                        "id": sp.get("id"),
-                        "name": sp.get("name"),
-                        "startDate": start_date_only,
-                        "endDate": end_date_only,
-                        "state": sp.get("state"),
-                    }
-        if best_sprint is None or best_end is None:
+            # Buscar sprints fechadas (todas as páginas: a mais recente fica no fim da lista)
+            sprints.extend(self.agile_get_sprints_by_state(board_id, state="closed", credentials=credentials))
+        # Pegar a sprint fechada mais recente (maior endDate)
+        best_sprint = self._select_sprint(sprints, by="endDate")
+        if best_sprint is None:
             raise ValueError("Sprint passada indisponível para o projeto informado.")
         return (
             best_sprint["startDate"],
@@ -0,0 +1,294 @@
+# backend/services/sprint_index.py
+
+"""
+Índice persistente de sprints por projeto (boards scrum "Downstream").
+Guarda todas as sprints de todos os boards (paginação completa), em memória e em disco
+(JSON em SPRINT_INDEX_DIR), e atualiza incrementalmente. Resolve sprint atual, sprint
+anterior e últimas N sprints sem chamadas ao Jira enquanto o índice estiver fresco.
+"""
+
+import asyncio
+import hashlib
+import json
+import logging
+import os
+import threading
+import time
+from typing import Optional
+
+from backend.utils.single_flight import SingleFlight
+
+logger = logging.getLogger(__name__)
+
+SPRINT_INDEX_DIR_DEFAULT = "config/cache/sprint_index"
+# Segundos até uma atualização incremental / completa do índice
+SPRINT_INDEX_TTL_DEFAULT = 300
+SPRINT_INDEX_FULL_REFRESH_DEFAULT = 86400
+# Estados de sprint que ainda mudam; sprints fechadas não são relidas na atualização incremental
+SPRINT_OPEN_STATES = ("active", "future")
+
+
+def select_sprint(sprints: list[dict], by: str) -> Optional[dict]:
+    """
+    Seleciona a sprint com maior data (YYYY-MM-DD) no campo `by` ("startDate" ou "endDate").
+    Retorna sprint_info {id, name, startDate, endDate, state} ou None.
+    """
+    best_sprint = None
+    best_value = None
+    for sp in sprints:
+        value = sp.get(by) or ""
+        if not value:
+            continue
+        value_date_only = value[:10]
+        if best_value is None or value_date_only > best_value:
+            best_value = value_date_only
+            best_sprint = sprint_info(sp)
+    return best_sprint
+
+
+def sprint_info(sp: dict) -> dict:
+    """Resumo da sprint com datas YYYY-MM-DD (formato usado em period.sprint)."""
+    start_str = sp.get("startDate") or ""
+    end_str = sp.get("endDate") or ""
+    return {
+        "id": sp.get("id"),
+        "name": sp.get("name"),
+        "startDate": start_str[:10] if len(start_str) >= 10 else start_str,
+        "endDate": end_str[:10] if len(end_str) >= 10 else end_str,
+        "state": sp.get("state"),
+    }
+
+
+class SprintIndex:
+    """Sprints de um projeto agrupadas por board (board_id -> {sprint_id -> sprint})."""
+
+    def __init__(
+        self,
+        project_key: str,
+        boards: Optional[list[dict]] = None,
+        sprints_by_board: Optional[dict[str, dict[str, dict]]] = None,
+        refreshed_at: float = 0.0,
+        full_refreshed_at: float = 0.0,
+    ):
+        self.project_key = project_key
+        self.boards = boards or []
+        self.sprints_by_board = sprints_by_board or {}
+        self.refreshed_at = refreshed_at
+        self.full_refreshed_at = full_refreshed_at
+
+    def all_sprints(self) -> list[dict]:
+        """Todas as sprints (sem duplicatas entre boards), na ordem dos boards."""
+        seen = set()
+        result = []
+        for board in self.boards:
+            for sprint_id, sp in self.sprints_by_board.get(str(board.get("id")), {}).items():
+                if sprint_id in seen:
+                    continue
+                seen.add(sprint_id)
+                result.append(sp)
+        return result
+
+    def current(self) -> Optional[dict]:
+        """Sprint ativa mais recente (maior startDate)."""
+        return select_sprint([sp for sp in self.all_sprints() if sp.get("state") == "active"], by="startDate")
+
+    def previous(self) -> Optional[dict]:
+        """Última sprint fechada (maior endDate)."""
+        return select_sprint([sp for sp in self.all_sprints() if sp.get("state") == "closed"], by="endDate")
+
+    def last_closed(self, n: int) -> list[dict]:
+        """Últimas n sprints fechadas, da mais recente para a mais antiga (por endDate)."""
+        closed = [sp for sp in self.all_sprints() if sp.get("state") == "closed" and sp.get("endDate")]
+        closed.sort(key=lambda sp: (sp.get("endDate") or "")[:10], reverse=True)
+        return [sprint_info(sp) for sp in closed[:max(0, n)]]
+
+    def to_dict(self) -> dict:
+        return {
+            "projectKey": self.project_key,
+            "boards": self.boards,
+            "sprintsByBoard": self.sprints_by_board,
+            "refreshedAt": self.refreshed_at,
+            "fullRefreshedAt": self.full_refreshed_at,
+        }
+
+    @classmethod
+    def from_dict(cls, data: dict) -> "SprintIndex":
+        return cls(
+            project_key=data.get("projectKey", ""),
+            boards=data.get("boards") or [],
+            sprints_by_board=data.get("sprintsByBoard") or {},
+            refreshed_at=float(data.get("refreshedAt") or 0),
+            full_refreshed_at=float(data.get("fullRefreshedAt") or 0),
+        )
+
+
+class SprintIndexStore:
+    """
+    Guarda SprintIndex por (tenant, projeto) em memória e em disco.
+    Atualização incremental: relê, por board, as sprints abertas (active/future) e, por id, as que
+    estavam abertas e saíram dessa lista (fechadas ou removidas); as fechadas conhecidas são mantidas.
+    Completa a cada SPRINT_INDEX_FULL_REFRESH segundos.
+    Atualizações simultâneas do mesmo projeto são coalescidas (single-flight), a leitura/gravação
+    em disco roda fora do event loop e, se a atualização falhar, o índice anterior continua em uso.
+    """
+
+    def __init__(self, directory: str, ttl_seconds: int, full_refresh_seconds: int):
+        self.directory = directory
+        self.ttl_seconds = ttl_seconds
+        self.full_refresh_seconds = full_refresh_seconds
+        self._indexes: dict[tuple, SprintIndex] = {}
+        self._lock = threading.Lock()
+        self._flights = SingleFlight()
+
+    @staticmethod
+    def _index_id(key: tuple) -> str:
+        """Nome do arquivo do índice (hash de tenant + projeto; o tenant já não contém o token em claro)."""
+        tenant, project_key = key
+        raw = json.dumps([list(tenant), project_key])
+        return hashlib.sha256(raw.encode()).hexdigest()[:32]
+
+    def _path(self, index_id: str) -> str:
+        return os.path.join(self.directory, f"{index_id}.json")
+
+    def _load(self, index_id: str) -> Optional[SprintIndex]:
+        path = self._path(index_id)
+        if not os.path.exists(path):
+            return None
+        try:
+            with open(path, "r", encoding="utf-8") as f:
+                return SprintIndex.from_dict(json.load(f))
+        except Exception as e:
+            logger.warning("[sprintIndex] falha ao ler %s: %s", path, e)
+            return None
+
+    def _save(self, index_id: str, index: SprintIndex) -> None:
+        try:
+            os.makedirs(self.directory, exist_ok=True)
+            path = self._path(index_id)
+            tmp_path = f"{path}.tmp"
+            with open(tmp_path, "w", encoding="utf-8") as f:
+                json.dump(index.to_dict(), f, ensure_ascii=False)
+            os.replace(tmp_path, path)
+        except Exception as e:
+            logger.warning("[sprintIndex] falha ao gravar índice: %s", e)
+
+    def invalidate(self, tenant: Optional[tuple] = None) -> int:
+        """
+        Força atualização completa na próxima consulta dos índices do tenant (todos se None).
+        Retorna quantos índices foram marcados.
+        """
+        with self._lock:
+            keys = [k for k in self._indexes if tenant is None or k[0] == tenant]
+            for k in keys:
+                self._indexes[k].refreshed_at = 0.0
+                self._indexes[k].full_refreshed_at = 0.0
+            return len(keys)
+
+    async def get(self, jira, project_key: str, credentials: Optional[dict] = None) -> SprintIndex:
+        """
+        Retorna o índice do projeto, atualizando-o se estiver vencido.
+        jira: AsyncJiraService (agile_get_boards, agile_get_all_sprints, agile_get_sprint).
+        """
+        key = (jira.tenant_key(credentials), project_key.strip().upper())
+        with self._lock:
+            index = self._indexes.get(key)
+        if index is not None and time.time() - index.refreshed_at < self.ttl_seconds:
+            return index
+        return await self._flights.do(key, lambda: self._load_and_refresh(jira, key, credentials))
+
+    async def _load_and_refresh(self, jira, key: tuple, credentials: Optional[dict]) -> SprintIndex:
+        """
+        Carrega o índice (memória ou disco) e o atualiza se vencido. Se a atualização falhar e
+        o índice anterior tiver boards, ele é mantido (exceto erro de permissão).
+        """
+        index_id = self._index_id(key)
+        with self._lock:
+            index = self._indexes.get(key)
+        if index is None:
+            index = await asyncio.to_thread(self._load, index_id) or SprintIndex(key[1])
+
+        now = time.time()
+        if now - index.refreshed_at >= self.ttl_seconds:
+            full = now - index.full_refreshed_at >= self.full_refresh_seconds
+            try:
+                refreshed = await self._refresh(jira, index, credentials, full=full)
+            except PermissionError:
+                raise
+            except Exception as e:
+                if not index.boards:
+                    raise
+                logger.warning("[sprintIndex] project=%s falha ao atualizar, usando índice anterior: %s", key[1], e)
+            else:
+                index = refreshed
+                await asyncio.to_thread(self._save, index_id, index)
+
+        with self._lock:
+            self._indexes[key] = index
+        return index
+
+    async def _refresh(self, jira, index: SprintIndex, credentials: Optional[dict], full: bool) -> SprintIndex:
+        """Relê boards e sprints (todos os boards em paralelo, paginação completa)."""
+        boards = await jira.agile_get_boards(index.project_key, credentials=credentials)
+        downstream = [
+            {"id": b.get("id"), "name": b.get("name"), "type": b.get("type")}
+            for b in jira._downstream_scrum_boards(boards)
+            if b.get("id") is not None
+        ]
+
+        async def refresh_board(board: dict) -> dict[str, dict]:
+            if full:
+                known: dict[str, dict] = {}
+                sprints = await jira.agile_get_all_sprints(board["id"], credentials=credentials)
+            else:
+                known = dict(index.sprints_by_board.get(str(board["id"]), {}))
+                sprints = await jira.agile_get_all_sprints(
+                    board["id"], state=",".join(SPRINT_OPEN_STATES), credentials=credentials
+                )
+                open_ids = {str(sp.get("id")) for sp in sprints}
+                left_open = [
+                    sid for sid, sp in known.items()
+                    if sp.get("state") in SPRINT_OPEN_STATES and sid not in open_ids
+                ]
+                changed = await asyncio.gather(*(jira.agile_get_sprint(sid, credentials=credentials) for sid in left_open))
+                for sid, sp in zip(left_open, changed):
+                    if sp is None:
+                        known.pop(sid, None)
+                    else:
+                        sprints.append(sp)
+            for sp in sprints:
+                known[str(sp.get("id"))] = {
+                    k: sp.get(k) for k in ("id", "name", "state", "startDate", "endDate", "completeDate")
+                }
+            return known
+
+        results = await asyncio.gather(*(refresh_board(b) for b in downstream))
+        now = time.time()
+        logger.info(
+            "[sprintIndex] project=%s boards=%s sprints=%s full=%s",
+            index.project_key, len(downstream), sum(len(r) for r in results), full,
+        )
+        return SprintIndex(
+            project_key=index.project_key,
+            boards=downstream,
+            sprints_by_board={str(b["id"]): r for b, r in zip(downstream, results)},
+            refreshed_at=now,
+            full_refreshed_at=now if full else index.full_refreshed_at,
+        )
+
+
+_store: Optional[SprintIndexStore] = None
+_store_lock = threading.Lock()
+
+
+def get_sprint_index_store() -> SprintIndexStore:
+    """Store global (SPRINT_INDEX_DIR, SPRINT_INDEX_TTL, SPRINT_INDEX_FULL_REFRESH)."""
+    global _store
+    if _store is None:
+        with _store_lock:
+            if _store is None:
+                _store = SprintIndexStore(
+                    directory=os.getenv("SPRINT_INDEX_DIR", SPRINT_INDEX_DIR_DEFAULT),
+                    ttl_seconds=int(os.getenv("SPRINT_INDEX_TTL", str(SPRINT_INDEX_TTL_DEFAULT))),
+                    full_refresh_seconds=int(os.getenv("SPRINT_INDEX_FULL_REFRESH", str(SPRINT_INDEX_FULL_REFRESH_DEFAULT))),
+                )
+    return _store
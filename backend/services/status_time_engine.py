@@ -0,0 +1,203 @@
+# backend/services/status_time_engine.py
+
+"""
+Motor de tempo em status: numa única passada pelo changelog de cada issue, gera intervalos
+compactos (issue, status, início, fim) codificados em inteiros. Deles saem, em lote (NumPy),
+o tempo em qualquer conjunto de status, as entradas em cada status (retrabalho/reabertura)
+e o cycle time entre conjuntos de status, sem reprocessar o changelog.
+"""
+
+from array import array
+from datetime import datetime
+from typing import List, Optional, Sequence, Union
+
+import numpy as np
+
+from backend.utils.date_range_utils import TIMEZONE
+from backend.utils.jira_dates import jira_to_epoch_ms
+
+# Fim de intervalo ainda aberto (issue continua no status): vale now_ms da timeline
+OPEN_END = -1
+# Issue sem transição de status / sem entrada no status
+NO_TIME = -1
+
+
+class StatusTimeline:
+    """
+    Intervalos de status de um lote de issues, em arrays compactos.
+    - Status são internados (nome -> código inteiro, na ordem em que aparecem).
+    - Cada issue adicionada recebe um índice (ordem de add_issue) e gera: intervalos
+      (primeiro a partir de created, com o status "from" da primeira transição; o último fica
+      aberto até now_ms) e entradas (transições "to").
+    - Issue sem created válido ou sem transições de status não gera intervalos (mesma regra do
+      cálculo anterior de Status Time).
+    """
+
+    def __init__(self, now_ms: Optional[int] = None):
+        self.now_ms = now_ms if now_ms is not None else int(datetime.now(TIMEZONE).timestamp() * 1000)
+        self.statuses: List[str] = []
+        self._codes: dict = {}
+        self.keys: List[str] = []
+        self._iv_issue = array("q")
+        self._iv_status = array("q")
+        self._iv_start = array("q")
+        self._iv_end = array("q")
+        self._entry_issue = array("q")
+        self._entry_status = array("q")
+        self._entry_at = array("q")
+
+    def __len__(self) -> int:
+        return len(self.keys)
+
+    def nbytes(self) -> int:
+        """Tamanho estimado em memória: arrays de intervalos/entradas, chaves e nomes de status."""
+        arrays = (
+            self._iv_issue, self._iv_status, self._iv_start, self._iv_end,
+            self._entry_issue, self._entry_status, self._entry_at,
+        )
+        return (
+            sum(len(a) * a.itemsize for a in arrays)
+            + sum(len(key) + 57 for key in self.keys)
+            + sum(len(name) + 113 for name in self.statuses)
+        )
+
+    def status_code(self, name: str) -> int:
+        """Código inteiro do status (interna se ainda não existir)."""
+        code = self._codes.get(name)
+        if code is None:
+            code = len(self.statuses)
+            self._codes[name] = code
+            self.statuses.append(name)
+        return code
+
+    def add_issue(self, key: str, created: Union[str, int, None], changelog: Optional[list]) -> int:
+        """
+        Processa o changelog (lista de { created, items }) de uma issue e retorna seu índice.
+        created pode ser a data do Jira (string) ou ms. Itens que não são de status são ignorados.
+        """
+        index = len(self.keys)
+        self.keys.append(key)
+        created_ms = created if isinstance(created, int) else jira_to_epoch_ms(created)
+
+        changes = []
+        if created_ms is not None:
+            for history in sorted(changelog or [], key=lambda h: h.get("created") or ""):
+                at_ms = jira_to_epoch_ms(history.get("created") or "")
+                if at_ms is None:
+                    continue
+                for item in history.get("items") or []:
+                    if (item.get("field") or "").strip().lower() != "status":
+                        continue
+                    changes.append((at_ms, (item.get("from") or "").strip(), (item.get("to") or "").strip()))
+            changes.sort(key=lambda change: change[0])
+
+        if not changes:
+            return index
+
+        current = self.status_code(changes[0][1])
+        interval_start = created_ms
+        for at_ms, _, to_status in changes:
+            self._iv_issue.append(index)
+            self._iv_status.append(current)
+            self._iv_start.append(interval_start)
+            self._iv_end.append(at_ms)
+            current = self.status_code(to_status)
+            interval_start = at_ms
+            self._entry_issue.append(index)
+            self._entry_status.append(current)
+            self._entry_at.append(at_ms)
+        self._iv_issue.append(index)
+        self._iv_status.append(current)
+        self._iv_start.append(interval_start)
+        self._iv_end.append(OPEN_END)
+        return index
+
+    def extend(self, other: "StatusTimeline") -> None:
+        """
+        Anexa as issues de outra timeline (ex.: processada por página), remapeando códigos de
+        status e índices. Intervalos abertos de other passam a usar o now_ms desta timeline.
+        """
+        offset = len(self.keys)
+        codes = array("q", (self.status_code(name) for name in other.statuses))
+        self.keys.extend(other.keys)
+        self._iv_issue.extend(array("q", (i + offset for i in other._iv_issue)))
+        self._iv_status.extend(array("q", (codes[c] for c in other._iv_status)))
+        self._iv_start.extend(other._iv_start)
+        self._iv_end.extend(other._iv_end)
+        self._entry_issue.extend(array("q", (i + offset for i in other._entry_issue)))
+        self._entry_status.extend(array("q", (codes[c] for c in other._entry_status)))
+        self._entry_at.extend(other._entry_at)
+
+    @staticmethod
+    def _np(values: array) -> np.ndarray:
+        # Cópia: uma view manteria o buffer exportado e impediria novos add_issue
+        return np.frombuffer(values, dtype=np.int64).copy() if len(values) else np.zeros(0, dtype=np.int64)
+
+    def _columns(self, statuses: Optional[Sequence[str]]) -> tuple[list, np.ndarray]:
+        """(nomes, mapa código de status -> coluna; -1 fora do conjunto)."""
+        names = list(self.statuses) if statuses is None else list(statuses)
+        column_of = np.full(len(self.statuses), -1, dtype=np.int64)
+        for column, name in enumerate(names):
+            code = self._codes.get(name)
+            if code is not None:
+                column_of[code] = column
+        return names, column_of
+
+    def _matrix(self, issues: np.ndarray, codes: np.ndarray, weights: Optional[np.ndarray], statuses) -> np.ndarray:
+        """Soma weights (ou conta) por (issue, coluna do status) via bincount."""
+        names, column_of = self._columns(statuses)
+        columns = column_of[codes] if len(codes) else codes
+        keep = columns >= 0
+        flat = issues[keep] * len(names) + columns[keep]
+        size = len(self.keys) * len(names)
+        counts = np.bincount(flat, weights=None if weights is None else weights[keep], minlength=size)
+        return counts.astype(np.int64).reshape(len(self.keys), len(names))
+
+    def durations_ms(self, statuses: Optional[Sequence[str]] = None) -> np.ndarray:
+        """
+        Matriz issues x status com o tempo (ms) em cada status; statuses None = todos, na ordem
+        de self.statuses. Status desconhecidos geram coluna zerada.
+        """
+        ends = self._np(self._iv_end)
+        ends = np.where(ends == OPEN_END, self.now_ms, ends)
+        # bincount soma pesos em float64: exato para durações em ms (bem abaixo de 2**53)
+        return self._matrix(
+            self._np(self._iv_issue), self._np(self._iv_status),
+            (ends - self._np(self._iv_start)).astype(np.float64), statuses,
+        )
+
+    def entries(self, statuses: Optional[Sequence[str]] = None) -> np.ndarray:
+        """Matriz issues x status com o número de transições para cada status."""
+        return self._matrix(self._np(self._entry_issue), self._np(self._entry_status), None, statuses)
+
+    def _entry_times(self, statuses: Sequence[str]) -> tuple[np.ndarray, np.ndarray]:
+        """(issues, instantes) das entradas em qualquer um dos statuses."""
+        _, column_of = self._columns(statuses)
+        codes = self._np(self._entry_status)
+        keep = column_of[codes] >= 0 if len(codes) else np.zeros(0, dtype=bool)
+        return self._np(self._entry_issue)[keep], self._np(self._entry_at)[keep]
+
+    def first_entry_ms(self, statuses: Sequence[str]) -> np.ndarray:
+        """Por issue, primeira entrada (ms) em qualquer um dos statuses; NO_TIME se nenhuma."""
+        issues, at = self._entry_times(statuses)
+        result = np.full(len(self.keys), np.iinfo(np.int64).max, dtype=np.int64)
+        np.minimum.at(result, issues, at)
+        result[result == np.iinfo(np.int64).max] = NO_TIME
+        return result
+
+    def last_entry_ms(self, statuses: Sequence[str]) -> np.ndarray:
+        """Por issue, última entrada (ms) em qualquer um dos statuses; NO_TIME se nenhuma."""
+        issues, at = self._entry_times(statuses)
+        result = np.full(len(self.keys), NO_TIME, dtype=np.int64)
+        np.maximum.at(result, issues, at)
+        return result
+
+    def cycle_time_ms(self, start_statuses: Sequence[str], end_statuses: Sequence[str]) -> np.ndarray:
+        """
+        Por issue, da primeira entrada em start_statuses até a última entrada em end_statuses;
+        NO_TIME se faltar um dos dois ou se o fim for anterior ao início.
+        """
+        start = self.first_entry_ms(start_statuses)
+        end = self.last_entry_ms(end_statuses)
+        valid = (start != NO_TIME) & (end != NO_TIME) & (end >= start)
+        return np.where(valid, end - start, NO_TIME)
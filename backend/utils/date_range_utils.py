@@ -13,6 +13,9 @@ from dateutil.relativedelta import relativedelta
 
 TIMEZONE = ZoneInfo("America/Sao_Paulo")
 
+# Limite padrão (meses) de período custom
+CUSTOM_RANGE_MONTHS_DEFAULT = 3
+
 
 def _today() -> date:
     """Data de hoje no timezone America/Sao_Paulo."""
@@ -22,7 +25,7 @@ def _today() -> date:
 def validate_custom_range(
     start_date: date,
     end_date: date,
-    limit_months: int = 3
+    limit_months: int = CUSTOM_RANGE_MONTHS_DEFAULT
 ) -> None:
     """
     Valida intervalo personalizado: start <= end, período máximo de limit_months meses (calendário)
@@ -58,6 +61,27 @@ def list_days(start_date: date, end_date: date) -> List[str]:
     return days
 
 
+def split_date_range(start_date: date, end_date: date, shards: int) -> List[Tuple[date, date, bool]]:
+    """
+    Divide [start_date, end_date] em até `shards` fatias contíguas de dias.
+    Retorna lista de (inicio, fim, fim_exclusivo): todas as fatias exceto a última têm fim
+    exclusivo (= início da próxima), e a última mantém end_date inclusivo, preservando
+    exatamente a semântica de `created >= start AND created <= end`.
+    No JQL, `created <= "YYYY-MM-DD"` vale até 00:00 desse dia: o intervalo cobre
+    (end_date - start_date) dias, e as fatias são limitadas a esse número para que nenhuma
+    fique vazia (uma fatia por dia, no máximo).
+    """
+    total_days = (end_date - start_date).days
+    shards = max(1, min(shards, total_days))
+    if shards == 1:
+        return [(start_date, end_date, False)]
+    starts = [start_date + relativedelta(days=i * total_days // shards) for i in range(shards)]
+    return [
+        (starts[i], starts[i + 1], True)
+        for i in range(shards - 1)
+    ] + [(starts[-1], end_date, False)]
+
+
 def resolve_month_current() -> Tuple[str, str, dict]:
     """
     Retorna (start_date, end_date, meta) para o mês atual.
@@ -105,15 +129,19 @@ def resolve_last_3_months() -> Tuple[str, str, dict]:
     )
 
 
-def resolve_custom(start_date_str: str, end_date_str: str) -> Tuple[str, str, dict]:
+def resolve_custom(
+    start_date_str: str,
+    end_date_str: str,
+    limit_months: int = CUSTOM_RANGE_MONTHS_DEFAULT
+) -> Tuple[str, str, dict]:
     """
     Valida e retorna (start_date, end_date, meta) para período custom.
-    Raises ValueError se exceder 3 meses ou start > end.
+    Raises ValueError se exceder limit_months meses ou start > end.
     Aceita datas no formato YYYY-MM-DD ou ISO com hora (usa apenas a parte da data).
     """
     start = date.fromisoformat(start_date_str.strip()[:10])
     end = date.fromisoformat(end_date_str.strip()[:10])
-    validate_custom_range(start, end, limit_months=3)
+    validate_custom_range(start, end, limit_months=limit_months)
     return (
         start.isoformat(),
         end.isoformat(),
@@ -147,20 +175,37 @@ def resolve_sprint_previous(
     return (start_str, end_str, meta)
 
 
+def previous_period_window(period_type: str, start_date: date, end_date: date) -> Tuple[date, date]:
+    """
+    Janela anterior comparável a [start_date, end_date] (comparação período a período).
+    - month_current: mesmo trecho do mês anterior (dia 1 até o mesmo dia, limitado ao fim do mês).
+    - month_previous: mesma regra um mês antes (dia 4 até o último dia do mês).
+    - last_3_months e custom: janela de mesma duração imediatamente anterior.
+    Sprints não passam por aqui: a sprint anterior vem do índice de sprints.
+    """
+    if period_type == "month_current":
+        return start_date - relativedelta(months=1), end_date - relativedelta(months=1)
+    if period_type == "month_previous":
+        return start_date - relativedelta(months=1), start_date.replace(day=1) - relativedelta(days=1)
+    previous_end = start_date - relativedelta(days=1)
+    return previous_end - (end_date - start_date), previous_end
+
+
 def resolve_period(
     period_type: str,
     custom_start: Optional[str] = None,
     custom_end: Optional[str] = None,
     project_key: Optional[str] = None,
     get_sprint_dates: Optional[Callable[[str], Tuple[str, str, Any]]] = None,
-    get_sprint_previous_dates: Optional[Callable[[str], Tuple[str, str, Any]]] = None
+    get_sprint_previous_dates: Optional[Callable[[str], Tuple[str, str, Any]]] = None,
+    custom_limit_months: int = CUSTOM_RANGE_MONTHS_DEFAULT
 ) -> Tuple[str, str, dict]:
     """
     Resolve período conforme type.
     - month_current: mês atual (dia 1 até hoje).
     - month_previous: mês anterior (dia 4 até último dia).
     - last_3_months: últimos 90 dias (90 dias atrás até hoje).
-    - custom: exige custom_start e custom_end; valida até 3 meses.
+    - custom: exige custom_start e custom_end; valida até custom_limit_months meses (padrão 3).
     - sprint_current: exige project_key e get_sprint_dates; sprint ativa.
     - sprint_previous: exige project_key e get_sprint_previous_dates; última sprint fechada.
 
@@ -179,7 +224,7 @@ def resolve_period(
     if period_type == "custom":
         if not custom_start or not custom_end:
             raise ValueError("startDate e endDate são obrigatórios para período custom.")
-        return resolve_custom(custom_start, custom_end)
+        return resolve_custom(custom_start, custom_end, limit_months=custom_limit_months)
     if period_type == "sprint_current":
         if not project_key or not get_sprint_dates:
             raise ValueError("projectKey e get_sprint_dates são necessários para sprint_current.")
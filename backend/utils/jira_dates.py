@@ -0,0 +1,244 @@
+# backend/utils/jira_dates.py
+
+"""
+Datas do Jira: parser rápido para o formato fixo YYYY-MM-DDTHH:MM:SS.mmm±HHMM
+(fallback para dateutil em qualquer outro formato) e conversão de instantes UTC em dias
+de America/Sao_Paulo por tabela de fronteiras de offset pré-calculada, sem astimezone por chamada.
+"""
+
+import threading
+from bisect import bisect_right
+from datetime import date, datetime, timedelta, timezone
+from typing import Optional
+
+import numpy as np
+from dateutil.parser import parse as dateutil_parse
+
+from backend.utils.date_range_utils import TIMEZONE
+
+_EPOCH = datetime(1970, 1, 1, tzinfo=timezone.utc)
+_EPOCH_DATE = date(1970, 1, 1)
+_MS_PER_MINUTE = 60_000
+_MS_PER_DAY = 86_400_000
+_US_PER_SECOND = 1_000_000
+
+# offset textual (ex.: "-0300") -> minutos
+_offset_minutes_cache: dict = {}
+
+
+def _fast_offset_minutes(value: str) -> Optional[int]:
+    """Offset em minutos se value estiver no formato fixo do Jira; None caso contrário."""
+    if len(value) != 28 or value[10] != "T" or value[19] != "." or value[23] not in "+-":
+        return None
+    suffix = value[23:]
+    offset = _offset_minutes_cache.get(suffix)
+    if offset is None:
+        if not suffix[1:].isdigit():
+            return None
+        offset = (int(suffix[1:3]) * 60 + int(suffix[3:5])) * (-1 if suffix[0] == "-" else 1)
+        _offset_minutes_cache[suffix] = offset
+    return offset
+
+
+def _fast_epoch_us(value: str) -> Optional[int]:
+    """Microssegundos desde a época (inteiro exato) para o formato fixo do Jira; None se não aplicável."""
+    offset = _fast_offset_minutes(value)
+    if offset is None:
+        return None
+    try:
+        local = datetime(
+            int(value[0:4]), int(value[5:7]), int(value[8:10]),
+            int(value[11:13]), int(value[14:16]), int(value[17:19]),
+            int(value[20:23]) * 1000, tzinfo=timezone.utc,
+        )
+    except ValueError:
+        return None
+    delta = local - _EPOCH
+    return (delta.days * 86400 + delta.seconds - offset * 60) * _US_PER_SECOND + delta.microseconds
+
+
+def parse_jira_datetime(value: Optional[str]) -> Optional[datetime]:
+    """
+    Converte a string de data do Jira em datetime com timezone.
+    Formato fixo do Jira pelo caminho rápido; demais formatos via dateutil.
+    Retorna None se vazio ou inválido. Datas sem timezone (só via dateutil) ficam naive.
+    """
+    if not value or not value.strip():
+        return None
+    value = value.strip()
+    epoch_us = _fast_epoch_us(value)
+    if epoch_us is not None:
+        offset = timezone(timedelta(minutes=_offset_minutes_cache[value[23:]]))
+        return (_EPOCH + timedelta(microseconds=epoch_us)).astimezone(offset)
+    try:
+        return dateutil_parse(value)
+    except Exception:
+        return None
+
+
+def jira_to_epoch_ms(value: Optional[str]) -> Optional[int]:
+    """
+    Timestamp em ms da data do Jira (mesmo resultado de int(dateutil_parse(v).timestamp() * 1000)).
+    Retorna None se vazio ou inválido.
+    """
+    if not value or not str(value).strip():
+        return None
+    value = str(value).strip()
+    epoch_us = _fast_epoch_us(value)
+    if epoch_us is not None:
+        # Mesma aritmética de datetime.timestamp(): segundos em float a partir dos microssegundos
+        return int(epoch_us / _US_PER_SECOND * 1000)
+    try:
+        return int(dateutil_parse(value).timestamp() * 1000)
+    except Exception:
+        return None
+
+
+class DayBucketer:
+    """
+    Converte instantes UTC (ms) em dias locais de um timezone.
+    As fronteiras de offset (ex.: horário de verão) são calculadas uma vez por faixa de anos
+    e consultadas por busca binária; a faixa coberta cresce sob demanda.
+    """
+
+    def __init__(self, tz=TIMEZONE):
+        self.tz = tz
+        self._lock = threading.Lock()
+        self._first_year: Optional[int] = None
+        self._last_year: Optional[int] = None
+        self._lo_ms = 0
+        self._hi_ms = 0
+        self._boundaries: list[int] = []
+        self._offsets: list[int] = []
+        self._boundaries_arr = np.zeros(0, dtype=np.int64)
+        self._offsets_arr = np.zeros(0, dtype=np.int64)
+        self._day_strings: dict = {}
+
+    def _offset_ms_at(self, utc_ms: int) -> int:
+        return int(datetime.fromtimestamp(utc_ms / 1000, self.tz).utcoffset().total_seconds() * 1000)
+
+    def _build(self, first_year: int, last_year: int) -> None:
+        """Calcula as fronteiras de offset de first_year a last_year (amostra diária + busca por hora)."""
+        lo_ms = int((datetime(first_year, 1, 1, tzinfo=timezone.utc) - _EPOCH).total_seconds() * 1000)
+        hi_ms = int((datetime(last_year + 1, 1, 1, tzinfo=timezone.utc) - _EPOCH).total_seconds() * 1000)
+        boundaries = [lo_ms]
+        offsets = [self._offset_ms_at(lo_ms)]
+        day_ms = lo_ms + _MS_PER_DAY
+        while day_ms <= hi_ms:
+            offset = self._offset_ms_at(day_ms)
+            if offset != offsets[-1]:
+                # Transição no dia anterior: localizar a hora (transições ocorrem em horas cheias UTC)
+                hour_ms = day_ms - _MS_PER_DAY
+                while self._offset_ms_at(hour_ms) == offsets[-1]:
+                    hour_ms += 3_600_000
+                boundaries.append(hour_ms)
+                offsets.append(offset)
+            day_ms += _MS_PER_DAY
+        self._first_year, self._last_year = first_year, last_year
+        self._lo_ms, self._hi_ms = lo_ms, hi_ms
+        self._boundaries, self._offsets = boundaries, offsets
+        self._boundaries_arr = np.asarray(boundaries, dtype=np.int64)
+        self._offsets_arr = np.asarray(offsets, dtype=np.int64)
+
+    def _ensure(self, min_ms: int, max_ms: int) -> None:
+        """Garante a tabela cobrindo [min_ms, max_ms] (anos inteiros)."""
+        if self._first_year is not None and self._lo_ms <= min_ms and max_ms < self._hi_ms:
+            return
+        with self._lock:
+            if self._first_year is not None and self._lo_ms <= min_ms and max_ms < self._hi_ms:
+                return
+            first = (_EPOCH + timedelta(milliseconds=min_ms)).year - 1
+            last = (_EPOCH + timedelta(milliseconds=max_ms)).year + 1
+            if self._first_year is not None:
+                first = min(first, self._first_year)
+                last = max(last, self._last_year)
+            self._build(first, last)
+
+    def day_number(self, utc_ms: int) -> int:
+        """Dia local (dias desde 1970-01-01) do instante utc_ms."""
+        self._ensure(utc_ms, utc_ms)
+        offset = self._offsets[bisect_right(self._boundaries, utc_ms) - 1]
+        return (utc_ms + offset) // _MS_PER_DAY
+
+    def day_numbers(self, utc_ms: np.ndarray) -> np.ndarray:
+        """Versão vetorizada de day_number para um array int64 de instantes."""
+        if len(utc_ms) == 0:
+            return np.zeros(0, dtype=np.int64)
+        self._ensure(int(utc_ms.min()), int(utc_ms.max()))
+        positions = np.searchsorted(self._boundaries_arr, utc_ms, side="right") - 1
+        return (utc_ms + self._offsets_arr[positions]) // _MS_PER_DAY
+
+    def day_string(self, day_number: int) -> str:
+        """YYYY-MM-DD do dia (dias desde 1970-01-01), com cache."""
+        day = self._day_strings.get(day_number)
+        if day is None:
+            day = (_EPOCH_DATE + timedelta(days=day_number)).isoformat()
+            self._day_strings[day_number] = day
+        return day
+
+
+_default_bucketer = DayBucketer()
+
+
+def get_day_bucketer() -> DayBucketer:
+    """Bucketer compartilhado de America/Sao_Paulo."""
+    return _default_bucketer
+
+
+def jira_day_br(value: Optional[str]) -> Optional[str]:
+    """
+    Data YYYY-MM-DD (America/Sao_Paulo) da data do Jira. Datas sem timezone são
+    consideradas já em America/Sao_Paulo. Retorna None se vazio ou inválido.
+    """
+    if not value or not value.strip():
+        return None
+    value = value.strip()
+    epoch_us = _fast_epoch_us(value)
+    if epoch_us is not None:
+        bucketer = _default_bucketer
+        return bucketer.day_string(bucketer.day_number(epoch_us // 1000))
+    try:
+        dt = dateutil_parse(value)
+        if dt.tzinfo is None:
+            dt = dt.replace(tzinfo=TIMEZONE)
+        else:
+            dt = dt.astimezone(TIMEZONE)
+        return dt.date().isoformat()
+    except Exception:
+        return None
+
+
+def jira_epoch_ms_array(values: list) -> tuple[np.ndarray, np.ndarray]:
+    """
+    Converte uma lista de datas do Jira em (ms UTC int64, máscara de válidos) de forma vetorizada.
+    Apenas o formato fixo do Jira é convertido aqui (minuto via datetime64); posições com
+    máscara False devem ser tratadas individualmente (jira_day_br / jira_to_epoch_ms).
+    Segundos e frações são descartados: suficientes para o dia, não para durações.
+    """
+    count = len(values)
+    valid = np.zeros(count, dtype=bool)
+    positions = []
+    local_minutes = []
+    offsets = []
+    for i, value in enumerate(values):
+        offset = _fast_offset_minutes(value) if value else None
+        if offset is not None:
+            positions.append(i)
+            local_minutes.append(value[:16])
+            offsets.append(offset)
+    result = np.zeros(count, dtype=np.int64)
+    if not positions:
+        return result, valid
+    try:
+        minutes = np.array(local_minutes, dtype="datetime64[m]").astype(np.int64)
+    except ValueError:
+        # Alguma data inválida: converte uma a uma
+        for i in positions:
+            epoch_us = _fast_epoch_us(values[i])
+            if epoch_us is not None:
+                result[i] = epoch_us // 1000
+                valid[i] = True
+        return result, valid
+    result[positions] = (minutes - np.asarray(offsets, dtype=np.int64)) * _MS_PER_MINUTE
+    valid[positions] = True
+    return result, valid
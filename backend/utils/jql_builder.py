@@ -35,21 +35,23 @@ ISSUE_TYPE_EXCLUDED = [
 ]
 
 
-def build_defects_base_jql(project_key: str, start_date: str, end_date: str) -> str:
+def build_defects_base_jql(project_key: str, start_date: str, end_date: str, end_exclusive: bool = False) -> str:
     """
     Retorna JQL base para buscar issues Bug e Sub-Bug criadas no período.
     Datas no formato YYYY-MM-DD. Não filtra por status (agregação no backend).
+    end_exclusive=True usa `created < end` (fatias contíguas da busca particionada por data).
     """
     # Garantir que project_key não tenha caracteres que quebrem JQL
     pk = str(project_key).strip().upper()
     # Escapar aspas em datas (já são seguras se YYYY-MM-DD)
     start = start_date.strip()[:10]
     end = end_date.strip()[:10]
+    end_op = "<" if end_exclusive else "<="
     return (
         f'project = {pk} '
         f'AND issuetype in (Bug, "Sub-Bug") '
         f'AND created >= "{start}" '
-        f'AND created <= "{end}" '
+        f'AND created {end_op} "{end}" '
         f'ORDER BY created ASC'
     )
 
@@ -0,0 +1,152 @@
+# backend/utils/quantile_sketch.py
+
+"""
+Sketch de quantis em streaming (estilo KLL), combinável: sketches de páginas, projetos ou
+sprints diferentes podem ser mesclados sem guardar todos os valores.
+Guarda também contagem, soma, mínimo e máximo exatos e, opcionalmente, um histograma exato
+em faixas fixas.
+"""
+
+import math
+from typing import Iterable, List, Optional, Sequence
+
+import numpy as np
+
+SKETCH_K_DEFAULT = 200
+# Razão de capacidade entre níveis consecutivos (KLL)
+_CAPACITY_RATIO = 2 / 3
+
+
+class QuantileSketch:
+    """
+    Sketch KLL com k fixo.
+    - Níveis (compactores): cada item no nível h representa 2**h valores. Quando o total de
+      itens guardados atinge a capacidade, um nível cheio é ordenado e compactado: metade dos
+      itens (paridade alternada por nível, determinística) sobe para o nível seguinte.
+    - O peso total é preservado, então quantis usam a contagem exata; o erro de rank é O(1/k).
+      Com menos de k valores nenhum item é descartado (quantis exatos).
+    - edges: limites crescentes do histograma (faixas [0, e1), [e1, e2), ..., [eN, +inf)).
+      Só sketches com os mesmos edges e k podem ser mesclados.
+    """
+
+    def __init__(self, k: int = SKETCH_K_DEFAULT, edges: Optional[Sequence[float]] = None):
+        if k < 8:
+            raise ValueError("k do sketch deve ser >= 8.")
+        self.k = k
+        self.edges = [float(e) for e in edges] if edges else []
+        self.buckets = [0] * (len(self.edges) + 1)
+        self.count = 0
+        self.sum = 0.0
+        self.min: Optional[float] = None
+        self.max: Optional[float] = None
+        self._levels: List[List[float]] = [[]]
+        # Bit h: paridade da próxima compactação do nível h
+        self._parity = 0
+        self._size = 0
+        self._max_size = self._capacity(0)
+
+    def __len__(self) -> int:
+        return self.count
+
+    def nbytes(self) -> int:
+        """Tamanho estimado em memória (itens guardados como float do Python e histograma)."""
+        return 256 + 32 * self._size + 36 * (len(self.edges) + len(self.buckets))
+
+    def _capacity(self, level: int) -> int:
+        depth = len(self._levels) - level - 1
+        return max(2, int(math.ceil(self.k * _CAPACITY_RATIO ** depth)))
+
+    def _grow(self) -> None:
+        self._levels.append([])
+        self._max_size = sum(self._capacity(level) for level in range(len(self._levels)))
+
+    def _compress(self) -> None:
+        while self._size >= self._max_size:
+            for level in range(len(self._levels)):
+                items = self._levels[level]
+                if len(items) < self._capacity(level):
+                    continue
+                if level + 1 == len(self._levels):
+                    self._grow()
+                items.sort()
+                # Com quantidade ímpar, o menor item fica no nível
+                kept = items[:len(items) % 2]
+                offset = (self._parity >> level) & 1
+                self._parity ^= 1 << level
+                self._levels[level + 1].extend(items[len(kept) + offset::2])
+                self._levels[level] = kept
+                self._size = sum(len(items) for items in self._levels)
+                if self._size < self._max_size:
+                    break
+
+    def update(self, value: float) -> None:
+        """Adiciona um valor."""
+        self.update_many([value])
+
+    def update_many(self, values: Iterable[float]) -> None:
+        """Adiciona valores em lote (lista ou array NumPy)."""
+        array = np.asarray(values if isinstance(values, np.ndarray) else list(values), dtype=np.float64).ravel()
+        if not len(array):
+            return
+        self.count += int(len(array))
+        self.sum += float(array.sum())
+        low, high = float(array.min()), float(array.max())
+        self.min = low if self.min is None else min(self.min, low)
+        self.max = high if self.max is None else max(self.max, high)
+        if self.edges:
+            positions = np.searchsorted(np.asarray(self.edges), array, side="right")
+            for bucket, n in enumerate(np.bincount(positions, minlength=len(self.buckets)).tolist()):
+                self.buckets[bucket] += n
+        self._levels[0].extend(array.tolist())
+        self._size += int(len(array))
+        self._compress()
+
+    def merge(self, other: "QuantileSketch") -> "QuantileSketch":
+        """Mescla other neste sketch (other não é alterado). Retorna self."""
+        if other.k != self.k or other.edges != self.edges:
+            raise ValueError("sketches com k ou faixas de histograma diferentes não podem ser mesclados.")
+        if not other.count:
+            return self
+        while len(self._levels) < len(other._levels):
+            self._grow()
+        for level, items in enumerate(other._levels):
+            self._levels[level].extend(items)
+        self.count += other.count
+        self.sum += other.sum
+        self.min = other.min if self.min is None else min(self.min, other.min)
+        self.max = other.max if self.max is None else max(self.max, other.max)
+        self.buckets = [a + b for a, b in zip(self.buckets, other.buckets)]
+        self._size = sum(len(items) for items in self._levels)
+        self._compress()
+        return self
+
+    def quantiles(self, qs: Sequence[float]) -> List[Optional[float]]:
+        """Valores nos quantis qs (0..1, nearest-rank); None em todos se o sketch estiver vazio."""
+        if not self.count:
+            return [None for _ in qs]
+        values = []
+        weights = []
+        for level, items in enumerate(self._levels):
+            values.extend(items)
+            weights.extend([1 << level] * len(items))
+        order = np.argsort(values, kind="stable")
+        sorted_values = np.asarray(values)[order]
+        cumulative = np.cumsum(np.asarray(weights, dtype=np.int64)[order])
+        result = []
+        for q in qs:
+            rank = max(1, int(math.ceil(min(1.0, max(0.0, q)) * self.count)))
+            position = min(int(np.searchsorted(cumulative, rank, side="left")), len(sorted_values) - 1)
+            result.append(min(self.max, max(self.min, float(sorted_values[position]))))
+        return result
+
+    def quantile(self, q: float) -> Optional[float]:
+        """Valor no quantil q (0..1)."""
+        return self.quantiles([q])[0]
+
+    def histogram(self) -> List[dict]:
+        """Faixas do histograma: [{"from", "to" (None na última), "count"}]."""
+        bounds = [0.0, *self.edges]
+        return [
+            {"from": bounds[i], "to": self.edges[i] if i < len(self.edges) else None, "count": n}
+            for i, n in enumerate(self.buckets)
+        ]
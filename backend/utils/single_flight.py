@@ -0,0 +1,45 @@
+# backend/utils/single_flight.py
+
+"""
+Single-flight para corrotinas: chamadas simultâneas com a mesma chave compartilham uma
+única execução e o mesmo resultado (ou a mesma exceção).
+"""
+
+import asyncio
+import copy
+from typing import Any, Awaitable, Callable, Hashable
+
+
+class SingleFlight:
+    """
+    Coalesce chamadas idênticas em andamento.
+    - A chave deve identificar a operação por completo, incluindo o tenant (credenciais).
+    - Quem chega enquanto a execução está em andamento recebe uma cópia profunda do resultado,
+      para que alterações de um chamador não afetem os demais (copy_result=False compartilha o
+      próprio objeto, para resultados somente leitura).
+    - Cancelar um chamador não cancela a execução compartilhada.
+    """
+
+    def __init__(self):
+        self._calls: dict[tuple, asyncio.Task] = {}
+        self.executions = 0
+        self.shared = 0
+
+    async def do(self, key: Hashable, fn: Callable[[], Awaitable[Any]], copy_result: bool = True) -> Any:
+        """Executa fn() ou aguarda a execução em andamento com a mesma chave."""
+        loop = asyncio.get_running_loop()
+        call_key = (id(loop), key)
+        task = self._calls.get(call_key)
+        if task is not None:
+            self.shared += 1
+            result = await asyncio.shield(task)
+            return copy.deepcopy(result) if copy_result else result
+
+        task = loop.create_task(fn())
+        self.executions += 1
+        self._calls[call_key] = task
+        task.add_done_callback(lambda _: self._calls.pop(call_key, None))
+        return await asyncio.shield(task)
+
+    def stats(self) -> dict:
+        return {"inFlight": len(self._calls), "executions": self.executions, "shared": self.shared}
@@ -0,0 +1,103 @@
+# backend/utils/ttl_cache.py
+
+"""
+Cache em memória com TTL por entrada e limite de entradas (LRU), e opcionalmente de bytes.
+Thread-safe; usado para metadados do Jira (projetos, boards, sprints) e resultados do dashboard.
+"""
+
+import copy
+import threading
+import time
+from collections import OrderedDict
+from typing import Any, Callable, Hashable, Optional, Tuple
+
+
+class TTLCache:
+    """
+    Cache LRU com expiração por entrada.
+    - max_entries: limite de entradas (a menos usada recentemente é descartada).
+    - max_bytes: limite opcional da soma dos tamanhos informados em set (size); entradas LRU são
+      descartadas até caber, e uma entrada maior que o limite sozinha não é guardada.
+    - get/set trabalham com cópias profundas, para que o chamador possa alterar o valor
+      retornado sem afetar o cache; valores somente leitura podem ser guardados sem cópia
+      (set com copy_value=False), e get os devolve compartilhados.
+    - hits/misses/evictions ficam disponíveis em stats().
+    """
+
+    def __init__(self, max_entries: int = 512, max_bytes: Optional[int] = None):
+        self.max_entries = max(1, max_entries)
+        self.max_bytes = max_bytes
+        self._data: "OrderedDict[Hashable, Tuple[float, Any, bool, int]]" = OrderedDict()
+        self._bytes = 0
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.oversized = 0
+
+    def get(self, key: Hashable) -> Tuple[bool, Any]:
+        """Retorna (hit, valor). Entradas expiradas contam como miss e são removidas."""
+        now = time.monotonic()
+        with self._lock:
+            entry = self._data.get(key)
+            if entry is None or entry[0] <= now:
+                if entry is not None:
+                    self._remove(key)
+                self.misses += 1
+                return False, None
+            self._data.move_to_end(key)
+            self.hits += 1
+            _, value, copied, _ = entry
+        return True, copy.deepcopy(value) if copied else value
+
+    def set(self, key: Hashable, value: Any, ttl_seconds: float, copy_value: bool = True, size: int = 0) -> None:
+        """
+        Armazena value por ttl_seconds (ttl <= 0 não armazena).
+        copy_value=False guarda o próprio objeto: só para valores que ninguém altera depois.
+        size: tamanho estimado em bytes, contado em max_bytes.
+        """
+        if ttl_seconds <= 0:
+            return
+        if self.max_bytes is not None and size > self.max_bytes:
+            with self._lock:
+                self.oversized += 1
+            return
+        stored = copy.deepcopy(value) if copy_value else value
+        with self._lock:
+            if key in self._data:
+                self._remove(key)
+            self._data[key] = (time.monotonic() + ttl_seconds, stored, copy_value, size)
+            self._bytes += size
+            while len(self._data) > self.max_entries or (self.max_bytes is not None and self._bytes > self.max_bytes):
+                self._remove(next(iter(self._data)))
+                self.evictions += 1
+
+    def _remove(self, key: Hashable) -> None:
+        """Remove a entrada (com o lock)."""
+        self._bytes -= self._data.pop(key)[3]
+
+    def invalidate(self, predicate: Optional[Callable[[Hashable], bool]] = None) -> int:
+        """Remove entradas cuja chave satisfaz predicate (todas se None). Retorna quantas foram removidas."""
+        with self._lock:
+            if predicate is None:
+                removed = len(self._data)
+                self._data.clear()
+                self._bytes = 0
+                return removed
+            keys = [k for k in self._data if predicate(k)]
+            for k in keys:
+                self._remove(k)
+            return len(keys)
+
+    def stats(self) -> dict:
+        with self._lock:
+            stats = {
+                "entries": len(self._data),
+                "maxEntries": self.max_entries,
+                "hits": self.hits,
+                "misses": self.misses,
+                "evictions": self.evictions,
+            }
+            if self.max_bytes is not None:
+                stats.update({"bytes": self._bytes, "maxBytes": self.max_bytes, "oversized": self.oversized})
+            return stats
@@ -361,51 +361,47 @@ async function handleGenerateDashboard(e) {
       throw new Error('Faça login para continuar');
     }
     
-    // Buscar dados do dashboard
-    const dashboardResponse = await fetch(window.ApiConfig.buildUrl('/dashboard'), {
+    // Dashboard e Status Time (se marcado) numa única chamada; seções calculadas em paralelo
+    if (includeStatusTime) {
+      showLoading('Carregando dashboard e Status Time... (pode demorar alguns segundos)');
+    }
+    const bundleResponse = await fetch(window.ApiConfig.buildUrl('/dashboard/bundle'), {
       method: 'POST',
       headers: JiraAuth.getHeaders(),
       body: JSON.stringify({
-        action: 'dashboard',
         projectKey,
-        period
+        period,
+        sections: includeStatusTime ? ['dashboard', 'statusTime'] : ['dashboard']
       })
     });
     
-    const dashboardData = await dashboardResponse.json();
+    const bundleData = await bundleResponse.json();
+    const dashboardSection = bundleData.data?.sections?.dashboard;
     
-    if (!dashboardData.success) {
+    if (!dashboardSection?.success) {
+      const errorCode = bundleData.error?.code || dashboardSection?.code;
       // Se erro de autenticação, mostrar modal de login
-      if (dashboardData.error?.code === 'PROJECT_NOT_ACCESSIBLE' || dashboardResponse.status === 401) {
+      if (errorCode === 'PROJECT_NOT_ACCESSIBLE' || bundleResponse.status === 401) {
         JiraAuth.clear();
         showLoginModal();
         throw new Error('Sessão expirada. Faça login novamente.');
       }
-      throw new Error(dashboardData.error?.message || 'Erro ao carregar dashboard');
+      throw new Error(bundleData.error?.message || dashboardSection?.error || 'Erro ao carregar dashboard');
     }
     
-    currentDashboardData = dashboardData.data;
+    currentDashboardData = dashboardSection.data;
     currentStatusTimeData = null;
     
-    // Buscar Status Time se checkbox marcado
-    if (includeStatusTime) {
+    // Status Time: falha na seção não impede o dashboard
+    const statusTimeSection = bundleData.data.sections.statusTime;
+    if (statusTimeSection?.success) {
       try {
-        showLoading('Carregando Status Time... (pode demorar alguns segundos)');
-        const statusTimeResponse = await fetch(window.ApiConfig.buildUrl('/dashboard/status-time'), {
-          method: 'POST',
-          headers: JiraAuth.getHeaders(),
-          body: JSON.stringify({ projectKey, period })
-        });
-        
-        const statusTimeData = await statusTimeResponse.json();
-        
-        if (statusTimeData.success) {
-          currentStatusTimeData = statusTimeData.data;
-        }
+        currentStatusTimeData = await fetchRemainingStatusTimePages(projectKey, period, statusTimeSection.data);
       } catch (stError) {
         console.error('Erro ao carregar Status Time:', stError);
-        // Continua sem Status Time
       }
+    } else if (statusTimeSection) {
+      console.error('Erro ao carregar Status Time:', statusTimeSection.detail || statusTimeSection.error);
     }
     
     // Renderizar dashboard
@@ -945,6 +941,14 @@ function renderStatusTimeButton() {
   `;
 }
 
+/**
+ * P50 / P90 do tempo em um status (distribuição do summary; ausente no summary parcial do streaming).
+ */
+function renderStatusTimePercentiles(label, distribution) {
+  if (!distribution || !distribution.count) return '';
+  return `<div class="summary-item"><span class="label">P50 / P90 ${label}:</span> <span class="value">${distribution.p50Hours.toFixed(2)}h / ${distribution.p90Hours.toFixed(2)}h</span></div>`;
+}
+
 function renderStatusTimeTable() {
   if (!currentStatusTimeData) return renderStatusTimeButton();
   
@@ -972,6 +976,9 @@ function renderStatusTimeTable() {
         <div class="summary-item"><span class="label">Total Geral:</span> <span class="value">${summary.totalHours.toFixed(2)}h</span></div>
         <div class="summary-item"><span class="label">Média Ready to test:</span> <span class="value">${summary.avgReadyToTestHours.toFixed(2)}h</span></div>
         <div class="summary-item"><span class="label">Média In Test:</span> <span class="value">${summary.avgInTestHours.toFixed(2)}h</span></div>
+        ${renderStatusTimePercentiles('Ready to test', summary.readyToTestDistribution)}
+        ${renderStatusTimePercentiles('In Test', summary.inTestDistribution)}
+        ${renderStatusTimePercentiles('Cycle time', summary.cycleTimeDistribution)}
       </div>
       
       <div class="table-wrapper">
@@ -1049,6 +1056,105 @@ function sortStatusTimeBy(column) {
 // Expor função globalmente
 window.sortStatusTimeBy = sortStatusTimeBy;
 
+/**
+ * Status Time é paginado por cursor no backend (o summary já cobre todas as issues).
+ * Busca as páginas restantes e concatena as issues para a tabela (ordenada no front).
+ */
+async function fetchRemainingStatusTimePages(projectKey, period, data) {
+  let cursor = data.page?.nextCursor;
+  while (cursor) {
+    const response = await fetch(window.ApiConfig.buildUrl('/dashboard/status-time'), {
+      method: 'POST',
+      headers: JiraAuth.getHeaders(),
+      body: JSON.stringify({ projectKey, period, pageSize: 500, cursor })
+    });
+    const pageData = await response.json();
+    if (!pageData.success) {
+      throw new Error(pageData.error?.message || 'Erro ao carregar Status Time');
+    }
+    data.issues = data.issues.concat(pageData.data.issues);
+    cursor = pageData.data.page?.nextCursor;
+  }
+  return data;
+}
+
+/**
+ * Resumo parcial enquanto as linhas do Status Time chegam pelo streaming
+ * (substituído pelo summary do backend ao final).
+ */
+function partialStatusTimeSummary(issues) {
+  const count = issues.length;
+  const totalReady = issues.reduce((acc, issue) => acc + issue.readyToTestHours, 0);
+  const totalInTest = issues.reduce((acc, issue) => acc + issue.inTestHours, 0);
+  return {
+    count,
+    totalReadyToTestHours: totalReady,
+    totalInTestHours: totalInTest,
+    totalHours: totalReady + totalInTest,
+    avgReadyToTestHours: count ? totalReady / count : 0,
+    avgInTestHours: count ? totalInTest / count : 0
+  };
+}
+
+/**
+ * Consome POST /dashboard/status-time/stream (NDJSON): meta, uma linha por issue e summary.
+ * onProgress(data) é chamado conforme as linhas chegam; retorna o DTO completo do Status Time.
+ */
+async function streamStatusTime(projectKey, period, onProgress) {
+  const response = await fetch(window.ApiConfig.buildUrl('/dashboard/status-time/stream'), {
+    method: 'POST',
+    headers: JiraAuth.getHeaders(),
+    body: JSON.stringify({ projectKey, period })
+  });
+  
+  // Erros antes do streaming voltam como JSON padrão
+  if (!response.ok || !response.body) {
+    const data = await response.json();
+    if (data.error?.code === 'PROJECT_NOT_ACCESSIBLE' || response.status === 401) {
+      JiraAuth.clear();
+      showLoginModal();
+      throw new Error('Sessão expirada. Faça login novamente.');
+    }
+    throw new Error(data.error?.message || 'Erro ao carregar Status Time');
+  }
+  
+  const data = { project: null, period: null, issues: [], summary: null, meta: null };
+  const reader = response.body.getReader();
+  const decoder = new TextDecoder();
+  let buffer = '';
+  
+  const handleEvent = (event) => {
+    if (event.type === 'meta') {
+      data.project = event.data.project;
+      data.period = event.data.period;
+    } else if (event.type === 'issue') {
+      data.issues.push(event.data);
+    } else if (event.type === 'summary') {
+      data.summary = event.data;
+      data.meta = event.meta;
+    } else if (event.type === 'error') {
+      throw new Error(event.detail || event.error || 'Erro ao carregar Status Time');
+    }
+  };
+  
+  while (true) {
+    const { done, value } = await reader.read();
+    buffer += decoder.decode(value || new Uint8Array(), { stream: !done });
+    const lines = buffer.split('\n');
+    buffer = lines.pop();
+    lines.filter(line => line.trim()).forEach(line => handleEvent(JSON.parse(line)));
+    if (!data.summary && data.issues.length) {
+      onProgress({ ...data, summary: partialStatusTimeSummary(data.issues) });
+    }
+    if (done) break;
+  }
+  if (buffer.trim()) handleEvent(JSON.parse(buffer));
+  if (!data.summary) {
+    throw new Error('Status Time incompleto (conexão encerrada)');
+  }
+  return data;
+}
+
 async function loadStatusTime() {
   if (!currentFilters.projectKey || !currentFilters.period) {
     showError('Gere o dashboard primeiro');
@@ -1073,28 +1179,19 @@ async function loadStatusTime() {
       throw new Error('Faça login para continuar');
     }
     
-    const response = await fetch(window.ApiConfig.buildUrl('/dashboard/status-time'), {
-      method: 'POST',
-      headers: JiraAuth.getHeaders(),
-      body: JSON.stringify({
-        projectKey: currentFilters.projectKey,
-        period: currentFilters.period
-      })
-    });
-    
-    const data = await response.json();
-    
-    if (!data.success) {
-      // Se erro de autenticação, mostrar modal de login
-      if (data.error?.code === 'PROJECT_NOT_ACCESSIBLE' || response.status === 401) {
-        JiraAuth.clear();
-        showLoginModal();
-        throw new Error('Sessão expirada. Faça login novamente.');
+    // Linhas renderizadas conforme chegam (no máximo a cada 250ms)
+    let lastRender = 0;
+    currentStatusTimeData = await streamStatusTime(
+      currentFilters.projectKey,
+      currentFilters.period,
+      (partial) => {
+        const now = Date.now();
+        if (now - lastRender < 250) return;
+        lastRender = now;
+        currentStatusTimeData = partial;
+        statusTimeSection.innerHTML = renderStatusTimeTable();
       }
-      throw new Error(data.error?.message || 'Erro ao carregar Status Time');
-    }
-    
-    currentStatusTimeData = data.data;
+    );
     statusTimeSection.innerHTML = renderStatusTimeTable();
     
     // Atualizar o card MTTR e o Resumo Executivo com os novos dados
@@ -1103,6 +1200,7 @@ async function loadStatusTime() {
     
   } catch (error) {
     console.error('Erro ao carregar Status Time:', error);
+    currentStatusTimeData = null;
     statusTimeSection.innerHTML = `
       <div class="status-time-error">
         <p>Erro ao carregar Status Time: ${escapeHtml(error.message)}</p>
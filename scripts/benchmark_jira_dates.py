@@ -0,0 +1,82 @@
+# scripts/benchmark_jira_dates.py
+
+"""
+Micro-benchmark das datas do Jira: dateutil (implementação anterior) x backend.utils.jira_dates.
+Uso (na raiz do projeto): python scripts/benchmark_jira_dates.py [quantidade]
+"""
+
+import os
+import random
+import sys
+import time
+from datetime import datetime, timedelta, timezone
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+
+from dateutil.parser import parse as dateutil_parse  # noqa: E402
+
+from backend.utils.date_range_utils import TIMEZONE  # noqa: E402
+from backend.utils.jira_dates import (  # noqa: E402
+    get_day_bucketer,
+    jira_day_br,
+    jira_epoch_ms_array,
+    jira_to_epoch_ms,
+)
+
+
+def dateutil_day_br(value: str):
+    dt = dateutil_parse(value.strip())
+    dt = dt.replace(tzinfo=TIMEZONE) if dt.tzinfo is None else dt.astimezone(TIMEZONE)
+    return dt.date().isoformat()
+
+
+def dateutil_epoch_ms(value: str):
+    return int(dateutil_parse(value.strip()).timestamp() * 1000)
+
+
+def sample(count: int) -> list[str]:
+    """Datas no formato do Jira (-0300), espalhadas por um ano."""
+    rnd = random.Random(42)
+    base = datetime(2025, 1, 1, tzinfo=timezone(timedelta(hours=-3)))
+    values = []
+    for _ in range(count):
+        dt = base + timedelta(milliseconds=rnd.randint(0, 365 * 86_400_000))
+        values.append(dt.strftime("%Y-%m-%dT%H:%M:%S.%f")[:-3] + "-0300")
+    return values
+
+
+def bench(label: str, func, values: list[str]) -> tuple:
+    start = time.perf_counter()
+    result = func(values)
+    elapsed = time.perf_counter() - start
+    print(f"  {label:<40} {elapsed * 1000:9.1f} ms  ({elapsed / len(values) * 1e6:6.2f} µs/data)")
+    return elapsed, result
+
+
+def main() -> None:
+    count = int(sys.argv[1]) if len(sys.argv) > 1 else 100_000
+    values = sample(count)
+    print(f"{count} datas no formato do Jira\n")
+
+    print("Dia em America/Sao_Paulo:")
+    slow, expected = bench("dateutil + astimezone", lambda v: [dateutil_day_br(x) for x in v], values)
+    fast, scalar = bench("jira_day_br (caminho rápido)", lambda v: [jira_day_br(x) for x in v], values)
+    bucketer = get_day_bucketer()
+
+    def vectorized(v):
+        epoch_ms, _ = jira_epoch_ms_array(v)
+        return [bucketer.day_string(d) for d in bucketer.day_numbers(epoch_ms).tolist()]
+
+    vector, vector_days = bench("jira_epoch_ms_array + DayBucketer", vectorized, values)
+    assert scalar == expected and vector_days == expected, "resultados divergentes"
+    print(f"  speedup: {slow / fast:.1f}x (escalar), {slow / vector:.1f}x (vetorizado)\n")
+
+    print("Timestamp em ms:")
+    slow, expected = bench("dateutil .timestamp()", lambda v: [dateutil_epoch_ms(x) for x in v], values)
+    fast, result = bench("jira_to_epoch_ms", lambda v: [jira_to_epoch_ms(x) for x in v], values)
+    assert result == expected, "resultados divergentes"
+    print(f"  speedup: {slow / fast:.1f}x")
+
+
+if __name__ == "__main__":
+    main()
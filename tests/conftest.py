@@ -0,0 +1,8 @@
+# tests/conftest.py
+
+"""Configuração comum dos testes: raiz do repositório no sys.path (imports `backend.*`)."""
+
+import os
+import sys
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
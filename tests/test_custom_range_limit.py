@@ -0,0 +1,97 @@
+# tests/test_custom_range_limit.py
+
+import asyncio
+from datetime import datetime, timedelta
+
+import pytest
+
+from backend.services import dashboard_service as ds
+from backend.services.issue_mirror import IssueMirror
+from backend.utils.date_range_utils import TIMEZONE
+
+
+class FakeJira:
+    def tenant_key(self, credentials=None):
+        return ("tenant",)
+
+    async def search_issues_paginated(self, jql, fields, credentials=None, **kwargs):
+        return []
+
+
+def _range(days: int) -> tuple[str, str]:
+    end = datetime.now(TIMEZONE).date() - timedelta(days=1)
+    return (end - timedelta(days=days)).isoformat(), end.isoformat()
+
+
+def _resolve(start: str, end: str, project_key: str = "PRJ", rollup_range: bool = True):
+    service = ds.DashboardService()
+    return asyncio.run(service._resolve_period(
+        FakeJira(), project_key, "custom", start, end, rollup_range=rollup_range
+    ))
+
+
+def _mirror(tmp_path, horizon_days: int, synced: bool) -> IssueMirror:
+    mirror = IssueMirror(str(tmp_path / "mirror.sqlite3"), max_age=300, horizon_days=horizon_days, full_sync_interval=10**9)
+
+    async def sync():
+        await mirror.ensure_fresh(FakeJira(), "PRJ", "2026-01-01")
+        for task, _ in list(mirror._syncing.values()):
+            await task
+
+    if synced:
+        asyncio.run(sync())
+    return mirror
+
+
+@pytest.fixture(autouse=True)
+def env(monkeypatch):
+    monkeypatch.delenv("DASHBOARD_CUSTOM_RANGE_MONTHS", raising=False)
+    monkeypatch.delenv("DASHBOARD_ROLLUP_RANGE_MONTHS", raising=False)
+
+
+def test_without_mirror_uses_base_limit(monkeypatch):
+    monkeypatch.setattr(ds, "get_issue_mirror", lambda: None)
+
+    assert _resolve(*_range(60))[:2] == _range(60)
+    with pytest.raises(ValueError, match="limite de 3 meses"):
+        _resolve(*_range(300))
+
+
+@pytest.mark.parametrize(
+    "horizon_days, synced, rollup_range, allowed",
+    [
+        (732, True, True, True),
+        # Janela do espelho sem a janela anterior comparável
+        (365, True, True, False),
+        # Espelho ainda sem sincronização (a primeira corre em segundo plano)
+        (732, False, True, False),
+        # Cálculo que não lê os rollups (filtros, groupBy, Status Time)
+        (732, True, False, False),
+    ],
+)
+def test_rollup_limit_requires_covering_mirror(monkeypatch, tmp_path, horizon_days, synced, rollup_range, allowed):
+    mirror = _mirror(tmp_path, horizon_days, synced)
+    monkeypatch.setattr(ds, "get_issue_mirror", lambda: mirror)
+    start, end = _range(300)
+
+    try:
+        if allowed:
+            assert _resolve(start, end, rollup_range=rollup_range)[:2] == (start, end)
+        else:
+            with pytest.raises(ValueError, match="limite de 3 meses"):
+                _resolve(start, end, rollup_range=rollup_range)
+        # Acima do limite dos rollups, sempre recusado
+        with pytest.raises(ValueError, match="excede o limite"):
+            _resolve(*_range(400), rollup_range=rollup_range)
+    finally:
+        mirror.close()
+
+
+def test_multi_project_prevalidation_uses_rollup_limit(monkeypatch, tmp_path):
+    mirror = _mirror(tmp_path, 732, synced=False)
+    monkeypatch.setattr(ds, "get_issue_mirror", lambda: mirror)
+
+    try:
+        assert _resolve(*_range(300), project_key="")[:2] == _range(300)
+    finally:
+        mirror.close()
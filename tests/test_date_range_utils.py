@@ -0,0 +1,64 @@
+# tests/test_date_range_utils.py
+
+from datetime import date
+
+import pytest
+
+from backend.utils.date_range_utils import split_date_range
+
+
+def _covered_days(shards):
+    """Dias (00:00) que a JQL de cada fatia aceita: [início, fim) ou [início, fim] na última."""
+    covered = []
+    for start, end, end_exclusive in shards:
+        day = start
+        while day < end or (not end_exclusive and day == end):
+            covered.append(day)
+            day = date.fromordinal(day.toordinal() + 1)
+    return covered
+
+
+@pytest.mark.parametrize("shards", [1, 2, 3, 4, 7, 30, 100])
+@pytest.mark.parametrize(
+    "start, end",
+    [
+        (date(2026, 1, 1), date(2026, 1, 1)),
+        (date(2026, 1, 1), date(2026, 1, 2)),
+        (date(2026, 1, 1), date(2026, 1, 8)),
+        (date(2026, 1, 31), date(2026, 3, 1)),
+        (date(2025, 10, 1), date(2026, 9, 30)),
+    ],
+)
+def test_split_date_range_is_contiguous_and_preserves_bounds(start, end, shards):
+    result = split_date_range(start, end, shards)
+
+    assert result[0][0] == start
+    assert result[-1][1] == end
+    assert result[-1][2] is False
+    assert all(exclusive for _, _, exclusive in result[:-1])
+    for (_, previous_end, _), (next_start, _, _) in zip(result, result[1:]):
+        assert previous_end == next_start
+    # Mesmos dias da consulta sem fatias, cada um numa única fatia
+    assert _covered_days(result) == _covered_days([(start, end, False)])
+
+
+@pytest.mark.parametrize("shards", [2, 3, 5, 9])
+def test_split_date_range_never_yields_empty_shards(shards):
+    start, end = date(2026, 3, 1), date(2026, 3, 5)
+    result = split_date_range(start, end, shards)
+
+    assert len(result) == min(shards, (end - start).days)
+    assert all(shard_start < shard_end for shard_start, shard_end, _ in result)
+
+
+def test_split_date_range_single_day_or_single_shard():
+    assert split_date_range(date(2026, 3, 1), date(2026, 3, 1), 8) == [(date(2026, 3, 1), date(2026, 3, 1), False)]
+    assert split_date_range(date(2026, 3, 1), date(2026, 3, 31), 1) == [(date(2026, 3, 1), date(2026, 3, 31), False)]
+    assert split_date_range(date(2026, 3, 1), date(2026, 3, 31), 0) == [(date(2026, 3, 1), date(2026, 3, 31), False)]
+
+
+def test_split_date_range_even_sizes():
+    result = split_date_range(date(2026, 1, 1), date(2026, 1, 11), 4)
+
+    sizes = [(end - start).days for start, end, _ in result]
+    assert sizes == [2, 3, 2, 3]
@@ -0,0 +1,177 @@
+# tests/test_defects_aggregator.py
+
+import random
+from collections import defaultdict
+from datetime import date, datetime, timedelta, timezone
+
+import numpy as np
+import pytest
+from dateutil.parser import parse as dateutil_parse
+
+from backend.services.dashboard_service import (
+    ISSUE_TYPE_BUG,
+    ISSUE_TYPE_SUB_BUG,
+    STATUS_CANCELED,
+    STATUS_CLOSED,
+    DefectsAggregator,
+)
+from backend.services.issue_column_cache import IssueColumns
+from backend.utils.date_range_utils import TIMEZONE, list_days
+
+
+def _reference_day(created: str):
+    """Dia local do created como no cálculo original (dateutil, America/Sao_Paulo)."""
+    if not created or not created.strip():
+        return None
+    try:
+        dt = dateutil_parse(created.strip())
+    except Exception:
+        return None
+    dt = dt.replace(tzinfo=TIMEZONE) if dt.tzinfo is None else dt.astimezone(TIMEZONE)
+    return dt.date().isoformat()
+
+
+def _reference_dashboard(issues, days):
+    """Laço por issue do cálculo original do dashboard (antes do DefectsAggregator)."""
+    days_set = set(days)
+    totals = defaultdict(int)
+    daily_prod, daily_valid, daily_reported = defaultdict(int), defaultdict(int), defaultdict(int)
+    for issue in issues:
+        it = (issue.get("issuetype") or "").strip()
+        st = (issue.get("status") or "").strip()
+        day = _reference_day(issue.get("created") or "")
+        if it not in (ISSUE_TYPE_BUG, ISSUE_TYPE_SUB_BUG):
+            continue
+        in_days = day in days_set
+        valid = st != STATUS_CANCELED
+        closed = st in STATUS_CLOSED
+        totals["reported"] += 1
+        daily_reported[day] += in_days
+        if not valid:
+            continue
+        totals["valid"] += 1
+        daily_valid[day] += in_days
+        kind = "bugs" if it == ISSUE_TYPE_BUG else "subBugs"
+        totals[f"{kind}_{'closed' if closed else 'open'}"] += 1
+        if it == ISSUE_TYPE_BUG:
+            daily_prod[day] += in_days
+
+    bugs = totals["bugs_closed"] + totals["bugs_open"]
+    sub_bugs = totals["subBugs_closed"] + totals["subBugs_open"]
+    metrics = {
+        "defectLeakage": {
+            "productionBugs": bugs,
+            "totalDefectsValid": totals["valid"],
+            "ratePercent": round(bugs / totals["valid"] * 100 if totals["valid"] else 0.0, 2),
+        },
+        "defectValidRate": {
+            "validDefects": totals["valid"],
+            "totalReported": totals["reported"],
+            "ratePercent": round(totals["valid"] / totals["reported"] * 100 if totals["reported"] else 0.0, 2),
+        },
+        "defectsRatio": {
+            "subBugsValid": sub_bugs,
+            "bugsValid": bugs,
+            "ratio": round(sub_bugs / bugs, 2) if bugs else None,
+        },
+        "defectsBreakdown": {"closed": totals["subBugs_closed"], "open": totals["subBugs_open"], "total": sub_bugs},
+        "bugsBreakdown": {"closed": totals["bugs_closed"], "open": totals["bugs_open"], "total": bugs},
+    }
+    prod = [daily_prod.get(d, 0) for d in days]
+    valid = [daily_valid.get(d, 0) for d in days]
+    reported = [daily_reported.get(d, 0) for d in days]
+    series = {
+        "defectLeakageDaily": {
+            "labels": days,
+            "valuesPercent": [round(p / v * 100 if v else 0.0, 2) for p, v in zip(prod, valid)],
+            "productionBugs": prod,
+            "totalDefectsValid": valid,
+        },
+        "defectValidRateDaily": {
+            "labels": days,
+            "valuesPercent": [round(v / r * 100 if r else 0.0, 2) for v, r in zip(valid, reported)],
+            "validDefects": valid,
+            "totalReported": reported,
+        },
+    }
+    return metrics, series
+
+
+def _random_issues(count: int, seed: int):
+    """Issues variadas: tipos/status com espaços, fusos diferentes, created vazio ou inválido."""
+    rng = random.Random(seed)
+    base = datetime(2026, 1, 1, tzinfo=timezone.utc)
+    formats = [
+        ("%Y-%m-%dT%H:%M:%S.000-0300", timezone(timedelta(hours=-3))),
+        ("%Y-%m-%dT%H:%M:%S.123+0000", timezone.utc),
+        ("%Y-%m-%dT%H:%M:%S+05:30", timezone(timedelta(hours=5, minutes=30))),
+        ("%Y-%m-%dT%H:%M:%SZ", timezone.utc),
+    ]
+    issues = []
+    for _ in range(count):
+        fmt, tz = formats[0] if rng.random() < 0.9 else rng.choice(formats)
+        created = (base + timedelta(seconds=rng.randint(0, 200 * 86400))).astimezone(tz).strftime(fmt)
+        if rng.random() < 0.01:
+            created = rng.choice(["", "garbage", None])
+        issues.append({
+            "issuetype": rng.choice([ISSUE_TYPE_BUG, ISSUE_TYPE_SUB_BUG, " Bug ", "Story", None]),
+            "status": rng.choice(["Done", STATUS_CANCELED, "In Test", "Closed", " Done", "Resolved", None]),
+            "created": created,
+        })
+    return issues
+
+
+@pytest.mark.parametrize("page_size", [1, 100, 5000])
+def test_aggregator_matches_per_issue_loop(page_size):
+    issues = _random_issues(5000, seed=3)
+    days = list_days(date(2026, 2, 1), date(2026, 6, 30))
+
+    aggregator = DefectsAggregator(days)
+    for i in range(0, len(issues), page_size):
+        aggregator.add_many(issues[i:i + page_size])
+
+    metrics, series = _reference_dashboard(issues, days)
+    assert aggregator.metrics() == metrics
+    assert aggregator.series() == series
+    assert aggregator.issue_count == len(issues)
+
+
+def test_aggregator_is_order_independent():
+    issues = _random_issues(2000, seed=7)
+    days = list_days(date(2026, 1, 1), date(2026, 7, 20))
+    shuffled = issues[:]
+    random.Random(1).shuffle(shuffled)
+
+    first, second = DefectsAggregator(days), DefectsAggregator(days)
+    first.add_many(issues)
+    for issue in shuffled:
+        second.add(issue)
+
+    assert first.metrics() == second.metrics()
+    assert first.series() == second.series()
+
+
+def test_aggregator_empty_period():
+    days = list_days(date(2026, 3, 1), date(2026, 3, 3))
+    aggregator = DefectsAggregator(days)
+
+    metrics, series = _reference_dashboard([], days)
+    assert aggregator.metrics() == metrics
+    assert aggregator.series() == series
+    assert metrics["defectsRatio"]["ratio"] is None
+
+
+def test_aggregator_columns_match_issues():
+    issues = [
+        {**issue, "created": issue["created"] or ""}
+        for issue in _random_issues(3000, seed=11)
+    ]
+    days = list_days(date(2026, 2, 1), date(2026, 5, 31))
+    columns = IssueColumns.from_issues(issues, "2026-01-01", "2026-07-20")
+
+    from_issues, from_columns = DefectsAggregator(days), DefectsAggregator(days)
+    from_issues.add_many(issues)
+    from_columns.add_columns(columns, np.ones(len(columns), dtype=bool))
+
+    assert from_columns.metrics() == from_issues.metrics()
+    assert from_columns.series() == from_issues.series()
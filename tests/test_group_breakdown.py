@@ -0,0 +1,126 @@
+# tests/test_group_breakdown.py
+
+import random
+from datetime import datetime, timedelta, timezone
+
+import numpy as np
+import pytest
+
+from backend.services.dashboard_service import DASHBOARD_GROUP_BY, DefectsAggregator, _group_breakdown
+from backend.services.issue_column_cache import IssueColumns, day_start_ms
+
+_BRT = timezone(timedelta(hours=-3))
+_BASE = datetime(2026, 5, 1, tzinfo=_BRT)
+
+
+def _random_issues(count: int, seed: int):
+    rng = random.Random(seed)
+    issues = []
+    for _ in range(count):
+        created = _BASE + timedelta(minutes=rng.randint(0, 60 * 24 * 40))
+        issues.append({
+            "issuetype": rng.choice(["Bug", "Sub-Bug", "Story"]),
+            "status": rng.choice(["Open", "Done", "Cancelado", "Closed"]),
+            "created": created.strftime("%Y-%m-%dT%H:%M:%S.000-0300"),
+            "assignee": rng.choice(["", "ana", "bia", "caio", "davi"]),
+            "priority": rng.choice(["High", "Medium", "Low"]),
+            "components": rng.sample(["api", "web", "app", "db", "infra"], rng.randint(0, 2)),
+            "labels": rng.sample(["regression", "ux"], rng.randint(0, 2)),
+        })
+    return issues
+
+
+def _metrics(issues):
+    """Métricas das issues pelo DefectsAggregator (referência por issue)."""
+    aggregator = DefectsAggregator([])
+    aggregator.add_many(issues)
+    return aggregator.metrics()
+
+
+def _naive_groups(issues, column):
+    groups = {}
+    for issue in issues:
+        if column in IssueColumns.MULTI_COLUMNS:
+            values = list(dict.fromkeys(issue[column])) or [""]
+        else:
+            values = [(issue[column] or "").strip()]
+        for value in values:
+            groups.setdefault(value, []).append(issue)
+    return groups
+
+
+def _reported(issues):
+    return sum(1 for issue in issues if issue["issuetype"] in ("Bug", "Sub-Bug"))
+
+
+@pytest.fixture(scope="module")
+def issues():
+    return _random_issues(3000, seed=8)
+
+
+@pytest.fixture(scope="module")
+def columns(issues):
+    return IssueColumns.from_issues(issues, "2026-05-01", "2026-06-15")
+
+
+@pytest.mark.parametrize("group_by", ["component", "label", "assignee", "priority", "status", "issuetype"])
+def test_breakdown_matches_naive_grouping(issues, columns, group_by):
+    mask = np.zeros(len(columns), dtype=bool)
+    mask[::3] = True
+    selected = [issue for issue, keep in zip(issues, mask) if keep]
+
+    breakdown = _group_breakdown(columns, mask, group_by, top_n=100)
+
+    expected = _naive_groups(selected, DASHBOARD_GROUP_BY[group_by])
+    assert {g["key"] for g in breakdown["groups"]} == set(expected)
+    for group in breakdown["groups"]:
+        members = expected[group["key"]]
+        assert group["issues"] == len(members)
+        assert group["metrics"] == _metrics(members)
+    assert breakdown["other"] is None
+    reported = [_reported(expected[g["key"]]) for g in breakdown["groups"]]
+    assert reported == sorted(reported, reverse=True)
+
+
+def test_breakdown_other_counts_distinct_issues(issues, columns):
+    mask = np.ones(len(columns), dtype=bool)
+
+    breakdown = _group_breakdown(columns, mask, "component", top_n=2)
+
+    expected = _naive_groups(issues, "components")
+    top = [g["key"] for g in breakdown["groups"]]
+    assert len(top) == 2
+    rest = set(expected) - set(top)
+    # Issue com vários componentes fora do top conta uma vez em "other"
+    other_ids = {id(issue) for key in rest for issue in expected[key]}
+    other_issues = [issue for issue in issues if id(issue) in other_ids]
+    assert breakdown["other"]["groups"] == len(rest)
+    assert breakdown["other"]["issues"] == len(other_issues)
+    assert breakdown["other"]["metrics"] == _metrics(other_issues)
+
+
+def test_breakdown_by_sprint_windows(issues, columns):
+    sprints = [
+        {"id": 1, "name": "S1", "startDate": "2026-05-01", "endDate": "2026-05-15"},
+        {"id": 2, "name": "S2", "startDate": "2026-05-15", "endDate": "2026-05-29"},
+    ]
+    mask = np.ones(len(columns), dtype=bool)
+
+    breakdown = _group_breakdown(columns, mask, "sprint", top_n=10, sprints=sprints)
+
+    def sprint_of(created_ms):
+        # Sobreposição (15/05 00:00): vence a sprint que começou por último
+        for sprint in reversed(sprints):
+            if day_start_ms(sprint["startDate"]) <= created_ms <= day_start_ms(sprint["endDate"]):
+                return sprint["name"]
+        return ""
+
+    expected = {}
+    for issue, created_ms in zip(issues, columns.created_ms.tolist()):
+        expected.setdefault(sprint_of(created_ms), []).append(issue)
+    groups = {g["key"]: g for g in breakdown["groups"]}
+    assert set(groups) == set(expected)
+    for key, members in expected.items():
+        assert groups[key]["issues"] == len(members)
+        assert groups[key]["metrics"] == _metrics(members)
+    assert groups["S1"]["sprint"]["id"] == 1
@@ -0,0 +1,131 @@
+# tests/test_issue_column_cache.py
+
+import random
+from datetime import datetime, timedelta, timezone
+
+import numpy as np
+import pytest
+
+from backend.services.issue_column_cache import BITMAP_DENSITY_MIN, NO_CREATED, IssueColumns, day_start_ms
+
+_BRT = timezone(timedelta(hours=-3))
+
+
+def _random_issues(count: int, seed: int):
+    """Issues com valores densos ("hot", tipos, status) e esparsos (muitos componentes/responsáveis)."""
+    rng = random.Random(seed)
+    components = [f"comp-{n}" for n in range(400)]
+    base = datetime(2026, 5, 1, tzinfo=_BRT)
+    issues = []
+    for _ in range(count):
+        created = base + timedelta(minutes=rng.randint(0, 60 * 24 * 60))
+        issues.append({
+            "issuetype": rng.choice(["Bug", "Sub-Bug"]),
+            "status": rng.choice(["Open", "Done", "Cancelado"]),
+            "created": created.strftime("%Y-%m-%dT%H:%M:%S.000-0300"),
+            "assignee": "hot" if rng.random() < 0.5 else rng.choice(["", *(f"user-{n}" for n in range(300))]),
+            "priority": rng.choice(["High", "Low", None]),
+            "components": rng.sample(components, rng.randint(0, 3)),
+            "labels": rng.sample(["l1", "l2", "rare"], rng.randint(0, 2)) if rng.random() < 0.9 else ["l1", "l1"],
+        })
+    return issues
+
+
+def _naive_mask(issues, filters):
+    mask = np.ones(len(issues), dtype=bool)
+    for name, values in filters.items():
+        for i, issue in enumerate(issues):
+            if name in IssueColumns.MULTI_COLUMNS:
+                own = issue.get(name) or []
+                match = any(v in values for v in own) or ("" in values and not own)
+            else:
+                match = (issue.get(name) or "").strip() in values
+            mask[i] &= match
+    return mask
+
+
+@pytest.fixture(scope="module")
+def issues():
+    return _random_issues(6000, seed=2)
+
+
+@pytest.fixture(scope="module")
+def columns(issues):
+    return IssueColumns.from_issues(issues, "2026-05-01", "2026-07-01")
+
+
+@pytest.mark.parametrize(
+    "filters",
+    [
+        {"assignee": ["hot"]},
+        {"assignee": ["user-5", "user-7", ""]},
+        {"assignee": ["hot", "user-1"]},
+        {"components": ["comp-1", "comp-2"]},
+        {"components": [""]},
+        {"components": ["missing"]},
+        {"labels": ["l1"]},
+        {"labels": ["rare", ""], "priority": ["High"]},
+        {"priority": [""]},
+        {"status": ["Open", "Done"], "components": ["comp-3", "comp-4", "comp-5"], "assignee": ["hot"]},
+        {},
+    ],
+)
+def test_filter_mask_matches_naive_scan(issues, columns, filters):
+    assert np.array_equal(columns.filter_mask(filters), _naive_mask(issues, filters))
+
+
+def test_value_indexes_sparse_and_dense(columns):
+    size = len(columns)
+    for name, indexes in columns.value_indexes.items():
+        assert len(indexes) == len(columns.dictionaries[name])
+        for code, index in enumerate(indexes):
+            if index.dtype == np.uint8:
+                rows = np.flatnonzero(np.unpackbits(index, count=size))
+                assert len(rows) >= size * BITMAP_DENSITY_MIN
+            else:
+                rows = index
+                assert index.dtype == np.int32
+                assert len(rows) < size * BITMAP_DENSITY_MIN
+                assert np.all(np.diff(rows) > 0)
+            if name in IssueColumns.MULTI_COLUMNS:
+                offsets, codes = columns.multi_offsets[name], columns.multi_codes[name]
+                owners = np.repeat(np.arange(size), np.diff(offsets))
+                expected = np.unique(owners[codes == code])
+            else:
+                expected = np.flatnonzero(columns.codes[name] == code)
+            assert np.array_equal(rows, expected)
+
+    # "hot" (metade das issues) é denso; componentes, esparsos
+    assert columns.value_indexes["assignee"][columns.dictionaries["assignee"].code("hot")].dtype == np.uint8
+    assert columns.value_indexes["components"][columns.dictionaries["components"].code("comp-1")].dtype == np.int32
+
+
+def test_sparse_indexes_keep_memory_small(columns):
+    values = sum(len(indexes) for indexes in columns.value_indexes.values())
+    index_bytes = sum(index.nbytes for indexes in columns.value_indexes.values() for index in indexes)
+
+    # Bem abaixo de um bitmap completo por valor
+    assert index_bytes < values * ((len(columns) + 7) // 8) / 4
+    assert columns.nbytes() > index_bytes
+
+
+def test_multi_values_are_deduplicated(issues, columns):
+    duplicated = next(i for i, issue in enumerate(issues) if issue["labels"] == ["l1", "l1"])
+    offsets = columns.multi_offsets["labels"]
+
+    assert offsets[duplicated + 1] - offsets[duplicated] == 1
+
+
+def test_select_uses_jql_bounds():
+    midnight = datetime(2026, 6, 10, tzinfo=_BRT)
+    values = [midnight - timedelta(milliseconds=1), midnight, midnight + timedelta(hours=12), midnight + timedelta(days=1)]
+    issues = [{"created": v.strftime("%Y-%m-%dT%H:%M:%S.%f")[:-3] + "-0300"} for v in values]
+    issues.append({"created": "garbage"})
+    columns = IssueColumns.from_issues(issues, "2026-06-01", "2026-06-30")
+
+    selected = columns.select(day_start_ms("2026-06-10"), day_start_ms("2026-06-11"))
+
+    assert selected.tolist() == [False, True, True, True, False]
+    assert columns.created_ms[-1] == NO_CREATED
+    assert columns.covers(day_start_ms("2026-06-01"), day_start_ms("2026-06-30"))
+    assert not columns.covers(day_start_ms("2026-05-31"), day_start_ms("2026-06-30"))
@@ -0,0 +1,146 @@
+# tests/test_issue_mirror.py
+
+import asyncio
+import random
+from datetime import date, datetime, timedelta, timezone
+
+import pytest
+
+from backend.services.dashboard_service import DefectsAggregator
+from backend.services.issue_mirror import IssueMirror
+from backend.utils.date_range_utils import list_days
+
+_BRT = timezone(timedelta(hours=-3))
+
+
+def _jira(dt: datetime) -> str:
+    return dt.astimezone(_BRT).strftime("%Y-%m-%dT%H:%M:%S.%f")[:-3] + "-0300"
+
+
+def _issue(issue_id: int, created: datetime, issuetype: str = "Bug", status: str = "Open") -> dict:
+    return {
+        "id": str(issue_id), "key": f"PRJ-{issue_id}", "issuetype": issuetype, "status": status,
+        "summary": "s", "created": _jira(created), "updated": _jira(created),
+    }
+
+
+class FakeJira:
+    """Jira mínimo para o espelho: busca completa ou só as issues alteradas (JQL com updated)."""
+
+    def __init__(self, issues):
+        self.issues = {i["id"]: i for i in issues}
+        self.changed = set()
+
+    def tenant_key(self, credentials=None):
+        return ("tenant",)
+
+    async def search_issues_paginated(self, jql, fields, credentials=None, **kwargs):
+        if "updated >=" in jql:
+            return [dict(self.issues[i]) for i in self.changed]
+        return [dict(issue) for issue in self.issues.values()]
+
+
+async def _synced(mirror: IssueMirror, jira: FakeJira) -> str:
+    """Primeira sincronização (em segundo plano) concluída; retorna o escopo."""
+    assert await mirror.ensure_fresh(jira, "PRJ", "2026-01-01") is None
+    for task, _ in list(mirror._syncing.values()):
+        await task
+    info = await mirror.ensure_fresh(jira, "PRJ", "2026-01-01")
+    return info["scope"]
+
+
+def _aggregate(days, rows=None, issues=None):
+    aggregator = DefectsAggregator(days)
+    if rows is not None:
+        aggregator.add_counts(rows)
+    else:
+        aggregator.add_many(issues)
+    return aggregator.metrics(), aggregator.series(), aggregator.issue_count
+
+
+@pytest.fixture
+def mirror(tmp_path):
+    m = IssueMirror(str(tmp_path / "mirror.sqlite3"), max_age=0, horizon_days=3650, full_sync_interval=10**9)
+    yield m
+    m.close()
+
+
+def test_rollups_follow_jql_day_boundaries(mirror):
+    midnight = datetime(2026, 3, 10, tzinfo=_BRT)
+    jira = FakeJira([
+        _issue(1, midnight - timedelta(milliseconds=1)),          # 09/03 23:59:59.999
+        _issue(2, midnight),                                      # 10/03 00:00 (limite de created <= "10/03")
+        _issue(3, midnight + timedelta(milliseconds=1)),          # 10/03 00:00:00.001
+        _issue(4, midnight + timedelta(hours=23, minutes=59)),    # 10/03 23:59
+        _issue(5, datetime(2026, 3, 10, 2, 30, tzinfo=timezone.utc)),  # 09/03 23:30 local
+        _issue(6, midnight, issuetype="Story"),
+    ])
+
+    async def scenario():
+        scope = await _synced(mirror, jira)
+        return (
+            await mirror.query_defect_rollups(scope, "2026-03-09", "2026-03-10"),
+            await mirror.query_defect_rollups(scope, "2026-03-10", "2026-03-11"),
+            await mirror.query_defects(scope, "2026-03-09", "2026-03-10"),
+        )
+
+    until_10, from_10, defects = asyncio.run(scenario())
+
+    # Até 10/03: 09/03 inteiro (1 e 5) e, de 10/03, só a issue das 00:00 (2)
+    assert sorted((r["day"], r["count"]) for r in until_10) == [("2026-03-09", 2), ("2026-03-10", 1)]
+    assert sorted(d["key"] for d in defects) == ["PRJ-1", "PRJ-2", "PRJ-5"]
+    # A partir de 10/03: o dia inteiro (2, 3 e 4) e nada de 11/03
+    assert sorted((r["day"], r["count"]) for r in from_10) == [("2026-03-10", 3)]
+
+
+def test_rollups_match_issue_scan_after_incremental_syncs(mirror):
+    rng = random.Random(3)
+    base = datetime(2026, 1, 1, tzinfo=_BRT)
+    types, statuses = ["Bug", "Sub-Bug", "bug"], ["Open", "Done", "Cancelado", "Closed", "In Progress"]
+    issues = []
+    for n in range(2000):
+        created = base + timedelta(minutes=rng.randint(0, 60 * 24 * 200))
+        if n % 40 == 0:
+            created = created.replace(hour=0, minute=0, second=0, microsecond=0)
+        issues.append(_issue(n, created, rng.choice(types), rng.choice(statuses)))
+    jira = FakeJira(issues)
+    ranges = [("2026-01-01", "2026-07-20"), ("2026-03-05", "2026-03-05"), ("2026-02-10", "2026-05-20")]
+
+    async def compare(scope):
+        for start, end in ranges:
+            days = list_days(date.fromisoformat(start), date.fromisoformat(end))
+            rollups = await mirror.query_defect_rollups(scope, start, end)
+            defects = await mirror.query_defects(scope, start, end)
+            assert _aggregate(days, rows=rollups) == _aggregate(days, issues=defects)
+
+    async def scenario():
+        scope = await _synced(mirror, jira)
+        await compare(scope)
+        for _ in range(3):
+            jira.changed = set(rng.sample(sorted(jira.issues), 150))
+            for issue_id in jira.changed:
+                jira.issues[issue_id]["status"] = rng.choice(statuses)
+                jira.issues[issue_id]["issuetype"] = rng.choice(types)
+            assert await mirror.ensure_fresh(jira, "PRJ", "2026-01-01") is not None
+            await compare(scope)
+
+    asyncio.run(scenario())
+
+
+def test_ensure_fresh_outside_horizon(tmp_path):
+    mirror = IssueMirror(str(tmp_path / "mirror.sqlite3"), max_age=300, horizon_days=30, full_sync_interval=10**9)
+    jira = FakeJira([])
+
+    async def scenario():
+        assert await mirror.ensure_fresh(jira, "PRJ", "2000-01-01") is None
+        for task, _ in list(mirror._syncing.values()):
+            await task
+        recent = (datetime.now(_BRT).date() - timedelta(days=10)).isoformat()
+        return await mirror.ensure_fresh(jira, "PRJ", "2000-01-01"), await mirror.ensure_fresh(jira, "PRJ", recent)
+
+    try:
+        old, recent = asyncio.run(scenario())
+    finally:
+        mirror.close()
+    assert old is None
+    assert recent is not None and set(recent) == {"scope", "syncedAt"}
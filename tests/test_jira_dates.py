@@ -0,0 +1,164 @@
+# tests/test_jira_dates.py
+
+import random
+from datetime import datetime, timedelta, timezone
+
+import numpy as np
+import pytest
+from dateutil.parser import parse as dateutil_parse
+
+from backend.utils.date_range_utils import TIMEZONE
+from backend.utils.jira_dates import (
+    DayBucketer,
+    get_day_bucketer,
+    jira_day_br,
+    jira_epoch_ms_array,
+    jira_to_epoch_ms,
+    parse_jira_datetime,
+)
+
+# Quantidade de datas aleatórias comparadas com o dateutil (implementação anterior)
+EQUIVALENCE_SAMPLES = 200_000
+
+
+def _utc_ms(*args) -> int:
+    return int(datetime(*args, tzinfo=timezone.utc).timestamp() * 1000)
+
+
+def _reference_day(value: str) -> str:
+    dt = dateutil_parse(value.strip())
+    dt = dt.replace(tzinfo=TIMEZONE) if dt.tzinfo is None else dt.astimezone(TIMEZONE)
+    return dt.date().isoformat()
+
+
+def _jira_format(dt: datetime, offset_minutes: int) -> str:
+    local = dt.astimezone(timezone(timedelta(minutes=offset_minutes)))
+    sign = "+" if offset_minutes >= 0 else "-"
+    return local.strftime("%Y-%m-%dT%H:%M:%S.%f")[:-3] + sign + "%02d%02d" % divmod(abs(offset_minutes), 60)
+
+
+@pytest.mark.parametrize(
+    "value, expected",
+    [
+        ("2026-09-01T10:20:30.456-0300", datetime(2026, 9, 1, 13, 20, 30, 456000, tzinfo=timezone.utc)),
+        ("2026-09-01T10:20:30.456+0530", datetime(2026, 9, 1, 4, 50, 30, 456000, tzinfo=timezone.utc)),
+        ("2026-09-01T10:20:30Z", datetime(2026, 9, 1, 10, 20, 30, tzinfo=timezone.utc)),
+        ("  2026-09-01T10:20:30.000+0000  ", datetime(2026, 9, 1, 10, 20, 30, tzinfo=timezone.utc)),
+    ],
+)
+def test_parse_jira_datetime(value, expected):
+    parsed = parse_jira_datetime(value)
+
+    assert parsed == expected
+    assert parsed.utcoffset() == dateutil_parse(value.strip()).utcoffset()
+    assert jira_to_epoch_ms(value) == int(expected.timestamp() * 1000)
+
+
+@pytest.mark.parametrize("value", [None, "", "   ", "garbage", "2026-02-30T10:00:00.000-0300"])
+def test_parse_jira_datetime_invalid(value):
+    assert parse_jira_datetime(value) is None
+    assert jira_to_epoch_ms(value) is None
+    assert jira_day_br(value) is None
+
+
+def test_jira_day_br_naive_dates_are_local():
+    assert jira_day_br("2026-09-01") == "2026-09-01"
+    assert jira_day_br("2026-09-01T23:30:00") == "2026-09-01"
+    assert jira_day_br("2026-09-01T23:30:00.000+0000") == "2026-09-01"
+    assert jira_day_br("2026-09-02T02:30:00.000+0000") == "2026-09-01"
+    assert jira_day_br("2026-09-02T03:00:00.000+0000") == "2026-09-02"
+
+
+@pytest.mark.parametrize(
+    "utc_ms, expected_day",
+    [
+        # Início do horário de verão 2018 (-0300 -> -0200 à 00:00 local de 04/11)
+        (_utc_ms(2018, 11, 4, 2, 59, 59), "2018-11-03"),
+        (_utc_ms(2018, 11, 4, 3, 0, 0), "2018-11-04"),
+        # Fim do horário de verão 2019 (-0200 -> -0300 à 00:00 local de 17/02): 23h repetida
+        (_utc_ms(2019, 2, 17, 1, 59, 59), "2019-02-16"),
+        (_utc_ms(2019, 2, 17, 2, 0, 0), "2019-02-16"),
+        (_utc_ms(2019, 2, 17, 2, 59, 59), "2019-02-16"),
+        (_utc_ms(2019, 2, 17, 3, 0, 0), "2019-02-17"),
+        # Sem horário de verão desde 2019: sempre -0300
+        (_utc_ms(2026, 1, 1, 2, 59, 59), "2025-12-31"),
+        (_utc_ms(2026, 1, 1, 3, 0, 0), "2026-01-01"),
+        # Antes da época
+        (_utc_ms(1969, 12, 31, 12, 0, 0), "1969-12-31"),
+    ],
+)
+def test_day_bucketer_sao_paulo_offsets(utc_ms, expected_day):
+    bucketer = DayBucketer()
+
+    assert bucketer.day_string(bucketer.day_number(utc_ms)) == expected_day
+    vector = bucketer.day_numbers(np.asarray([utc_ms], dtype=np.int64))
+    assert bucketer.day_string(int(vector[0])) == expected_day
+
+
+def test_day_bucketer_grows_range_on_demand():
+    bucketer = DayBucketer()
+    recent = _utc_ms(2026, 6, 1, 12, 0, 0)
+    old = _utc_ms(2005, 10, 16, 2, 30, 0)
+
+    assert bucketer.day_string(bucketer.day_number(recent)) == "2026-06-01"
+    # Faixa ampliada para trás: fronteiras antigas (horário de verão de 2005) continuam corretas
+    assert bucketer.day_string(bucketer.day_number(old)) == datetime.fromtimestamp(old / 1000, TIMEZONE).date().isoformat()
+    assert bucketer.day_string(bucketer.day_number(recent)) == "2026-06-01"
+
+
+def test_day_bucketer_matches_zoneinfo_hourly():
+    bucketer = DayBucketer()
+    hours = np.arange(_utc_ms(2016, 1, 1), _utc_ms(2020, 1, 1), 3_600_000, dtype=np.int64) + 1_800_000
+
+    days = bucketer.day_numbers(hours)
+    expected = [datetime.fromtimestamp(ms / 1000, TIMEZONE).date().isoformat() for ms in hours.tolist()]
+    assert [bucketer.day_string(int(d)) for d in days] == expected
+
+
+def test_jira_epoch_ms_array_truncates_to_minute():
+    epoch_ms, valid = jira_epoch_ms_array(["2026-09-01T10:20:30.456-0300", "2026-09-01T23:59:59.999+0000"])
+
+    assert valid.tolist() == [True, True]
+    assert epoch_ms.tolist() == [_utc_ms(2026, 9, 1, 13, 20, 0), _utc_ms(2026, 9, 1, 23, 59, 0)]
+
+
+def test_jira_epoch_ms_array_marks_other_formats_invalid():
+    values = ["2026-09-01T10:20:30.456-0300", "2026-09-01T10:20:30Z", "", "2026-02-30T10:00:00.000-0300"]
+
+    epoch_ms, valid = jira_epoch_ms_array(values)
+
+    assert valid.tolist() == [True, False, False, False]
+    assert get_day_bucketer().day_string(get_day_bucketer().day_number(int(epoch_ms[0]))) == "2026-09-01"
+
+
+def test_random_timestamps_match_dateutil():
+    """
+    Equivalência com o dateutil em EQUIVALENCE_SAMPLES datas aleatórias (2008-2027, offsets
+    variados, incluindo os anos com horário de verão em America/Sao_Paulo).
+    """
+    rng = random.Random(5)
+    base = datetime(2008, 1, 1, tzinfo=timezone.utc)
+    span_ms = 19 * 365 * 86_400_000
+    offsets = [-180, -120, 0, 330, -600, 60]
+    values = [
+        _jira_format(base + timedelta(milliseconds=rng.randrange(span_ms)), rng.choice(offsets))
+        for _ in range(EQUIVALENCE_SAMPLES)
+    ]
+
+    mismatches = []
+    for value in values:
+        reference = dateutil_parse(value)
+        reference_day = reference.astimezone(TIMEZONE).date().isoformat()
+        if (
+            parse_jira_datetime(value) != reference
+            or jira_to_epoch_ms(value) != int(reference.timestamp() * 1000)
+            or jira_day_br(value) != reference_day
+        ):
+            mismatches.append(value)
+    assert mismatches == []
+
+    epoch_ms, valid = jira_epoch_ms_array(values)
+    assert valid.all()
+    bucketer = get_day_bucketer()
+    days = [bucketer.day_string(int(d)) for d in bucketer.day_numbers(epoch_ms)]
+    assert days == [jira_day_br(v) for v in values]
@@ -0,0 +1,104 @@
+# tests/test_quantile_sketch.py
+
+import numpy as np
+import pytest
+
+from backend.utils.quantile_sketch import SKETCH_K_DEFAULT, QuantileSketch
+
+# Erro de rank tolerado com k = SKETCH_K_DEFAULT (o KLL garante O(1/k))
+RANK_ERROR_MAX = 2 / SKETCH_K_DEFAULT
+QS = np.linspace(0.01, 0.99, 99)
+
+
+def _rank_error(data: np.ndarray, qs, values) -> float:
+    """Maior distância entre q e o intervalo de ranks (normalizado) do valor devolvido."""
+    ordered = np.sort(data)
+    worst = 0.0
+    for q, value in zip(qs, values):
+        low = np.searchsorted(ordered, value, side="left") / len(ordered)
+        high = np.searchsorted(ordered, value, side="right") / len(ordered)
+        worst = max(worst, 0.0 if low <= q <= high else min(abs(q - low), abs(q - high)))
+    return worst
+
+
+def _data(kind: str, n: int, seed: int) -> np.ndarray:
+    rng = np.random.default_rng(seed)
+    if kind == "uniform":
+        return rng.uniform(0, 1e6, n)
+    if kind == "lognormal":
+        return rng.lognormal(10, 2, n)
+    if kind == "sorted":
+        return np.arange(n, dtype=np.float64)
+    return rng.integers(0, 50, n).astype(np.float64)
+
+
+@pytest.mark.parametrize("kind", ["uniform", "lognormal", "sorted", "duplicates"])
+@pytest.mark.parametrize("seed", [1, 2, 3])
+def test_rank_error_is_bounded(kind, seed):
+    data = _data(kind, 100_000, seed)
+    sketch = QuantileSketch()
+    for chunk in np.array_split(data, 37):
+        sketch.update_many(chunk)
+
+    assert _rank_error(data, QS, sketch.quantiles(QS)) <= RANK_ERROR_MAX
+    # Memória sublinear: itens guardados bem abaixo da quantidade de valores
+    assert sketch._size < 10 * SKETCH_K_DEFAULT
+
+
+def test_merged_sketches_keep_error_bound():
+    parts = [_data("lognormal", n, seed) for seed, n in enumerate([50_000, 3, 20_000, 150, 30_000])]
+    merged = QuantileSketch()
+    for part in parts:
+        sketch = QuantileSketch()
+        sketch.update_many(part)
+        merged.merge(sketch)
+
+    data = np.concatenate(parts)
+    assert merged.count == len(data)
+    assert _rank_error(data, QS, merged.quantiles(QS)) <= RANK_ERROR_MAX
+
+
+def test_exact_below_k():
+    data = np.random.default_rng(4).uniform(0, 100, SKETCH_K_DEFAULT - 1)
+    sketch = QuantileSketch()
+    sketch.update_many(data)
+
+    ordered = np.sort(data)
+    for q in (0.0, 0.1, 0.5, 0.9, 1.0):
+        rank = max(1, int(np.ceil(q * len(data))))
+        assert sketch.quantile(q) == ordered[rank - 1]
+
+
+def test_exact_aggregates_and_histogram():
+    data = np.random.default_rng(5).uniform(0, 10, 50_000)
+    sketch = QuantileSketch(edges=[1, 2, 5])
+    for value in data[:100]:
+        sketch.update(value)
+    sketch.update_many(data[100:])
+
+    assert sketch.count == len(sketch) == len(data)
+    assert sketch.sum == pytest.approx(data.sum())
+    assert (sketch.min, sketch.max) == (data.min(), data.max())
+    assert data.min() <= sketch.quantile(0) <= sketch.quantile(1) <= data.max()
+    expected = np.bincount(np.searchsorted([1, 2, 5], data, side="right"), minlength=4).tolist()
+    assert [bucket["count"] for bucket in sketch.histogram()] == expected
+    assert [(bucket["from"], bucket["to"]) for bucket in sketch.histogram()] == [
+        (0.0, 1.0), (1.0, 2.0), (2.0, 5.0), (5.0, None),
+    ]
+
+
+def test_empty_sketch():
+    sketch = QuantileSketch()
+
+    assert sketch.quantiles([0.5, 0.9]) == [None, None]
+    assert sketch.quantile(0.5) is None
+    assert sketch.merge(QuantileSketch()).count == 0
+
+
+def test_merge_requires_same_k_and_edges():
+    with pytest.raises(ValueError):
+        QuantileSketch(k=64).merge(QuantileSketch(k=128))
+    with pytest.raises(ValueError):
+        QuantileSketch(edges=[1]).merge(QuantileSketch(edges=[2]))
+    with pytest.raises(ValueError):
+        QuantileSketch(k=4)
@@ -0,0 +1,156 @@
+# tests/test_status_time_engine.py
+
+import random
+from datetime import datetime, timedelta, timezone
+
+import numpy as np
+
+from backend.services.status_time_engine import NO_TIME, StatusTimeline
+
+_BRT = timezone(timedelta(hours=-3))
+_CREATED = datetime(2026, 7, 1, 9, 0, tzinfo=_BRT)
+_NOW_MS = int((_CREATED + timedelta(days=10)).timestamp() * 1000)
+_HOUR_MS = 3_600_000
+
+
+def _jira(dt: datetime) -> str:
+    return dt.strftime("%Y-%m-%dT%H:%M:%S.000-0300")
+
+
+def _changelog(*transitions):
+    """Changelog com uma transição de status por history: (horas após created, de, para)."""
+    return [
+        {"created": _jira(_CREATED + timedelta(hours=hours)), "items": [{"field": "status", "from": src, "to": dst}]}
+        for hours, src, dst in transitions
+    ]
+
+
+def _reference_durations(created_ms, changelog, statuses, now_ms):
+    """Cálculo original do Status Time (_calc_time_in_statuses), para qualquer conjunto de status."""
+    totals = {s: 0 for s in statuses}
+    changes = []
+    for history in changelog:
+        at_ms = int(datetime.fromisoformat(history["created"].replace("-0300", "-03:00")).timestamp() * 1000)
+        for item in history["items"]:
+            if item["field"].strip().lower() == "status":
+                changes.append((at_ms, item["from"].strip(), item["to"].strip()))
+    changes.sort(key=lambda change: change[0])
+    if not changes:
+        return totals
+    current, start = changes[0][1], created_ms
+    for at_ms, _, to_status in changes:
+        if current in totals:
+            totals[current] += at_ms - start
+        current, start = to_status, at_ms
+    if current in totals:
+        totals[current] += now_ms - start
+    return totals
+
+
+def test_durations_per_status():
+    timeline = StatusTimeline(now_ms=_NOW_MS)
+    timeline.add_issue("PRJ-1", _jira(_CREATED), _changelog(
+        (2, "To Do", "Ready to test"),
+        (5, "Ready to test", "In Test"),
+        (6, "In Test", "Ready to test"),
+        (10, "Ready to test", "In Test"),
+        (12, "In Test", "Done"),
+    ))
+
+    done_since = int((_CREATED + timedelta(hours=12)).timestamp() * 1000)
+    durations = timeline.durations_ms(["To Do", "Ready to test", "In Test", "Done"])
+    assert durations.tolist() == [[2 * _HOUR_MS, 7 * _HOUR_MS, 3 * _HOUR_MS, _NOW_MS - done_since]]
+    # Retrabalho: entradas por status
+    assert timeline.entries(["Ready to test", "In Test", "Done"]).tolist() == [[2, 2, 1]]
+
+
+def test_open_interval_runs_until_now():
+    timeline = StatusTimeline(now_ms=_NOW_MS)
+    timeline.add_issue("PRJ-1", int(_CREATED.timestamp() * 1000), _changelog((1, "To Do", "In Test")))
+
+    in_test = timeline.durations_ms(["In Test"])[0, 0]
+    assert in_test == _NOW_MS - int(_CREATED.timestamp() * 1000) - _HOUR_MS
+
+
+def test_issue_without_transitions_or_created():
+    timeline = StatusTimeline(now_ms=_NOW_MS)
+    timeline.add_issue("PRJ-1", _jira(_CREATED), [])
+    timeline.add_issue("PRJ-2", None, _changelog((1, "To Do", "In Test")))
+    timeline.add_issue("PRJ-3", _jira(_CREATED), [
+        {"created": _jira(_CREATED + timedelta(hours=1)), "items": [{"field": "assignee", "from": "a", "to": "b"}]},
+    ])
+
+    assert timeline.keys == ["PRJ-1", "PRJ-2", "PRJ-3"]
+    assert timeline.durations_ms(["To Do", "In Test"]).tolist() == [[0, 0], [0, 0], [0, 0]]
+    assert timeline.entries(["In Test"]).tolist() == [[0], [0], [0]]
+
+
+def test_unknown_status_column_is_zero():
+    timeline = StatusTimeline(now_ms=_NOW_MS)
+    timeline.add_issue("PRJ-1", _jira(_CREATED), _changelog((1, "To Do", "Done")))
+
+    assert timeline.durations_ms(["Nope", "To Do"]).tolist() == [[0, _HOUR_MS]]
+    assert timeline.durations_ms().shape == (1, 2)
+
+
+def test_unordered_histories_are_sorted():
+    timeline = StatusTimeline(now_ms=_NOW_MS)
+    changelog = _changelog((3, "Ready to test", "Done"), (1, "To Do", "Ready to test"))
+    timeline.add_issue("PRJ-1", _jira(_CREATED), changelog)
+
+    assert timeline.durations_ms(["To Do", "Ready to test"]).tolist() == [[_HOUR_MS, 2 * _HOUR_MS]]
+
+
+def test_durations_match_original_calculation():
+    rng = random.Random(17)
+    statuses = ["To Do", "Ready to test", "In Test", "Done", "Reopened"]
+    timeline = StatusTimeline(now_ms=_NOW_MS)
+    expected = []
+    for n in range(300):
+        hours, current, transitions = 0, "To Do", []
+        for _ in range(rng.randint(0, 8)):
+            hours += rng.randint(0, 30)
+            target = rng.choice(statuses)
+            transitions.append((hours, current, target))
+            current = target
+        changelog = _changelog(*transitions)
+        rng.shuffle(changelog)
+        timeline.add_issue(f"PRJ-{n}", _jira(_CREATED), changelog)
+        reference = _reference_durations(int(_CREATED.timestamp() * 1000), changelog, statuses, _NOW_MS)
+        expected.append([reference[s] for s in statuses])
+
+    assert timeline.durations_ms(statuses).tolist() == expected
+
+
+def test_cycle_time():
+    timeline = StatusTimeline(now_ms=_NOW_MS)
+    timeline.add_issue("PRJ-1", _jira(_CREATED), _changelog(
+        (2, "To Do", "Ready to test"),
+        (4, "Ready to test", "Done"),
+        (5, "Done", "Ready to test"),
+        (9, "Ready to test", "Done"),
+    ))
+    timeline.add_issue("PRJ-2", _jira(_CREATED), _changelog((2, "To Do", "Ready to test")))
+    timeline.add_issue("PRJ-3", _jira(_CREATED), _changelog((2, "To Do", "Done")))
+
+    cycle = timeline.cycle_time_ms(["Ready to test"], ["Done", "Closed"])
+
+    # Primeira entrada em Ready to test (2h) até a última entrada em Done (9h)
+    assert cycle.tolist() == [7 * _HOUR_MS, NO_TIME, NO_TIME]
+    assert timeline.first_entry_ms(["Ready to test"])[1] == int((_CREATED + timedelta(hours=2)).timestamp() * 1000)
+    assert timeline.last_entry_ms(["Ready to test"])[2] == NO_TIME
+
+
+def test_extend_remaps_status_codes():
+    first = StatusTimeline(now_ms=_NOW_MS)
+    first.add_issue("PRJ-1", _jira(_CREATED), _changelog((1, "To Do", "In Test")))
+    second = StatusTimeline(now_ms=0)
+    second.add_issue("PRJ-2", _jira(_CREATED), _changelog((2, "In Test", "Ready to test"), (3, "Ready to test", "Done")))
+
+    first.extend(second)
+
+    assert first.keys == ["PRJ-1", "PRJ-2"]
+    durations = first.durations_ms(["In Test", "Ready to test", "Done"])
+    done_since = int((_CREATED + timedelta(hours=3)).timestamp() * 1000)
+    assert durations[1].tolist() == [2 * _HOUR_MS, _HOUR_MS, _NOW_MS - done_since]
+    assert np.array_equal(first.entries(["Done"]), np.array([[0], [1]]))
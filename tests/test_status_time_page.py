@@ -0,0 +1,183 @@
+# tests/test_status_time_page.py
+
+import asyncio
+import base64
+import json
+import random
+from datetime import datetime, timedelta, timezone
+
+import pytest
+
+from backend.services import dashboard_service as ds
+from backend.services.dashboard_service import (
+    STATUS_TIME_SORT_KEYS,
+    STATUS_TIME_TARGET,
+    DashboardService,
+    StatusTimeIndex,
+    _add_status_time_issues,
+    _decode_status_time_cursor,
+    _encode_status_time_cursor,
+    _status_time_index_meta,
+    _status_time_sketches,
+    _status_time_sort_value,
+)
+from backend.services.status_time_engine import StatusTimeline
+
+_BRT = timezone(timedelta(hours=-3))
+_BASE = datetime(2026, 7, 1, 9, 0, tzinfo=_BRT)
+_HOUR = timedelta(hours=1)
+
+
+def _jira(dt: datetime) -> str:
+    return dt.strftime("%Y-%m-%dT%H:%M:%S.000-0300")
+
+
+def _build_index(count: int, seed: int = 1, keys=None) -> StatusTimeIndex:
+    """Índice com issues sintéticas; created e horas com empates para exercitar o desempate por key."""
+    rng = random.Random(seed)
+    issues, changelogs = [], {}
+    for i, key in enumerate(keys or [f"PRJ-{n}" for n in range(1, count + 1)]):
+        created = _BASE + rng.randint(0, 5) * timedelta(days=1)
+        ready_at = created + rng.randint(1, 3) * _HOUR
+        in_test_at = ready_at + rng.choice([0, 1, 2, 2, 5]) * _HOUR
+        done_at = in_test_at + rng.choice([1, 1, 3]) * _HOUR
+        issues.append({"key": key, "summary": f"Issue {key}", "status": "Done", "issuetype": "Bug", "created": _jira(created)})
+        changelogs[key] = [
+            {"created": _jira(ready_at), "items": [{"field": "status", "from": "To Do", "to": "Ready to test"}]},
+            {"created": _jira(in_test_at), "items": [{"field": "status", "from": "Ready to test", "to": "In Test"}]},
+            {"created": _jira(done_at), "items": [{"field": "status", "from": "In Test", "to": "Done"}]},
+        ]
+    timeline = StatusTimeline(now_ms=int((_BASE + timedelta(days=30)).timestamp() * 1000))
+    entries = _add_status_time_issues(timeline, issues, changelogs)
+    return StatusTimeIndex(entries, timeline, _status_time_sketches(timeline), _status_time_index_meta())
+
+
+def _expected_keys(index: StatusTimeIndex, sort_by: str, sort_dir: str) -> list:
+    durations = index.timeline.durations_ms(STATUS_TIME_TARGET).tolist()
+    items = [dict(entry, readyMs=d[0], inTestMs=d[1]) for entry, d in zip(index.issues, durations)]
+    items.sort(key=lambda item: _status_time_sort_value(item, sort_by), reverse=sort_dir == "desc")
+    return [item["key"] for item in items]
+
+
+def _page(service: DashboardService, **kwargs) -> dict:
+    return asyncio.run(service._status_time_page(
+        None, "PRJ", "custom", "2026-07-01", "2026-07-31", {}, project_info={"key": "PRJ"}, **kwargs
+    ))
+
+
+@pytest.fixture
+def service(monkeypatch):
+    """DashboardService cujo índice do Status Time vem de service.index (sem Jira)."""
+    svc = DashboardService()
+    svc.index = _build_index(53)
+
+    async def fake_index(*args, **kwargs):
+        return svc.index, svc.index.meta
+
+    monkeypatch.setattr(svc, "_status_time_index", fake_index)
+    return svc
+
+
+@pytest.mark.parametrize("sort_by", STATUS_TIME_SORT_KEYS)
+@pytest.mark.parametrize("sort_dir", ["asc", "desc"])
+@pytest.mark.parametrize("page_size", [1, 7, 53, 500])
+def test_pages_cover_every_issue_once_in_order(service, sort_by, sort_dir, page_size):
+    keys, cursor, pages = [], None, 0
+    while True:
+        if cursor:
+            page = _page(service, page_size=page_size, cursor=cursor)
+        else:
+            page = _page(service, page_size=page_size, sort_by=sort_by, sort_dir=sort_dir)
+        keys += [row["key"] for row in page["issues"]]
+        pages += 1
+        assert page["page"]["total"] == 53
+        assert page["summary"]["count"] == 53
+        cursor = page["page"]["nextCursor"]
+        if cursor is None:
+            break
+
+    assert keys == _expected_keys(service.index, sort_by, sort_dir)
+    assert pages == -(-53 // page_size)
+
+
+def test_key_order_is_natural(service):
+    service.index = _build_index(0, keys=["PRJ-10", "PRJ-9", "ABC-100", "PRJ-1"])
+
+    page = _page(service, sort_by="key", sort_dir="asc")
+
+    assert [row["key"] for row in page["issues"]] == ["ABC-100", "PRJ-1", "PRJ-9", "PRJ-10"]
+    assert page["page"]["nextCursor"] is None
+
+
+def test_cursor_survives_index_recalculation(service):
+    first = _page(service, page_size=10, sort_by="created", sort_dir="asc")
+    seen = {row["key"] for row in first["issues"]}
+    # Índice recalculado entre as páginas (cache expirado): nova instância, com uma issue a mais
+    service.index = _build_index(0, keys=[f"PRJ-{n}" for n in range(1, 55)])
+
+    second = _page(service, page_size=10, cursor=first["page"]["nextCursor"])
+
+    expected = _expected_keys(service.index, "created", "asc")
+    after = expected.index(first["issues"][-1]["key"])
+    assert not seen & {row["key"] for row in second["issues"]}
+    assert [row["key"] for row in second["issues"]] == expected[after + 1:after + 11]
+
+
+def test_cursor_rejects_different_sort(service):
+    first = _page(service, page_size=10, sort_by="created", sort_dir="asc")
+
+    with pytest.raises(ValueError, match="sortBy/sortDir"):
+        _page(service, sort_by="key", cursor=first["page"]["nextCursor"])
+    with pytest.raises(ValueError, match="sortBy/sortDir"):
+        _page(service, sort_dir="desc", cursor=first["page"]["nextCursor"])
+
+
+@pytest.mark.parametrize(
+    "sort_by, after",
+    [
+        ("created", [1782907200000, "PRJ", 12]),
+        ("totalHours", [3600000.5, "PRJ", 1]),
+        ("key", ["PRJ", 10]),
+        ("key", ["PRJ-x", -1]),
+    ],
+)
+def test_cursor_round_trip(sort_by, after):
+    cursor = _encode_status_time_cursor(sort_by, "desc", after)
+
+    assert "=" not in cursor
+    assert _decode_status_time_cursor(cursor) == (sort_by, "desc", after)
+
+
+def _raw_cursor(data) -> str:
+    return base64.urlsafe_b64encode(json.dumps(data).encode()).decode().rstrip("=")
+
+
+@pytest.mark.parametrize(
+    "cursor",
+    [
+        "xx",
+        "!!!",
+        _raw_cursor([1, 2]),
+        _raw_cursor({"s": "created", "d": "asc"}),
+        _raw_cursor({"s": "nope", "d": "asc", "a": [1, "PRJ", 1]}),
+        _raw_cursor({"s": "created", "d": "up", "a": [1, "PRJ", 1]}),
+        _raw_cursor({"s": "created", "d": "asc", "a": "PRJ-1"}),
+        _raw_cursor({"s": "created", "d": "asc", "a": [True, "PRJ", 1]}),
+        _raw_cursor({"s": "created", "d": "asc", "a": [1, "PRJ"]}),
+        _raw_cursor({"s": "key", "d": "asc", "a": [1, "PRJ", 2]}),
+        _raw_cursor({"s": "key", "d": "asc", "a": ["PRJ", "2"]}),
+    ],
+)
+def test_invalid_cursor(cursor):
+    with pytest.raises(ValueError, match="cursor inválido"):
+        _decode_status_time_cursor(cursor)
+
+
+def test_invalid_sort_and_page_size(service):
+    with pytest.raises(ValueError, match="sortBy"):
+        _page(service, sort_by="summary")
+    with pytest.raises(ValueError, match="sortDir"):
+        _page(service, sort_dir="up")
+
+    assert _page(service, page_size=10_000)["page"]["pageSize"] == ds.STATUS_TIME_PAGE_SIZE_MAX
+    assert _page(service, page_size=0)["page"]["pageSize"] == ds.STATUS_TIME_PAGE_SIZE_DEFAULT